@@ -0,0 +1,154 @@
+"""
+체크포인터 백엔드별 동시 세션 쓰기/읽기 지연 비교.
+
+    python -m benchmarks.checkpointer_bench --backend sqlite postgres redis \
+        --dsn postgresql+asyncpg://user:pw@localhost/realty --redis-url redis://localhost:6379
+
+세션마다 superstep 수만큼 aput(쓰기) 후 aget_tuple(최신 상태 읽기)을 반복한다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from engine.graph.serde import CompressedSerializer
+from server.storage.checkpointer import open_checkpointer
+
+
+def _state(step: int) -> dict:
+    messages = []
+    for i in range(step + 1):
+        messages.append(HumanMessage(content=f"전세 보증금 반환 질문 {i} " * 20))
+        messages.append(AIMessage(content=f"답변 {i} " * 80))
+    return {
+        "messages": messages,
+        "retrieved_docs": {"legal_retriever": {"Expc": [{"안건명": "전세"}] * 20}},
+        "answer": "답변 " * 100,
+    }
+
+
+async def _session(
+    saver: BaseCheckpointSaver, steps: int, writes: list[float], reads: list[float]
+) -> None:
+    config = {"configurable": {"thread_id": str(uuid.uuid4()), "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+
+    for step in range(steps):
+        values = _state(step)
+        checkpoint = create_checkpoint(checkpoint, None, step)
+        checkpoint["channel_values"] = values
+        new_versions = {
+            key: saver.get_next_version(
+                checkpoint["channel_versions"].get(key), None  # type: ignore[arg-type]
+            )
+            for key in values
+        }
+        checkpoint["channel_versions"].update(new_versions)
+
+        started = time.perf_counter()
+        config = await saver.aput(
+            config, checkpoint, {"source": "loop", "step": step}, new_versions
+        )
+        writes.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await saver.aget_tuple(
+            {"configurable": {**config["configurable"], "checkpoint_id": None}}
+        )
+        reads.append(time.perf_counter() - started)
+
+
+def _summary(name: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    return (
+        f"{name:<6} p50={statistics.median(ordered) * 1000:7.2f}ms "
+        f"p95={p95 * 1000:7.2f}ms p99={p99 * 1000:7.2f}ms"
+    )
+
+
+async def bench(
+    backend: str,
+    sessions: int,
+    steps: int,
+    dsn: Optional[str],
+    redis_url: Optional[str],
+    sqlite_path: str,
+    compress: bool,
+) -> None:
+    engine = create_async_engine(dsn, pool_size=sessions) if dsn else None
+    serde = CompressedSerializer() if compress else None
+    writes: list[float] = []
+    reads: list[float] = []
+
+    try:
+        async with open_checkpointer(
+            backend,  # type: ignore[arg-type]
+            sqlite_path=sqlite_path,
+            postgresql_engine=engine,
+            redis_url=redis_url,
+            serde=serde,
+        ) as saver:
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(_session(saver, steps, writes, reads) for _ in range(sessions))
+            )
+            elapsed = time.perf_counter() - started
+    finally:
+        if engine is not None:
+            await engine.dispose()
+
+    print(f"[{backend}] sessions={sessions} steps={steps} total={elapsed:.2f}s")
+    print("  " + _summary("write", writes))
+    print("  " + _summary("read", reads))
+    print(f"  throughput={len(writes) / elapsed:.1f} checkpoints/s")
+    if serde is not None:
+        print(f"  serde={serde.stats.as_dict()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backend",
+        nargs="+",
+        default=["sqlite"],
+        choices=["sqlite", "postgres", "redis"],
+    )
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=12)
+    parser.add_argument("--dsn", default=None)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--compress", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backend:
+            asyncio.run(
+                bench(
+                    backend=backend,
+                    sessions=args.sessions,
+                    steps=args.steps,
+                    dsn=args.dsn,
+                    redis_url=args.redis_url,
+                    sqlite_path=str(Path(tmp) / f"{backend}.db"),
+                    compress=args.compress,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+문서 검색 경로(쿼리 임베딩 + 벡터 검색)의 지연 측정.
+
+    python -m benchmarks.doc_retrieval_bench --model-dir models/multilingual-e5-small-onnx \
+        --docs 2000 --queries 200 [--url http://localhost:6333]
+
+model-dir에는 model.onnx와 tokenizer.json이 있어야 한다. --url이 없으면 qdrant-client의 인메모리 모드를 대역으로 쓴다.
+같은 쿼리 집합을 두 번 실행해 임베딩 캐시 미스(cold)와 히트(warm)를 구분해 보고한다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from engine.retrieval.embedding import CachedEmbeddings, OnnxEmbedder
+
+COLLECTION: str = "doc_retrieval_bench"
+
+REGIONS: list[str] = [
+    "서대문구",
+    "마포구",
+    "강남구",
+    "송파구",
+    "성동구",
+    "노원구",
+    "용산구",
+]
+KINDS: list[str] = ["아파트", "오피스텔", "빌라", "원룸", "투룸"]
+DEALS: list[str] = ["매매", "전세", "월세"]
+
+
+def _documents(count: int) -> list[str]:
+    return [
+        f"{REGIONS[i % len(REGIONS)]} {KINDS[i % len(KINDS)]} {DEALS[i % len(DEALS)]} "
+        f"{20 + i % 30}평 {1 + i % 15}억 실거래가 및 등기부등본 요약 {i}"
+        for i in range(count)
+    ]
+
+
+def _queries(count: int) -> list[str]:
+    return [
+        f"{REGIONS[i % len(REGIONS)]} {KINDS[(i * 3) % len(KINDS)]} "
+        f"{DEALS[i % len(DEALS)]} {1 + i % 15}억 이하"
+        for i in range(count)
+    ]
+
+
+def _summary(name: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[max(int(len(ordered) * 0.99) - 1, 0)]
+    return (
+        f"{name:<7} p50={statistics.median(ordered) * 1000:7.2f}ms "
+        f"p99={p99 * 1000:7.2f}ms"
+    )
+
+
+async def bench(
+    model_dir: str,
+    query_prefix: str,
+    passage_prefix: str,
+    docs: int,
+    queries: int,
+    limit: int,
+    threads: Optional[int],
+    url: Optional[str],
+) -> None:
+    encoder = OnnxEmbedder(
+        model_dir=model_dir,
+        query_prefix=query_prefix,
+        passage_prefix=passage_prefix,
+        intra_op_threads=threads,
+    )
+    embeddings = CachedEmbeddings(encoder)
+    client = AsyncQdrantClient(url=url) if url else AsyncQdrantClient(":memory:")
+
+    try:
+        texts = _documents(docs)
+        vectors = await encoder.aembed_documents(texts)
+        if await client.collection_exists(COLLECTION):
+            await client.delete_collection(COLLECTION)
+        await client.create_collection(
+            COLLECTION,
+            vectors_config=VectorParams(size=len(vectors[0]), distance=Distance.COSINE),
+        )
+        await client.upsert(
+            COLLECTION,
+            points=[
+                PointStruct(id=i, vector=vector, payload={"content": text})
+                for i, (vector, text) in enumerate(zip(vectors, texts))
+            ],
+        )
+
+        for label in ("cold", "warm"):
+            embeds: list[float] = []
+            searches: list[float] = []
+            totals: list[float] = []
+            for query in _queries(queries):
+                started = time.perf_counter()
+                vector = await embeddings.aembed_query(query)
+                embedded = time.perf_counter()
+                await client.query_points(
+                    COLLECTION, query=vector, limit=limit, with_payload=True
+                )
+                finished = time.perf_counter()
+
+                embeds.append(embedded - started)
+                searches.append(finished - embedded)
+                totals.append(finished - started)
+
+            print(f"[{label}] docs={docs} queries={queries}")
+            print("  " + _summary("embed", embeds))
+            print("  " + _summary("search", searches))
+            print("  " + _summary("total", totals))
+        print(f"  cache={embeddings.stats()}")
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-dir", required=True)
+    parser.add_argument("--query-prefix", default="query: ")
+    parser.add_argument("--passage-prefix", default="passage: ")
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    asyncio.run(
+        bench(
+            model_dir=args.model_dir,
+            query_prefix=args.query_prefix,
+            passage_prefix=args.passage_prefix,
+            docs=args.docs,
+            queries=args.queries,
+            limit=args.limit,
+            threads=args.threads,
+            url=args.url,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+PersonaExtractor 백엔드(torch / onnx / onnx int8)별 로드 시간, 지연, 처리량, RSS 비교.
+
+    python -m benchmarks.persona_extractor_bench --backend torch onnx onnx-int8 \
+        --texts 256 --batch-size 16 --threads 4
+
+백엔드마다 별도 프로세스에서 실행해 RSS가 서로 섞이지 않게 한다.
+ONNX 모델이 없으면 첫 실행 시 --onnx-dir에 내보내므로 로드 시간은 두 번째 실행부터 비교한다.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import time
+from typing import Optional
+
+CORPUS: list[str] = [
+    "서대문구에서 10억 정도로 조용한 아파트 알아보고 있어.",
+    "마포구 합정역 근처 원룸 월세 80만원 이하로 찾아줘.",
+    "강남구 신축 오피스텔 전세 3억 이내 매물 있을까?",
+    "초등학교 가까운 송파구 30평대 아파트 매매가 궁금해요.",
+    "성수동 주차 가능한 투룸 전세 보증금 2억 5천까지 봅니다.",
+    "분당 정자동 준공 5년 이내 아파트, 예산은 12억 정도야.",
+    "용산구 한강뷰 빌라 매매 15억 안쪽으로 알아봐 주세요.",
+    "관악구 신림역 도보 10분 거리 원룸 보증금 1000에 월세 50.",
+    "노원구 학원가 근처 25평 아파트 전세 4억 가능할까요?",
+    "판교 역세권 신축 오피스텔 매매 6억, 헬스장 있는 곳이면 좋겠어.",
+    "은평구 구축 빌라도 괜찮고 예산은 3억 정도입니다.",
+    "일산 호수공원 근처 40평 아파트 매매 8억대 찾고 있어요.",
+    "영등포구 여의도 직장인데 지하철 가까운 투룸 월세 100만원.",
+    "수원 광교 엘리베이터 있는 20년 이하 아파트 전세 3억.",
+    "부산 해운대 바다 보이는 오피스텔 단기 임대 가능한가요?",
+    "동작구 사당역 근처 반려동물 가능한 원룸 월세 60 정도.",
+]
+
+
+def _rss_mb() -> float:
+    # 리눅스에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(int(len(ordered) * q) - 1, 0)]
+
+
+def _run(
+    backend: str,
+    texts: int,
+    batch_size: int,
+    threads: int,
+    onnx_dir: Optional[str],
+    queue: multiprocessing.Queue,
+) -> None:
+    import torch
+
+    from worker.extractor import PersonaExtractor
+
+    torch.set_num_threads(threads)
+    corpus = [CORPUS[i % len(CORPUS)] for i in range(texts)]
+
+    started = time.perf_counter()
+    extractor = PersonaExtractor(
+        backend="torch" if backend == "torch" else "onnx",
+        onnx_dir=onnx_dir,
+        quantize=backend == "onnx-int8",
+        intra_op_threads=threads,
+    )
+    load = time.perf_counter() - started
+    extractor.extract_batch(corpus[:batch_size])  # warm-up
+
+    latencies: list[float] = []
+    for text in corpus[: min(texts, 64)]:
+        started = time.perf_counter()
+        extractor.extract(text)
+        latencies.append(time.perf_counter() - started)
+
+    entities = 0
+    started = time.perf_counter()
+    for i in range(0, texts, batch_size):
+        for persona in extractor.extract_batch(corpus[i : i + batch_size]):
+            entities += sum(
+                len(value) if isinstance(value, list) else 1
+                for value in persona.values()
+            )
+    elapsed = time.perf_counter() - started
+
+    queue.put(
+        f"[{backend}] load={load:.2f}s "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p95={_percentile(latencies, 0.95) * 1000:.1f}ms "
+        f"throughput={texts / elapsed:.1f} texts/s ({entities / elapsed:.1f} entities/s) "
+        f"rss={_rss_mb():.0f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backend",
+        nargs="+",
+        default=["torch", "onnx", "onnx-int8"],
+        choices=["torch", "onnx", "onnx-int8"],
+    )
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--onnx-dir", default=None)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    for backend in args.backend:
+        process = context.Process(
+            target=_run,
+            args=(
+                backend,
+                args.texts,
+                args.batch_size,
+                args.threads,
+                args.onnx_dir,
+                queue,
+            ),
+        )
+        process.start()
+        process.join()
+        if process.exitcode == 0:
+            print(queue.get())
+        else:
+            print(f"[{backend}] failed. exitcode={process.exitcode}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Qdrant 컬렉션 설정별 메모리/검색 지연/재현율 비교: 인메모리 원본 vs on-disk 원본 + scalar/binary 양자화.
+
+    python -m benchmarks.qdrant_collection_bench --points 50000 --dim 384 \
+        --queries 200 --ef 64,128,256 [--url http://localhost:6333]
+
+재현율은 같은 데이터에 대한 정확 검색(exact=True) 결과 기준 recall@limit.
+메모리는 벡터/양자화 벡터/HNSW 링크의 RAM 상주량 추정치이며, --url이 주어지면 서버 /metrics의
+memory_resident_bytes도 함께 출력한다. --url이 없으면 로컬 인메모리 모드를 쓰는데,
+로컬 모드는 HNSW/양자화를 무시하는 전수 검색이므로 설정 간 차이는 실제 서버에서 측정해야 한다.
+"""
+
+import argparse
+import asyncio
+import re
+import time
+from typing import Optional
+
+import httpx
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import CollectionStatus
+
+from server.storage.qdrant_collections import (
+    CollectionSpec,
+    ensure_collection,
+    search_params,
+)
+from server.storage.vector_ingest import upsert_points
+
+COLLECTION: str = "collection_bench"
+
+_RESIDENT = re.compile(r"^memory_resident_bytes\s+(\S+)$", re.MULTILINE)
+
+
+def _dataset(points: int, dim: int, queries: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((points + queries, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors[:points], vectors[points:]
+
+
+def _estimated_ram_mb(spec: CollectionSpec, points: int) -> float:
+    raw: float = 0 if spec.on_disk else points * spec.dim * 4
+    quantized: float = {
+        "none": 0,
+        "scalar": points * spec.dim,
+        "binary": points * spec.dim / 8,
+    }[spec.quantization]
+    # 레벨 0 링크는 m*2개, 상위 레벨은 무시할 만큼 작음
+    links: float = points * spec.hnsw_m * 2 * 4
+    return (raw + quantized + links) / 1024 / 1024
+
+
+async def _resident_mb(url: Optional[str]) -> Optional[float]:
+    if not url:
+        return None
+    try:
+        async with httpx.AsyncClient() as http:
+            response = await http.get(f"{url.rstrip('/')}/metrics")
+        match = _RESIDENT.search(response.text)
+        return float(match.group(1)) / 1024 / 1024 if match else None
+    except httpx.HTTPError:
+        return None
+
+
+async def _wait_indexed(client: AsyncQdrantClient, timeout: float = 600.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        info = await client.get_collection(COLLECTION)
+        if info.status == CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(0.5)
+
+
+async def _query(
+    client: AsyncQdrantClient, queries: np.ndarray, limit: int, params
+) -> tuple[list[list], list[float]]:
+    results, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        response = await client.query_points(
+            COLLECTION,
+            query=query.tolist(),
+            limit=limit,
+            search_params=params,
+            with_payload=False,
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append([point.id for point in response.points])
+    return results, latencies
+
+
+def _recall(results: list[list], truth: list[list]) -> float:
+    hits = sum(len(set(r) & set(t)) for r, t in zip(results, truth))
+    return hits / max(sum(len(t) for t in truth), 1)
+
+
+async def bench(
+    points: int,
+    dim: int,
+    queries: int,
+    limit: int,
+    efs: list[int],
+    oversampling: float,
+    url: Optional[str],
+) -> None:
+    client = AsyncQdrantClient(url=url) if url else AsyncQdrantClient(":memory:")
+    vectors, query_vectors = _dataset(points, dim, queries)
+    payloads = [{"chunk": i, "user_id": f"user-{i % 100}"} for i in range(points)]
+    specs = [
+        CollectionSpec(COLLECTION, dim, quantization="none", on_disk=False),
+        CollectionSpec(COLLECTION, dim, quantization="scalar", on_disk=True),
+        CollectionSpec(COLLECTION, dim, quantization="binary", on_disk=True),
+    ]
+
+    try:
+        truth: Optional[list[list]] = None
+        for spec in specs:
+            if await client.collection_exists(COLLECTION):
+                await client.delete_collection(COLLECTION)
+            await ensure_collection(client, spec)
+            await upsert_points(
+                client, COLLECTION, vectors.tolist(), payloads, id_field="chunk"
+            )
+            await _wait_indexed(client)
+
+            if truth is None:
+                truth, _ = await _query(
+                    client, query_vectors, limit, search_params(exact=True)
+                )
+
+            resident = await _resident_mb(url)
+            print(
+                f"[{spec.quantization}/{'disk' if spec.on_disk else 'ram'}] "
+                f"est_ram={_estimated_ram_mb(spec, points):.1f}MB"
+                + (f" server_rss={resident:.1f}MB" if resident is not None else "")
+            )
+            for ef in efs:
+                results, latencies = await _query(
+                    client,
+                    query_vectors,
+                    limit,
+                    search_params(hnsw_ef=ef, oversampling=oversampling),
+                )
+                print(
+                    f"    hnsw_ef={ef} recall@{limit}={_recall(results, truth):.3f} "
+                    f"p50={np.percentile(latencies, 50):.2f}ms "
+                    f"p95={np.percentile(latencies, 95):.2f}ms"
+                )
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--ef", default="64,128,256")
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    asyncio.run(
+        bench(
+            points=args.points,
+            dim=args.dim,
+            queries=args.queries,
+            limit=args.limit,
+            efs=[int(ef) for ef in args.ef.split(",")],
+            oversampling=args.oversampling,
+            url=args.url,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Qdrant 벡터 적재 처리량 비교: 포인트당 1회 upsert vs 배치 + 병렬 upsert.
+
+    python -m benchmarks.qdrant_ingest_bench --points 5000 --dim 384 \
+        --batch-size 256 --parallel 4 [--url http://localhost:6333] [--no-wait]
+
+--url이 없으면 qdrant-client의 로컬 인메모리 모드(":memory:")를 대역으로 사용한다.
+로컬 모드에는 네트워크 왕복이 없으므로 병렬화 이득은 실제 서버에서 측정해야 한다.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from server.storage.vector_ingest import point_id, upsert_points
+
+COLLECTION: str = "ingest_bench"
+
+
+def _dataset(points: int, dim: int) -> tuple[list[list[float]], list[dict]]:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((points, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    payloads = [
+        {"content": f"전세 계약 문서 {i}", "source": "bench", "chunk": i}
+        for i in range(points)
+    ]
+    return vectors.tolist(), payloads
+
+
+async def _reset(client: AsyncQdrantClient, dim: int) -> None:
+    if await client.collection_exists(COLLECTION):
+        await client.delete_collection(COLLECTION)
+    await client.create_collection(
+        COLLECTION, vectors_config=VectorParams(size=dim, distance=Distance.COSINE)
+    )
+
+
+async def _single(
+    client: AsyncQdrantClient, vectors: list[list[float]], payloads: list[dict]
+) -> None:
+    for vector, payload in zip(vectors, payloads):
+        await client.upsert(
+            collection_name=COLLECTION,
+            points=[PointStruct(id=point_id(payload), vector=vector, payload=payload)],
+        )
+
+
+async def bench(
+    points: int,
+    dim: int,
+    batch_size: int,
+    parallel: int,
+    wait: bool,
+    url: Optional[str],
+    single_limit: int,
+) -> None:
+    client = AsyncQdrantClient(url=url) if url else AsyncQdrantClient(":memory:")
+    vectors, payloads = _dataset(points, dim)
+
+    try:
+        single_points = min(points, single_limit)
+        await _reset(client, dim)
+        started = time.perf_counter()
+        await _single(client, vectors[:single_points], payloads[:single_points])
+        elapsed = time.perf_counter() - started
+        print(
+            f"[single] points={single_points} total={elapsed:.2f}s "
+            f"throughput={single_points / elapsed:.1f} points/s"
+        )
+
+        for label in ("bulk", "re-ingest"):
+            # re-ingest는 같은 데이터를 다시 적재해 결정적 id로 포인트 수가 늘지 않는지 확인
+            if label == "bulk":
+                await _reset(client, dim)
+            started = time.perf_counter()
+            await upsert_points(
+                client,
+                COLLECTION,
+                vectors,
+                payloads,
+                batch_size=batch_size,
+                parallel=parallel,
+                wait=wait,
+            )
+            elapsed = time.perf_counter() - started
+            count = (await client.count(COLLECTION, exact=True)).count
+            print(
+                f"[{label}] points={points} batch_size={batch_size} parallel={parallel} "
+                f"wait={wait} total={elapsed:.2f}s "
+                f"throughput={points / elapsed:.1f} points/s stored={count}"
+            )
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--no-wait", action="store_true")
+    parser.add_argument("--url", default=None)
+    parser.add_argument(
+        "--single-limit",
+        type=int,
+        default=1000,
+        help="포인트당 upsert 기준선에 사용할 최대 포인트 수",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        bench(
+            points=args.points,
+            dim=args.dim,
+            batch_size=args.batch_size,
+            parallel=args.parallel,
+            wait=not args.no_wait,
+            url=args.url,
+            single_limit=args.single_limit,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+sqlite-vec(프로세스 내) vs Qdrant 벡터 검색의 recall@k와 지연 비교.
+
+    python -m benchmarks.vector_store_bench --sizes 10000 100000 1000000 \
+        --dim 384 --queries 200 --k 10 [--url http://localhost:6333]
+
+정답은 numpy 전수 비교(코사인)로 구한다. sqlite-vec는 정확 KNN, Qdrant는 HNSW 근사 검색이다.
+--url이 없으면 Qdrant는 qdrant-client 인메모리 모드를 대역으로 쓰며, 이 경우 네트워크 왕복과 HNSW가 없어
+지연 비교는 의미가 없고 대규모(1M)에서는 매우 느리다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from server.storage.sqlite_vec_store import SqliteVecStore
+from server.storage.vector_ingest import point_id, upsert_points
+
+COLLECTION: str = "vector_store_bench"
+CHUNK: int = 10_000
+
+
+def _dataset(
+    size: int, dim: int, queries: int, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    # 실제 임베딩처럼 군집 구조를 갖도록 중심점 주변에 분포시킴
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(size // 1000, 8), dim), dtype=np.float32)
+    labels = rng.integers(0, len(centers), size + queries)
+    data = centers[labels] + 0.5 * rng.standard_normal(
+        (size + queries, dim), dtype=np.float32
+    )
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    return data[:size], data[size:]
+
+
+def _ground_truth(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_ids = np.zeros((len(queries), k), dtype=np.int64)
+    for start in range(0, len(vectors), CHUNK * 10):
+        scores = queries @ vectors[start : start + CHUNK * 10].T
+        ids = np.arange(start, start + scores.shape[1])[np.newaxis, :].repeat(
+            len(queries), axis=0
+        )
+        merged_scores = np.concatenate([best_scores, scores], axis=1)
+        merged_ids = np.concatenate([best_ids, ids], axis=1)
+        top = np.argsort(-merged_scores, axis=1)[:, :k]
+        best_scores = np.take_along_axis(merged_scores, top, axis=1)
+        best_ids = np.take_along_axis(merged_ids, top, axis=1)
+    return best_ids
+
+
+def _report(
+    name: str, latencies: list[float], results: list[list[int]], truth: np.ndarray
+) -> str:
+    recall = np.mean(
+        [
+            len(set(found) & set(expected)) / len(expected)
+            for found, expected in zip(results, truth.tolist())
+        ]
+    )
+    ordered = sorted(latencies)
+    p99 = ordered[max(int(len(ordered) * 0.99) - 1, 0)]
+    return (
+        f"{name:<10} recall@{truth.shape[1]}={recall:.3f} "
+        f"p50={statistics.median(ordered) * 1000:7.2f}ms p99={p99 * 1000:7.2f}ms"
+    )
+
+
+async def _bench_sqlite_vec(
+    path: str, vectors: np.ndarray, queries: np.ndarray, k: int
+) -> tuple[float, list[float], list[list[int]]]:
+    store = SqliteVecStore(db_path=path, dim=vectors.shape[1])
+    await store.open()
+    try:
+        started = time.perf_counter()
+        for start in range(0, len(vectors), CHUNK):
+            chunk = vectors[start : start + CHUNK]
+            await store.upsert(
+                COLLECTION,
+                chunk,
+                [{"i": start + i} for i in range(len(chunk))],
+                ids=[point_id(str(start + i)) for i in range(len(chunk))],
+            )
+        ingest = time.perf_counter() - started
+
+        latencies: list[float] = []
+        results: list[list[int]] = []
+        for query in queries:
+            started = time.perf_counter()
+            payloads = await store.search(COLLECTION, query.tolist(), k)
+            latencies.append(time.perf_counter() - started)
+            results.append([p["i"] for p in payloads])
+        return ingest, latencies, results
+    finally:
+        await store.close()
+
+
+async def _bench_qdrant(
+    url: Optional[str], vectors: np.ndarray, queries: np.ndarray, k: int
+) -> tuple[float, list[float], list[list[int]]]:
+    client = AsyncQdrantClient(url=url) if url else AsyncQdrantClient(":memory:")
+    try:
+        if await client.collection_exists(COLLECTION):
+            await client.delete_collection(COLLECTION)
+        await client.create_collection(
+            COLLECTION,
+            vectors_config=VectorParams(
+                size=vectors.shape[1], distance=Distance.COSINE
+            ),
+        )
+
+        started = time.perf_counter()
+        for start in range(0, len(vectors), CHUNK):
+            chunk = vectors[start : start + CHUNK]
+            await upsert_points(
+                client,
+                COLLECTION,
+                chunk.tolist(),
+                [{"i": start + i} for i in range(len(chunk))],
+                ids=[point_id(str(start + i)) for i in range(len(chunk))],
+            )
+        ingest = time.perf_counter() - started
+
+        latencies: list[float] = []
+        results: list[list[int]] = []
+        for query in queries:
+            started = time.perf_counter()
+            response = await client.query_points(
+                COLLECTION, query=query.tolist(), limit=k, with_payload=True
+            )
+            latencies.append(time.perf_counter() - started)
+            results.append([point.payload["i"] for point in response.points])
+        return ingest, latencies, results
+    finally:
+        await client.close()
+
+
+async def bench(
+    size: int, dim: int, queries: int, k: int, url: Optional[str], workdir: str
+) -> None:
+    vectors, query_vectors = _dataset(size, dim, queries)
+    truth = _ground_truth(vectors, query_vectors, k)
+    print(f"[size={size}] dim={dim} queries={queries}")
+
+    ingest, latencies, results = await _bench_sqlite_vec(
+        str(Path(workdir) / f"vec_{size}.db"), vectors, query_vectors, k
+    )
+    print(f"  {_report('sqlite-vec', latencies, results, truth)} ingest={ingest:.1f}s")
+
+    ingest, latencies, results = await _bench_qdrant(url, vectors, query_vectors, k)
+    print(f"  {_report('qdrant', latencies, results, truth)} ingest={ingest:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            asyncio.run(bench(size, args.dim, args.queries, args.k, args.url, tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .graph.graph_engine import GraphEngine
+from .graph.stream import StreamEvent, StreamEventType
 
 
-__all__ = ["GraphEngine"]
+__all__ = ["GraphEngine", "StreamEvent", "StreamEventType"]
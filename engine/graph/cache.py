@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from typing import Any, Optional
+import time
+
+import orjson
+import xxhash
+
+from .logger import logger
+
+
+def make_cache_key(namespace: str, payload: Any) -> str:
+    """정렬된 JSON 직렬화 결과를 xxhash로 축약하여 캐시 키 생성"""
+    raw: bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return f"{namespace}:{xxhash.xxh3_64_hexdigest(raw)}"
+
+
+class LRUCache:
+    """TTL을 지원하는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    프로세스 내 LRU(1차) + Redis(2차) 2단계 캐시.
+
+    Redis 장애는 캐시 미스로 취급하여 호출 측 로직에 영향을 주지 않는다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_client: Any = None,
+        maxsize: int = 1024,
+        ttl: float = 3600.0,
+    ) -> None:
+        self.namespace = namespace
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.local = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def key(self, payload: Any) -> str:
+        return make_cache_key(self.namespace, payload)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        if self.redis_client is None:
+            return None
+
+        try:
+            raw = await self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"[Cache] Redis get failed. key: {key}, error: {str(e)}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = orjson.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, nx: bool = False) -> bool:
+        """
+        nx=True면 Redis에 값이 없을 때만 저장한다(read-through 채우기용).
+        이미 더 최신 값이 있어 저장하지 않은 경우 로컬에도 넣지 않고 False를 반환
+        """
+        if self.redis_client is None:
+            self.local.set(key, value)
+            return True
+
+        try:
+            stored = await self.redis_client.set(
+                key, orjson.dumps(value).decode(), ex=int(self.ttl), nx=nx
+            )
+        except Exception as e:
+            logger.warning(f"[Cache] Redis set failed. key: {key}, error: {str(e)}")
+            stored = True
+
+        if not stored:
+            return False
+        self.local.set(key, value)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"[Cache] Redis delete failed. key: {key}, error: {str(e)}")
@@ -7,6 +7,35 @@ class ConfigSettings(BaseSettings):
     OPENAI_API_KEY: str | None = Field(default=None)
     LAKERA_GUARD_API_KEY: str | None = Field(default=None)
     UPSTAGE_API_KEY: str | None = Field(default=None)
+    PII_MAX_WORKERS: int = Field(default=2)
+    EVALUATOR_TIMEOUT_SEC: float = Field(default=8.0)
+    LEGAL_CACHE_TTL_SEC: int = Field(default=86400)
+    LEGAL_CACHE_MAXSIZE: int = Field(default=1024)
+    LEGAL_MIRROR_PATH: str | None = Field(default=None)
+    LEGAL_MIRROR_MAX_AGE_SEC: int = Field(default=7 * 24 * 3600)
+    PLAN_CACHE_ENABLED: bool = Field(default=False)
+    PLAN_CACHE_THRESHOLD: float = Field(default=0.92)
+    PLAN_CACHE_MAXSIZE: int = Field(default=2048)
+    PLAN_CACHE_TTL_SEC: int = Field(default=24 * 3600)
+    PARALLEL_DISPATCH: bool = Field(default=False)
+    HISTORY_KEEP_TURNS: int = Field(default=3)
+    HISTORY_CHAR_BUDGET: int = Field(default=6000)
+    HISTORY_SUMMARY_MAX_CHARS: int = Field(default=1500)
+    SINGLE_FLIGHT_ENABLED: bool = Field(default=False)
+    SINGLE_FLIGHT_TTL_SEC: int = Field(default=120)
+    DOC_EMBEDDING_MODEL_DIR: str | None = Field(default=None)
+    DOC_EMBEDDING_QUERY_PREFIX: str = Field(default="query: ")
+    DOC_EMBEDDING_THREADS: int | None = Field(default=None)
+    DOC_EMBEDDING_CACHE_MAXSIZE: int = Field(default=4096)
+    DOC_EMBEDDING_CACHE_TTL_SEC: int = Field(default=24 * 3600)
+    DOC_COLLECTION: str = Field(default="documents")
+    DOC_SEARCH_LIMIT: int = Field(default=5)
+    DOC_MAX_QUERIES: int = Field(default=4)
+    DOC_BM25_INDEX_PATH: str | None = Field(default=None)
+    DOC_BM25_TEXT_FIELD: str = Field(default="content")
+    DOC_TOKENIZER_MODEL: str = Field(default="ko_core_news_lg")
+    DOC_HYBRID_CANDIDATES: int = Field(default=20)
+    DOC_RRF_K: int = Field(default=60)
 
     model_config = SettingsConfigDict(
         env_file="engine/.env",
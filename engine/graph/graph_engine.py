@@ -6,16 +6,52 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from .state import StateKey, HumanFeedback
 from .schema import NodeType
 from .workflow import build_workflow
+from ..security.privacy import PrivacyService
+from ..security.guard import PromptGuard
+from ..retrieval.law_client import LawApiClient
+from ..retrieval.law_mirror import LawMirror
+from ..retrieval.doc_search import DocumentSearch
+from .plan_cache import PlanCache
+from .singleflight import SingleFlight, flight_key
+from .stream import (
+    STREAM_MODES,
+    TERMINAL_EVENTS,
+    StreamEvent,
+    TokenGate,
+    terminal_event,
+    error_event,
+)
+from .logger import logger
 
 
 class GraphEngine:
     def __init__(
-        self, llm_map: Dict[NodeType, BaseChatModel], checkpointer: BaseCheckpointSaver
+        self,
+        llm_map: Dict[NodeType, BaseChatModel],
+        checkpointer: BaseCheckpointSaver,
+        privacy_service: Optional[PrivacyService] = None,
+        prompt_guard: Optional[PromptGuard] = None,
+        law_client: Optional[LawApiClient] = None,
+        law_mirror: Optional[LawMirror] = None,
+        doc_search: Optional[DocumentSearch] = None,
+        plan_cache: Optional[PlanCache] = None,
+        parallel_dispatch: bool = False,
+        single_flight: Optional[SingleFlight] = None,
     ):
-        self._workflow = build_workflow(llm_map=llm_map)
+        self._workflow = build_workflow(
+            llm_map=llm_map,
+            privacy_service=privacy_service,
+            prompt_guard=prompt_guard,
+            law_client=law_client,
+            law_mirror=law_mirror,
+            doc_search=doc_search,
+            plan_cache=plan_cache,
+            parallel_dispatch=parallel_dispatch,
+        )
         self._app = self._workflow.compile(
             checkpointer=checkpointer, interrupt_before=[NodeType.HUMAN_REVIEWER]
         )
+        self._single_flight = single_flight
 
     async def run(
         self,
@@ -23,11 +59,28 @@ class GraphEngine:
         thread_id: str,
         query: str,
         external_fns: Optional[Dict[str, Callable]] = None,
-    ) -> AsyncGenerator:
+        coalesce: bool = False,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """
+        coalesce=True는 새 스레드의 첫 턴에만 사용한다.
+        같은 질의/페르소나의 동시 요청은 하나의 실행을 공유하고, 결과 상태는 각자의 스레드로 복사된다.
+        """
         config = self._build_config(user_id, thread_id, external_fns)
         input_data = {StateKey.QUERY: query}
 
-        async for event in self._app.astream_events(input_data, config, version="v2"):
+        if not coalesce or self._single_flight is None:
+            async for event in self._stream(input_data, config):
+                yield event
+            return
+
+        persona: dict = await self._load_persona(user_id, external_fns)
+        async for event, origin in self._single_flight.join(
+            key=flight_key(query, persona),
+            origin={"user_id": user_id, "thread_id": thread_id},
+            source=lambda: self._stream(input_data, config),
+        ):
+            if origin is not None and event.event in TERMINAL_EVENTS:
+                await self._fork_state(origin, config)
             yield event
 
     async def resume(
@@ -36,7 +89,7 @@ class GraphEngine:
         thread_id: str,
         feedback: str,
         external_fns: Optional[Dict[str, Callable]] = None,
-    ) -> AsyncGenerator:
+    ) -> AsyncGenerator[StreamEvent, None]:
         config = self._build_config(user_id, thread_id, external_fns)
 
         await self._app.aupdate_state(
@@ -48,9 +101,54 @@ class GraphEngine:
             },
         )
 
-        async for event in self._app.astream_events(None, config, version="v2"):
+        async for event in self._stream(None, config):
             yield event
 
+    async def _stream(
+        self, input_data: Optional[dict], config: RunnableConfig
+    ) -> AsyncGenerator[StreamEvent, None]:
+        gate = TokenGate()
+        try:
+            async for mode, chunk in self._app.astream(
+                input_data, config, stream_mode=STREAM_MODES
+            ):
+                for event in gate.feed(mode, chunk):
+                    yield event
+
+            yield terminal_event(await self._app.aget_state(config))
+        except Exception as e:
+            logger.error(f"[GraphEngine] stream failed. error: {str(e)}", exc_info=True)
+            yield error_event(e)
+
+    async def _fork_state(self, origin: dict, config: RunnableConfig) -> None:
+        """리더 스레드의 최종 상태를 팔로워 스레드로 복사"""
+        try:
+            snapshot = await self._app.aget_state(
+                self._build_config(origin["user_id"], origin["thread_id"])
+            )
+            if not snapshot.values:
+                return
+            # HITL 대기 중이면 Evaluator 이후 상태로, 아니면 종료 상태로 기록
+            as_node: NodeType = (
+                NodeType.EVALUATOR if snapshot.next else NodeType.FINALIZER
+            )
+            await self._app.aupdate_state(config, snapshot.values, as_node=as_node)
+        except Exception as e:
+            logger.warning(f"[GraphEngine] state fork failed. error: {str(e)}")
+
+    @staticmethod
+    async def _load_persona(
+        user_id: str, external_fns: Optional[Dict[str, Callable]]
+    ) -> dict:
+        search_memory_fn = (external_fns or {}).get("search_memory_fn")
+        if search_memory_fn is None:
+            return {}
+        try:
+            return await search_memory_fn(user_id=user_id) or {}
+        except Exception as e:
+            logger.warning(f"[GraphEngine] persona lookup failed. error: {str(e)}")
+            return {}
+
     async def aget_state(self, user_id: str, thread_id: str):
         config = self._build_config(user_id, thread_id)
         state = await self._app.aget_state(config)
@@ -0,0 +1,100 @@
+from typing import Optional, Sequence
+import uuid
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, RemoveMessage, SystemMessage
+
+from .schema import NodeType
+from .utils import AgentSpecLoader
+from .logger import logger
+
+# 시스템 프롬프트는 고정 id로 추가하여 add_messages가 매 턴 중복 추가 대신 교체하도록 함
+SYSTEM_PROMPT_ID: str = "system_prompt"
+# 턴의 시작(Initializer의 사용자 요청)을 표시하는 id 접두사
+TURN_ID_PREFIX: str = "turn:"
+
+
+def new_turn_id() -> str:
+    return f"{TURN_ID_PREFIX}{uuid.uuid4()}"
+
+
+def split_turns(
+    messages: Sequence[BaseMessage],
+) -> tuple[list[BaseMessage], list[list[BaseMessage]]]:
+    """시스템 프롬프트와 턴 단위 메시지 묶음으로 분리"""
+    pinned: list[BaseMessage] = []
+    turns: list[list[BaseMessage]] = []
+
+    for message in messages:
+        if message.id == SYSTEM_PROMPT_ID:
+            pinned.append(message)
+        elif (message.id or "").startswith(TURN_ID_PREFIX) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+
+    return pinned, turns
+
+
+def summary_message(summary: str) -> SystemMessage:
+    return SystemMessage(content=f"이전 대화 요약: {summary}")
+
+
+class HistoryCompactor:
+    """
+    대화 기록이 char_budget을 넘으면 최근 keep_turns 턴만 원문으로 남기고,
+    그 이전 턴은 LLM 요약으로 병합한 뒤 RemoveMessage로 제거한다.
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        keep_turns: int = 3,
+        char_budget: int = 6000,
+        summary_max_chars: int = 1500,
+    ) -> None:
+        self.llm = llm
+        self.keep_turns = keep_turns
+        self.char_budget = char_budget
+        self.summary_max_chars = summary_max_chars
+        self.prompt_template = AgentSpecLoader.load_elements(
+            NodeType.FINALIZER, "summary_template"
+        )
+
+    async def compact(
+        self, messages: Sequence[BaseMessage], summary: Optional[str]
+    ) -> tuple[list[RemoveMessage], Optional[str]]:
+        """(제거할 메시지, 새 요약)을 반환. 압축이 필요 없으면 ([], 기존 요약)"""
+        _, turns = split_turns(messages)
+        if len(turns) <= self.keep_turns:
+            return [], summary
+
+        total_chars: int = sum(len(str(m.content)) for turn in turns for m in turn)
+        if total_chars <= self.char_budget:
+            return [], summary
+
+        old_messages: list[BaseMessage] = [
+            m for turn in turns[: -self.keep_turns] for m in turn
+        ]
+        prompt: str = self.prompt_template.format(
+            summary=summary or "없음",
+            history="\n".join(f"{m.type}: {m.content}" for m in old_messages),
+            max_chars=self.summary_max_chars,
+        )
+
+        try:
+            response = await self.llm.ainvoke(prompt)
+        except Exception as e:
+            # 요약에 실패하면 원문을 유지하고 다음 턴에 다시 시도
+            logger.warning(f"[HistoryCompactor] summary failed. error: {str(e)}")
+            return [], summary
+
+        new_summary: str = str(response.content).strip()[: self.summary_max_chars]
+        removals: list[RemoveMessage] = [
+            RemoveMessage(id=m.id) for m in old_messages if m.id
+        ]
+        logger.debug(
+            f"[HistoryCompactor] folded {len(old_messages)} messages "
+            f"({total_chars} chars) into {len(new_summary)} chars."
+        )
+        return removals, new_summary
@@ -0,0 +1,86 @@
+import re
+from typing import Optional
+
+_SIMPLE_ESCAPES: dict[str, str] = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class JsonStringFieldParser:
+    """
+    스트리밍되는 JSON 텍스트에서 지정한 문자열 필드의 값을 증분 디코딩.
+
+    청크 경계에서 잘린 이스케이프(`\\n`, `\\uXXXX`, 서로게이트 쌍)는 다음 청크가 올 때까지 보류한다.
+    필드 이름은 첫 번째 `"<field>":` 패턴으로 찾으므로 최상위 문자열 필드가 하나인 스키마를 대상으로 한다.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._key_pattern = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer: str = ""
+        self._cursor: Optional[int] = None
+        self.done: bool = False
+
+    @property
+    def raw(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> str:
+        """청크를 추가하고 새로 확정된 필드 값 조각을 반환"""
+        self._buffer += chunk
+        if self.done:
+            return ""
+
+        if self._cursor is None:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return ""
+            self._cursor = match.end()
+
+        decoded, self._cursor, self.done = self._decode(self._buffer, self._cursor)
+        return decoded
+
+    @staticmethod
+    def _decode(text: str, pos: int) -> tuple[str, int, bool]:
+        out: list[str] = []
+        end: int = len(text)
+
+        while pos < end:
+            ch: str = text[pos]
+            if ch == '"':
+                return "".join(out), pos + 1, True
+            if ch != "\\":
+                out.append(ch)
+                pos += 1
+                continue
+
+            if pos + 1 >= end:
+                break
+            esc: str = text[pos + 1]
+            if esc != "u":
+                out.append(_SIMPLE_ESCAPES.get(esc, esc))
+                pos += 2
+                continue
+
+            if pos + 6 > end:
+                break
+            code: int = int(text[pos + 2 : pos + 6], 16)
+            if 0xD800 <= code < 0xDC00:
+                # 상위 서로게이트는 하위 서로게이트(\uXXXX)까지 받아야 한 글자로 합칠 수 있음
+                if pos + 12 > end:
+                    break
+                low: int = int(text[pos + 8 : pos + 12], 16)
+                code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                pos += 12
+            else:
+                pos += 6
+            out.append(chr(code))
+
+        return "".join(out), pos, False
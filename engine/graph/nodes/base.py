@@ -1,13 +1,15 @@
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.language_models import BaseChatModel
-from typing import TypeVar, Generic, Type, Any, cast
+from typing import TypeVar, Generic, Type, Any, Callable, Optional, cast
 from abc import abstractmethod, ABC
 from pydantic import BaseModel
+from langgraph.config import get_stream_writer
 import traceback
 
 from ..state import AgentState, StateKey, StateManager
 from ..schema import NodeType, PlannerResponse, HumanFeedback
 from ..utils import AgentSpecLoader
+from ..json_stream import JsonStringFieldParser
 from ...error.errors import SecurityError
 from ..logger import logger
 
@@ -59,7 +61,7 @@ class ToolNode(BaseNode, Generic[P]):
         feedback_content: str = sm.feedback
 
         formatted_prompt: str = self.prompt_template.format(
-            query=query, feedback=feedback_content, api_args=sm.api_args
+            query=query, feedback=feedback_content, api_args=dict(sm.api_args)
         )
         raw_response = await self.argument_generator.ainvoke(formatted_prompt)
 
@@ -96,16 +98,52 @@ class LLMNode(BaseNode, Generic[T]):
         node_type: NodeType,
         output_type: Type[T],
         llm: BaseChatModel,
+        stream_field: Optional[str] = None,
     ) -> None:
         self.key = node_type
         self.output_type = output_type
-        self.llm = llm.with_structured_output(output_type)
+        self.stream_field = stream_field
+        if stream_field:
+            # 구조화 출력을 tool call 인자로 받아 청크 단위로 파싱
+            self.llm = llm.bind_tools([output_type], tool_choice=output_type.__name__)
+        else:
+            self.llm = llm.with_structured_output(output_type)
         self.prompt_template = AgentSpecLoader.load_prompt(agent_name=self.key)
 
     async def _ask_llm(self, prompt: str) -> T:
+        if self.stream_field:
+            return await self._stream_llm(prompt)
+
         result = await self.llm.ainvoke(prompt)
         if isinstance(result, self.output_type):
             return cast(T, result)
         raise TypeError(
             f"LLM failed to return a structured {self.output_type.__name__}."
         )
+
+    async def _stream_llm(self, prompt: str) -> T:
+        """stream_field 값의 델타를 stream writer로 내보내고 완료 후 전체 응답을 검증"""
+        writer = self._stream_writer()
+        parser = JsonStringFieldParser(field=cast(str, self.stream_field))
+
+        async for chunk in self.llm.astream(prompt):
+            for tool_chunk in getattr(chunk, "tool_call_chunks", None) or []:
+                delta: str = parser.feed(tool_chunk.get("args") or "")
+                if delta:
+                    writer({"node": self.key, "delta": delta})
+
+        if not parser.raw:
+            raise TypeError(
+                f"LLM failed to return a structured {self.output_type.__name__}."
+            )
+        return cast(
+            T, cast(Type[BaseModel], self.output_type).model_validate_json(parser.raw)
+        )
+
+    @staticmethod
+    def _stream_writer() -> Callable[[Any], None]:
+        try:
+            return get_stream_writer()
+        except RuntimeError:
+            # 그래프 실행 컨텍스트 밖(단위 테스트 등)에서는 델타를 버림
+            return lambda _: None
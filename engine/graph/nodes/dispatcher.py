@@ -1,23 +1,33 @@
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
 from ..state import AgentState, StateKey, StateManager
-from ..schema import NodeType, PlannerResponse
+from ..schema import NodeType, PlannerResponse, RETRIEVER_NODES
 from .base import BaseNode
 
 
 class Dispatcher(BaseNode):
-    def __init__(self) -> None:
+    def __init__(self, parallel: bool = False) -> None:
         self.key = NodeType.DISPATCHER
+        self.parallel = parallel
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state=state)
         planner_response: PlannerResponse = sm.planner_response
+        parallel_targets: list[NodeType] | None = None
 
         if planner_response.is_exhausted():
             if not sm.answer:
                 next_node: NodeType = NodeType.GENERATOR
             else:
                 next_node: NodeType = NodeType.FINALIZER
+        elif self.parallel and planner_response.current_node() in RETRIEVER_NODES:
+            group: list[NodeType] = planner_response.pop_retriever_group()
+            if len(group) > 1:
+                # 연속된 독립 리트리버는 한 superstep에서 동시에 실행
+                parallel_targets = group
+                next_node: NodeType = NodeType.PARALLEL_RETRIEVER
+            else:
+                next_node: NodeType = group[0]
         else:
             next_node: NodeType = planner_response.pop_stack()
 
@@ -25,5 +35,6 @@ class Dispatcher(BaseNode):
             update_dict={
                 StateKey.NEXT_NODE: next_node,
                 StateKey.PLANNER_RESPONSE: planner_response,
+                StateKey.PARALLEL_TARGETS: parallel_targets,
             },
         )
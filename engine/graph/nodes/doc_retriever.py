@@ -1,16 +1,23 @@
-from typing import List
-import requests
-from pydantic import ValidationError
+from typing import Optional
 from langchain_core.language_models import BaseChatModel
 
-from ..utils import AgentSpecLoader
-from ..schema import LegalSearchQuery, NodeType, DocumentSearchQuery
-from ..state import AgentState, StateKey
+from ..schema import NodeType, DocumentSearchQuery
 from .base import ToolNode
+from ...retrieval.doc_search import DocumentSearch
 
 
-class DocumentsRetriever(ToolNode[DocumentSearchQuery]):  # todo
-    def __init__(self, llm: BaseChatModel) -> None:
+class DocumentsRetriever(ToolNode[DocumentSearchQuery]):
+    def __init__(
+        self, llm: BaseChatModel, doc_search: Optional[DocumentSearch] = None
+    ) -> None:
         super().__init__(NodeType.DOC_RETRIEVER, DocumentSearchQuery, llm)
+        self.doc_search = doc_search
 
-    async def _execute_tool(self, args: LegalSearchQuery) -> dict: ... # 벡터디비 유사도 기반 문서 검색
+    async def _execute_tool(self, args: DocumentSearchQuery) -> dict:
+        # 벡터디비 유사도 기반 문서 검색
+        if self.doc_search is None:
+            raise ValueError("document search is not configured.")
+        if args.sub_queries:
+            # 여러 측면의 쿼리는 한 번의 배치 검색으로 조회하고 결과를 합침
+            return await self.doc_search.search_many([args.query, *args.sub_queries])
+        return await self.doc_search.search(args.query)
@@ -1,46 +1,77 @@
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
-import requests
-from typing import Any
+import asyncio
+import time
+from typing import Any, Awaitable, Optional
 
 from ..state import AgentState, StateKey, StateManager
-from ..schema import NodeType, PlannerResponse, EvaluationResponse
+from ..schema import NodeType, PlannerResponse, EvaluationResponse, SafetyCheckReport
+from ..config import config_settings
 from .base import BaseNode
 from ...security.guard import PromptGuard
 from ...security.hallucination import HallucinationDetector
-from ...security.privacy import PresidioKoreanEngine
+from ...security.privacy import PrivacyService, redacted_result
+from ..logger import logger
 
 
 class Evaluator(BaseNode):
-    def __init__(self) -> None:
+    PROMPT_GUARD = "prompt_guard"
+    GROUNDEDNESS = "groundedness"
+    PRIVACY = "privacy"
+
+    def __init__(
+        self,
+        prompt_guard: PromptGuard,
+        privacy_service: PrivacyService,
+        timeout: float = config_settings.EVALUATOR_TIMEOUT_SEC,
+    ) -> None:
         self.key = NodeType.EVALUATOR
+        self.prompt_guard = prompt_guard
+        self.privacy_service = privacy_service
+        self.hallucination_detector = HallucinationDetector()
+        self.timeout = timeout
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state=state)
+        answer: str = sm.answer
 
-        guard_prompt: PromptGuard = PromptGuard()
-        _is_secured: bool = await guard_prompt.is_secured(
-            [AIMessage(content=sm.answer)]
-        )
+        # 시간 초과 시 각 검사의 실패 경로와 동일한 판정을 사용. PII 검사는 원문이 나가지 않도록 fail-closed
+        fallbacks: dict[str, Any] = {
+            self.PROMPT_GUARD: False,
+            self.GROUNDEDNESS: False,
+            self.PRIVACY: redacted_result(),
+        }
 
-        hallucination_detector: HallucinationDetector = HallucinationDetector()
-        _is_grounded: bool = await hallucination_detector.is_grounded(
-            answer=sm.answer, context=sm.retrieved_docs
+        results, reports = await self._fan_out(
+            checks={
+                self.PROMPT_GUARD: self.prompt_guard.is_secured(
+                    [AIMessage(content=answer)]
+                ),
+                self.GROUNDEDNESS: self.hallucination_detector.is_grounded(
+                    answer=answer, context=dict(sm.retrieved_docs)
+                ),
+                self.PRIVACY: self.privacy_service.process(answer),
+            },
+            fallbacks=fallbacks,
         )
 
-        presidio: PresidioKoreanEngine = PresidioKoreanEngine()
-        presidio_result: dict[str, Any] = await presidio.process(sm.answer)
-        is_pii: bool = presidio_result.get("is_pii", False)
-        masked_text: str = presidio_result.get("masked_text", sm.answer)
+        _is_secured: bool = results[self.PROMPT_GUARD]
+        _is_grounded: bool = results[self.GROUNDEDNESS]
+        presidio_result: dict[str, Any] = results[self.PRIVACY]
+        is_pii: bool = presidio_result.get("is_pii", True)
+        masked_text: str = presidio_result.get("masked_text", "")
 
         # todo
         # evaluation_response: EvaluationResponse = EvaluationResponse(
-        #     is_secured=_is_secured, is_grounded=_is_grounded, has_pii=is_pii
+        #     is_secured=_is_secured,
+        #     is_grounded=_is_grounded,
+        #     has_pii=is_pii,
+        #     checks=reports,
         # )
 
         # mock
         evaluation_response: EvaluationResponse = EvaluationResponse(
-            is_secured=True, is_grounded=True, has_pii=False
+            is_secured=True, is_grounded=True, has_pii=False, checks=reports
         )
 
         return self._create_success_response(
@@ -49,3 +80,57 @@ class Evaluator(BaseNode):
                 StateKey.ANSWER: masked_text,
             },
         )
+
+    async def _fan_out(
+        self, checks: dict[str, Awaitable[Any]], fallbacks: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[SafetyCheckReport]]:
+        """모든 검사를 동시에 실행하고, 공유 제한 시간 내에 끝나지 않은 검사는 fallback 판정으로 대체"""
+        tasks: dict[str, asyncio.Task] = {
+            name: asyncio.create_task(self._timed(check))
+            for name, check in checks.items()
+        }
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+
+        results: dict[str, Any] = {}
+        reports: list[SafetyCheckReport] = []
+
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning(f"[Evaluator] '{name}' timed out after {self.timeout}s.")
+                results[name] = fallbacks[name]
+                reports.append(
+                    SafetyCheckReport(
+                        name=name, finished=False, elapsed_ms=self.timeout * 1000
+                    )
+                )
+                continue
+
+            result, elapsed_ms, error = task.result()
+            if error is not None:
+                logger.warning(f"[Evaluator] '{name}' failed. error: {str(error)}")
+                results[name] = fallbacks[name]
+                reports.append(
+                    SafetyCheckReport(name=name, finished=False, elapsed_ms=elapsed_ms)
+                )
+                continue
+
+            results[name] = result
+            reports.append(
+                SafetyCheckReport(name=name, finished=True, elapsed_ms=elapsed_ms)
+            )
+
+        return results, reports
+
+    async def _timed(
+        self, check: Awaitable[Any]
+    ) -> tuple[Any, float, Optional[Exception]]:
+        """검사 결과와 소요 시간(ms). 실패한 검사도 실제 소요 시간을 남기도록 예외를 결과로 반환"""
+        started: float = time.perf_counter()
+        try:
+            result = await check
+        except Exception as e:
+            return None, (time.perf_counter() - started) * 1000, e
+        return result, (time.perf_counter() - started) * 1000, None
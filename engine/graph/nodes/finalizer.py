@@ -1,17 +1,31 @@
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, RemoveMessage
+from typing import Optional
 
 from ..state import AgentState, StateKey, StateManager
 from ..schema import NodeType, PlannerResponse, CircuitCheck
 from .base import BaseNode
+from ..history import HistoryCompactor
 
 
 class Finalizer(BaseNode):
-    def __init__(self) -> None:
+    def __init__(self, compactor: Optional[HistoryCompactor] = None) -> None:
         self.key = NodeType.FINALIZER
+        self.compactor = compactor
 
     async def _run(self, state: AgentState) -> dict:
+        sm: StateManager = StateManager(state=state)
+        removals: list[RemoveMessage] = []
+        summary: str | None = sm.history_summary
+
+        if self.compactor is not None:
+            removals, summary = await self.compactor.compact(
+                messages=sm.messages, summary=summary
+            )
+
         return self._create_success_response(
+            messages=removals,
             update_dict={
+                StateKey.HISTORY_SUMMARY: summary,
                 StateKey.ERRORS: None,
                 StateKey.QUERY: None,
                 StateKey.PLANNER_RESPONSE: None,
@@ -3,6 +3,7 @@ from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, BaseMe
 from langchain_core.messages import trim_messages
 
 from .base import LLMNode
+from ..history import summary_message
 from ..state import AgentState, StateKey, StateManager
 from ..schema import (
     NodeType,
@@ -14,7 +15,9 @@ from ..schema import (
 
 class Generator(LLMNode[GeneratorResponse]):
     def __init__(self, llm: BaseChatModel) -> None:
-        super().__init__(NodeType.GENERATOR, GeneratorResponse, llm)
+        super().__init__(
+            NodeType.GENERATOR, GeneratorResponse, llm, stream_field="answer"
+        )
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state=state)
@@ -27,13 +30,15 @@ class Generator(LLMNode[GeneratorResponse]):
             start_on="human",
             include_system=True,
         )
+        if sm.history_summary:
+            trimmed_msgs = [summary_message(sm.history_summary), *trimmed_msgs]
 
         refined_query: str = sm.refined_query or ""
         feedback: str = sm.feedback or ""
 
         prompt: str = self.prompt_template.format(
             history=trimmed_msgs,
-            retrieved_docs=sm.retrieved_docs,
+            retrieved_docs=dict(sm.retrieved_docs),
             refined_query=refined_query,
             feedback=feedback,
         )
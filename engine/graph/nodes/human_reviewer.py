@@ -12,17 +12,18 @@ from ..logger import logger
 
 
 class HumanReviewer(LLMNode[HumanFeedbackResponse]):
-    def __init__(self, llm: BaseChatModel) -> None:
+    def __init__(self, llm: BaseChatModel, prompt_guard: PromptGuard) -> None:
         super().__init__(NodeType.HUMAN_REVIEWER, HumanFeedbackResponse, llm)
+        self.prompt_guard = prompt_guard
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state=state)
         human_feedback: HumanFeedback = sm.human_feedback
         feedback_content: str = sm.feedback
 
-        guard_prompt: PromptGuard = PromptGuard()
-
-        if not await guard_prompt.is_secured([HumanMessage(content=feedback_content)]):
+        if not await self.prompt_guard.is_secured(
+            [HumanMessage(content=feedback_content)]
+        ):
             logger.warning(f"Prompt Guard Alert: Potential prompt injection detected.")
 
         prompt: str = self.prompt_template.format(feedback=feedback_content)
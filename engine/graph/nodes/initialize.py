@@ -12,14 +12,16 @@ from ..schema import (
 )
 from .base import BaseNode
 from ..utils import AgentSpecLoader
+from ..history import SYSTEM_PROMPT_ID, new_turn_id
 from ...security.guard import PromptGuard
 from ...error.errors import SecurityError
 from ..logger import logger
 
 
 class Initializer(BaseNode):
-    def __init__(self) -> None:
+    def __init__(self, prompt_guard: PromptGuard) -> None:
         self.key = NodeType.INITIALIZER
+        self.prompt_guard = prompt_guard
         self.system_prompt = AgentSpecLoader.load_elements(
             self.key, "system_prompt", "v1.0"
         )
@@ -29,15 +31,16 @@ class Initializer(BaseNode):
 
         raw_query: str = sm.query
 
-        promptguard: PromptGuard = PromptGuard()
-
-        if not await promptguard.is_secured([HumanMessage(content=raw_query)]):
+        if not await self.prompt_guard.is_secured([HumanMessage(content=raw_query)]):
             logger.warning(f"Prompt Guard Alert: Potential prompt injection detected.")
 
         return self._create_success_response(
             messages=[
-                SystemMessage(content=f"시스템 메시지: {self.system_prompt}"),
-                HumanMessage(content=f"요청 메시지: {raw_query}"),
+                SystemMessage(
+                    content=f"시스템 메시지: {self.system_prompt}",
+                    id=SYSTEM_PROMPT_ID,
+                ),
+                HumanMessage(content=f"요청 메시지: {raw_query}", id=new_turn_id()),
             ],
             update_dict={
                 StateKey.QUERY: raw_query,
@@ -1,29 +1,37 @@
-from typing import List
-import requests
+from typing import List, Optional
 from pydantic import ValidationError
 from langchain_core.language_models import BaseChatModel
 
 from ..utils import AgentSpecLoader
-from ..config import config_settings
 from ..schema import LegalSearchQuery, NodeType
 from ..state import AgentState, StateKey
 from .base import ToolNode
+from ...retrieval.law_client import LawApiClient
+from ...retrieval.law_mirror import LawMirror
 
 
 class LegalRetriever(ToolNode[LegalSearchQuery]):
-    def __init__(self, llm: BaseChatModel) -> None:
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        law_client: Optional[LawApiClient] = None,
+        law_mirror: Optional[LawMirror] = None,
+    ) -> None:
         super().__init__(NodeType.LEGAL_RETRIEVER, LegalSearchQuery, llm)
-        self.base_url = AgentSpecLoader.load_elements(self.key, "base_url")
+        self.law_client = law_client or LawApiClient(
+            base_url=AgentSpecLoader.load_elements(self.key, "base_url")
+        )
+        self.law_mirror = law_mirror
 
     async def _execute_tool(self, args: LegalSearchQuery) -> dict:
-        api_params = {
-            "OC": config_settings.KOREAN_LAW_OC,
-            "target": "expc",
-            "type": "JSON",
-            "query": args.keyword,
-            **args.model_dump(exclude={"keyword"}, exclude_none=True),
-        }
+        if self.law_mirror is None:
+            return await self.law_client.search_interpretations(args)
 
-        response = requests.get(self.base_url, params=api_params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        local_result: dict | None = await self.law_mirror.search(args)
+        if local_result is not None:
+            return local_result
+
+        # 미러에 없거나 오래된 경우에만 원격 API 호출 후 미러 갱신
+        remote_result: dict = await self.law_client.search_interpretations(args)
+        await self.law_mirror.upsert_response(remote_result)
+        return remote_result
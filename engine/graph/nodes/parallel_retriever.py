@@ -0,0 +1,67 @@
+from typing import Any
+
+from ..state import AgentState, StateKey, StateManager, merge_docs
+from ..schema import NodeType, CircuitCheck
+from .base import BaseNode, ToolNode
+from .verifier import Verifier
+from ..logger import logger
+
+
+class ParallelRetriever(BaseNode):
+    """
+    Send로 분기된 리트리버 브랜치 하나를 실행.
+
+    브랜치 안에서 검증과 circuit 재시도를 직접 수행하고, 동시에 여러 브랜치가 쓰더라도 충돌하지 않도록
+    리듀서가 있는 키(retrieved_docs, api_args, circuit_check, messages)만 갱신한다.
+    """
+
+    def __init__(
+        self, retrievers: dict[NodeType, ToolNode], verifier: Verifier
+    ) -> None:
+        self.key = NodeType.PARALLEL_RETRIEVER
+        self.retrievers = retrievers
+        self.verifier = verifier
+
+    async def _run(self, state: AgentState) -> dict:
+        sm: StateManager = StateManager(state=state)
+        target: NodeType = sm.target_node
+        retriever: ToolNode = self.retrievers[target]
+        circuit_check: CircuitCheck = sm.circuit_check
+
+        branch_state: dict[str, Any] = dict(state)
+        messages: list = []
+
+        while True:
+            update: dict = await retriever(branch_state)  # type: ignore[arg-type]
+            messages.extend(update.get(StateKey.MESSAGES) or [])
+
+            branch_state[StateKey.ERRORS] = update.get(StateKey.ERRORS)
+            for key in (StateKey.RETRIEVED_DOCS, StateKey.API_ARGS):
+                branch_state[key] = merge_docs(branch_state.get(key), update.get(key))
+
+            branch_sm: StateManager = StateManager(state=branch_state)  # type: ignore[arg-type]
+            is_verified: bool = await self.verifier.verify(
+                target=target,
+                target_doc=branch_sm.retrieved_docs.get(target),
+                errors=branch_sm.errors,
+            )
+            if is_verified:
+                break
+
+            circuit_check = circuit_check.increase(target)
+            if circuit_check.is_over_limit(target):
+                logger.warning(f"[ParallelRetriever] {target} reached circuit limit.")
+                break
+
+        return {
+            StateKey.MESSAGES: messages,
+            StateKey.RETRIEVED_DOCS: {target: branch_sm.retrieved_docs.get(target)},
+            StateKey.API_ARGS: {target: branch_sm.api_args.get(target)},
+            StateKey.CIRCUIT_CHECK: CircuitCheck(
+                circuit_stat={target: circuit_check.get_count(target)}
+            ),
+        }
+
+    def _create_error_response(self, error_msg: str) -> dict:
+        # errors는 단일 값 채널이라 병렬 브랜치에서 동시에 쓰면 충돌하므로 기록하지 않음
+        return {}
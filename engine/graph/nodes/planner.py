@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import ValidationError
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage
@@ -10,11 +11,15 @@ from ..schema import (
     PlannerResponse,
 )
 from .base import LLMNode
+from ..plan_cache import PlanCache
 
 
 class Planner(LLMNode[PlannerResponse]):
-    def __init__(self, llm: BaseChatModel) -> None:
+    def __init__(
+        self, llm: BaseChatModel, plan_cache: Optional[PlanCache] = None
+    ) -> None:
         super().__init__(NodeType.PLANNER, PlannerResponse, llm)
+        self.plan_cache = plan_cache
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state=state)
@@ -22,6 +27,15 @@ class Planner(LLMNode[PlannerResponse]):
         raw_query: str = sm.query
         feedback_content: str = sm.feedback
 
+        if self.plan_cache is not None:
+            cached: PlannerResponse | None = await self.plan_cache.get(
+                query=raw_query, feedback=feedback_content
+            )
+            if cached is not None:
+                return self._create_success_response(
+                    update_dict={StateKey.PLANNER_RESPONSE: cached},
+                )
+
         prompt = self.prompt_template.format(
             raw_query=raw_query,
             human_feedback=feedback_content,
@@ -29,6 +43,11 @@ class Planner(LLMNode[PlannerResponse]):
 
         response: PlannerResponse = await self._ask_llm(prompt)
 
+        if self.plan_cache is not None:
+            await self.plan_cache.put(
+                query=raw_query, feedback=feedback_content, response=response
+            )
+
         return self._create_success_response(
             update_dict={
                 StateKey.PLANNER_RESPONSE: response,
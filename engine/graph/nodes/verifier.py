@@ -6,13 +6,15 @@ from ..schema import NodeType, PlannerResponse, CircuitCheck
 from .base import BaseNode
 from ...security.guard import PromptGuard
 from ...error.errors import SecurityError
+from ...retrieval.doc_search import DOCUMENTS_KEY
 
 from typing import cast
 
 
 class Verifier(BaseNode):
-    def __init__(self) -> None:
+    def __init__(self, prompt_guard: PromptGuard) -> None:
         self.key = NodeType.VERIFIER
+        self.prompt_guard = prompt_guard
 
     async def _run(self, state: AgentState) -> dict:
         sm: StateManager = StateManager(state)
@@ -20,17 +22,10 @@ class Verifier(BaseNode):
         if not target:
             raise ValueError("target_node is None.")
         circuit_check: CircuitCheck = sm.circuit_check
-        target_doc = sm.retrieved_docs.get(target)
 
-        check_tool_message = ToolMessage(
-            content=f"검색 문서: {target_doc}", tool_call_id=f"call_{target}"
+        is_verified: bool = await self.verify(
+            target=target, target_doc=sm.retrieved_docs.get(target), errors=sm.errors
         )
-        doc_length = self.doc_len(target_node=target, target_doc=target_doc)
-
-        guard_prompt: PromptGuard = PromptGuard()
-        _is_secured = await guard_prompt.is_secured([check_tool_message])
-
-        is_verified: bool = doc_length > 0 and not sm.errors and _is_secured
 
         new_circuit_check: CircuitCheck | None = None
 
@@ -46,7 +41,19 @@ class Verifier(BaseNode):
             },
         )
 
+    async def verify(self, target: NodeType, target_doc, errors: str | None) -> bool:
+        check_tool_message = ToolMessage(
+            content=f"검색 문서: {target_doc}", tool_call_id=f"call_{target}"
+        )
+        doc_length = self.doc_len(target_node=target, target_doc=target_doc)
+
+        _is_secured = await self.prompt_guard.is_secured([check_tool_message])
+
+        return doc_length > 0 and not errors and _is_secured
+
     def doc_len(self, target_node: NodeType, target_doc):
         if target_node == NodeType.LEGAL_RETRIEVER and isinstance(target_doc, dict):
             return len(target_doc.get("Expc", []))
+        if target_node == NodeType.DOC_RETRIEVER and isinstance(target_doc, dict):
+            return len(target_doc.get(DOCUMENTS_KEY, []))
         return 0
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from typing import Optional
+import time
+import unicodedata
+
+import numpy as np
+import xxhash
+from langchain_core.embeddings import Embeddings
+
+from .cache import LRUCache
+from .schema import PlannerResponse
+from .logger import logger
+
+
+@dataclass
+class _PlanEntry:
+    feedback_key: str
+    response: dict
+    expires_at: float
+    last_used: float
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+def _feedback_key(feedback: str) -> str:
+    return xxhash.xxh3_64_hexdigest(_normalize(feedback).encode())
+
+
+class PlanCache:
+    """
+    Planner 응답(PlannerResponse)의 의미 기반 캐시.
+
+    쿼리 임베딩의 코사인 유사도가 threshold 이상이고 피드백 텍스트가 동일하면 저장된 계획(intention, node_stack)을 재사용한다.
+    인덱스는 프로세스 내 numpy 행렬이며 TTL 만료 후 LRU 순서로 제거한다.
+    적중률은 stats()로 조회하고, log_interval초마다 info 로그로 요약을 남긴다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: float = 0.92,
+        maxsize: int = 2048,
+        ttl: float = 24 * 3600,
+        log_interval: float = 60.0,
+    ) -> None:
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.log_interval = log_interval
+
+        self._entries: list[_PlanEntry] = []
+        self._vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._query_vectors = LRUCache(maxsize=maxsize, ttl=ttl)
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self._last_log: float = time.monotonic()
+
+    @property
+    def hit_rate(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._entries),
+        }
+
+    async def get(self, query: str, feedback: str) -> Optional[PlannerResponse]:
+        try:
+            vector: np.ndarray = await self._embed(query)
+        except Exception as e:
+            logger.warning(f"[PlanCache] embedding failed. error: {str(e)}")
+            self._record(hit=False)
+            return None
+
+        now: float = time.monotonic()
+        self._evict_expired(now)
+
+        feedback_key: str = _feedback_key(feedback)
+        best_idx, best_score = -1, self.threshold
+
+        if self._entries:
+            scores: np.ndarray = self._vectors @ vector
+            for idx in np.argsort(-scores):
+                if scores[idx] < best_score:
+                    break
+                if self._entries[idx].feedback_key == feedback_key:
+                    best_idx, best_score = int(idx), float(scores[idx])
+                    break
+
+        if best_idx < 0:
+            self._record(hit=False)
+            return None
+
+        entry: _PlanEntry = self._entries[best_idx]
+        entry.last_used = now
+        self._record(hit=True)
+
+        # Dispatcher가 node_stack을 소비하므로 저장본이 아닌 새 객체를 반환.
+        # 유사 쿼리라도 지역/법령 등 엔티티가 다를 수 있으므로 refined_query는 현재 쿼리를 사용
+        response: PlannerResponse = PlannerResponse.model_validate(entry.response)
+        response.refined_query = query
+        return response
+
+    async def put(self, query: str, feedback: str, response: PlannerResponse) -> None:
+        try:
+            vector: np.ndarray = await self._embed(query)
+        except Exception as e:
+            logger.warning(f"[PlanCache] embedding failed. error: {str(e)}")
+            return
+
+        now: float = time.monotonic()
+        self._evict_expired(now)
+
+        while len(self._entries) >= self.maxsize:
+            lru_idx: int = min(
+                range(len(self._entries)), key=lambda i: self._entries[i].last_used
+            )
+            self._remove(lru_idx)
+
+        self._entries.append(
+            _PlanEntry(
+                feedback_key=_feedback_key(feedback),
+                response=response.model_dump(mode="json"),
+                expires_at=now + self.ttl,
+                last_used=now,
+            )
+        )
+        self._vectors = (
+            vector[np.newaxis, :]
+            if self._vectors.size == 0
+            else np.vstack([self._vectors, vector])
+        )
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        now: float = time.monotonic()
+        if now - self._last_log >= self.log_interval:
+            self._last_log = now
+            logger.info(f"[PlanCache] stats: {self.stats()}")
+
+    async def _embed(self, query: str) -> np.ndarray:
+        normalized: str = _normalize(query)
+        vector: Optional[np.ndarray] = self._query_vectors.get(normalized)
+        if vector is not None:
+            return vector
+
+        raw: list[float] = await self.embeddings.aembed_query(normalized)
+        vector = np.asarray(raw, dtype=np.float32)
+        norm: float = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector = vector / norm
+
+        self._query_vectors.set(normalized, vector)
+        return vector
+
+    def _evict_expired(self, now: float) -> None:
+        for idx in range(len(self._entries) - 1, -1, -1):
+            if self._entries[idx].expires_at < now:
+                self._remove(idx)
+
+    def _remove(self, idx: int) -> None:
+        del self._entries[idx]
+        self._vectors = np.delete(self._vectors, idx, axis=0)
@@ -7,11 +7,23 @@ from .schema import (
     CircuitCheck,
 )
 from .state import AgentState, StateKey, StateManager
+from langgraph.types import Send
 
 
-def route_after_dispatcher(state: AgentState) -> NodeType:
+def route_after_dispatcher(state: AgentState) -> NodeType | list[Send]:
     sm: StateManager = StateManager(state=state)
-    return sm.next_node
+    next_node: NodeType = sm.next_node
+
+    if next_node == NodeType.PARALLEL_RETRIEVER:
+        return [
+            Send(
+                NodeType.PARALLEL_RETRIEVER,
+                {**state, StateKey.VERIFIER_TARGET_NODE: target},
+            )
+            for target in sm.parallel_targets
+        ]
+
+    return next_node
 
 
 def route_after_verifier(state: AgentState) -> NodeType:
@@ -10,12 +10,18 @@ class NodeType(StrEnum):
     HUMAN_REVIEWER = auto()
     LEGAL_RETRIEVER = auto()
     DOC_RETRIEVER = auto()
+    PARALLEL_RETRIEVER = auto()
     VERIFIER = auto()
     GENERATOR = auto()
     EVALUATOR = auto()
     FINALIZER = auto()
 
 
+RETRIEVER_NODES: Final[frozenset[NodeType]] = frozenset(
+    {NodeType.LEGAL_RETRIEVER, NodeType.DOC_RETRIEVER}
+)
+
+
 class PlannerResponse(BaseModel):
     refined_query: Optional[str] = Field(description="사용자 쿼리의 개선된 버전")
     intention: Optional[str] = Field(description="사용자의 의도 요약")
@@ -36,6 +42,17 @@ class PlannerResponse(BaseModel):
             raise ValueError("node_stack is empty.")
         return self.node_stack[0]
 
+    def pop_retriever_group(self) -> list[NodeType]:
+        """스택 앞쪽의 연속된 서로 다른 리트리버 노드를 한 번에 꺼냄"""
+        group: list[NodeType] = []
+        while (
+            self.node_stack
+            and self.node_stack[0] in RETRIEVER_NODES
+            and self.node_stack[0] not in group
+        ):
+            group.append(self.pop_stack())
+        return group
+
 
 class HumanAction(StrEnum):
     REPLAN = auto()
@@ -76,12 +93,22 @@ class LegalSearchQuery(BaseModel):
 
 class DocumentSearchQuery(BaseModel):
     query: str
+    sub_queries: list[str] = Field(
+        default_factory=list, description="질문의 다른 측면을 검색할 보조 검색 문장"
+    )
+
+
+class SafetyCheckReport(BaseModel):
+    name: str = Field(description="검사 이름")
+    finished: bool = Field(description="제한 시간 내 완료 여부")
+    elapsed_ms: float = Field(description="검사 소요 시간(ms)")
 
 
 class EvaluationResponse(BaseModel):
     is_secured: bool = Field(description="프롬프트 공격 여부")
     is_grounded: bool = Field(description="환각 여부")
     has_pii: bool = Field(description="개인정보 포함 여부")
+    checks: list[SafetyCheckReport] = Field(default=[], description="검사별 실행 결과")
 
     def is_safe(self):
         return self.is_secured and self.is_grounded and not self.has_pii
@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
+import asyncio
+import unicodedata
+import uuid
+
+import orjson
+
+from .cache import make_cache_key
+from .stream import StreamEvent, StreamEventType, error_event
+from .logger import logger
+
+EventSource = Callable[[], AsyncIterator[StreamEvent]]
+
+_DONE_FIELD: str = "done"
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", query or "").lower().split())
+
+
+def flight_key(query: str, persona: Optional[dict] = None) -> str:
+    return make_cache_key(
+        "singleflight", {"query": normalize_query(query), "persona": persona or {}}
+    )
+
+
+@dataclass
+class _Flight:
+    origin: dict
+    flight_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    events: list[StreamEvent] = field(default_factory=list)
+    done: bool = False
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    task: Optional[asyncio.Task] = None
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 그래프 실행을 하나로 합치는 single-flight 레이어.
+
+    리더는 백그라운드 태스크로 이벤트를 생성하고, 팔로워는 처음부터 같은 이벤트를 재생받는다.
+    redis_client가 주어지면 SET NX로 워커 간 리더를 정하고 Redis Stream으로 이벤트를 전달한다.
+    join()은 (event, origin)을 내보내며 origin은 팔로워일 때 리더가 등록한 식별 정보, 리더일 때 None이다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: float = 120.0,
+        block_ms: int = 1000,
+    ) -> None:
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.block_ms = block_ms
+        self._flights: dict[str, _Flight] = {}
+
+    async def join(
+        self, key: str, origin: dict, source: EventSource
+    ) -> AsyncIterator[tuple[StreamEvent, Optional[dict]]]:
+        flight: Optional[_Flight] = self._flights.get(key)
+        if flight is not None:
+            logger.debug(f"[SingleFlight] joined local flight. key: {key}")
+            async for event in self._replay(flight):
+                yield event, flight.origin
+            return
+
+        flight = _Flight(origin=origin)
+        owner: Optional[dict] = await self._claim(key, flight)
+        if owner is not None:
+            logger.debug(f"[SingleFlight] joined remote flight. key: {key}")
+            async for event in self._replay_remote(key, owner, source):
+                yield event
+            return
+
+        self._flights[key] = flight
+        flight.task = asyncio.create_task(self._lead(key, flight, source))
+
+        async for event in self._replay(flight):
+            yield event, None
+
+    async def _lead(self, key: str, flight: _Flight, source: EventSource) -> None:
+        # 리더 요청의 연결이 끊겨도 팔로워를 위해 끝까지 실행
+        try:
+            async for event in source():
+                await self._publish(key, flight, event)
+        except Exception as e:
+            logger.error(f"[SingleFlight] leader failed. error: {str(e)}")
+            await self._publish(key, flight, error_event(e))
+        finally:
+            async with flight.changed:
+                flight.done = True
+                flight.changed.notify_all()
+            self._flights.pop(key, None)
+            await self._finish_remote(key, flight.flight_id)
+
+    async def _publish(self, key: str, flight: _Flight, event: StreamEvent) -> None:
+        async with flight.changed:
+            flight.events.append(event)
+            flight.changed.notify_all()
+
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.xadd(
+                self._stream_key(key, flight.flight_id),
+                {"event": event.event, "data": orjson.dumps(event.data).decode()},
+            )
+        except Exception as e:
+            logger.warning(f"[SingleFlight] redis publish failed. error: {str(e)}")
+
+    async def _replay(self, flight: _Flight) -> AsyncIterator[StreamEvent]:
+        cursor: int = 0
+        while True:
+            async with flight.changed:
+                await flight.changed.wait_for(
+                    lambda: len(flight.events) > cursor or flight.done
+                )
+                batch: list[StreamEvent] = flight.events[cursor:]
+                done: bool = flight.done
+
+            cursor += len(batch)
+            for event in batch:
+                yield event
+            if done and cursor >= len(flight.events):
+                return
+
+    async def _claim(self, key: str, flight: _Flight) -> Optional[dict]:
+        """리더 자리를 선점하면 None, 다른 워커가 리더면 그 owner 정보(origin, flight_id)를 반환"""
+        if self.redis_client is None:
+            return None
+        try:
+            claimed = await self.redis_client.set(
+                self._owner_key(key),
+                orjson.dumps(
+                    {"origin": flight.origin, "flight_id": flight.flight_id}
+                ).decode(),
+                nx=True,
+                px=int(self.ttl * 1000),
+            )
+            if claimed:
+                return None
+            owner = await self.redis_client.get(self._owner_key(key))
+            return orjson.loads(owner) if owner else None
+        except Exception as e:
+            logger.warning(f"[SingleFlight] redis claim failed. error: {str(e)}")
+            return None
+
+    async def _replay_remote(
+        self, key: str, owner: dict, source: EventSource
+    ) -> AsyncIterator[tuple[StreamEvent, Optional[dict]]]:
+        origin: dict = owner["origin"]
+        stream_key: str = self._stream_key(key, owner["flight_id"])
+        last_id: str = "0-0"
+        received: int = 0
+        deadline: float = asyncio.get_running_loop().time() + self.ttl
+
+        while asyncio.get_running_loop().time() < deadline:
+            try:
+                response = await self.redis_client.xread(
+                    {stream_key: last_id}, block=self.block_ms
+                )
+                if not response and not await self.redis_client.exists(
+                    self._owner_key(key)
+                ):
+                    break
+            except Exception as e:
+                logger.warning(f"[SingleFlight] redis read failed. error: {str(e)}")
+                break
+
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    if fields.get(_DONE_FIELD):
+                        return
+                    received += 1
+                    yield StreamEvent(
+                        StreamEventType(fields["event"]), orjson.loads(fields["data"])
+                    ), origin
+
+        # 리더가 사라졌는데 아직 받은 이벤트가 없으면 직접 실행
+        if received == 0:
+            logger.warning(f"[SingleFlight] remote leader lost. key: {key}")
+            async for event in source():
+                yield event, None
+        else:
+            yield error_event(TimeoutError("single-flight leader lost.")), origin
+
+    async def _finish_remote(self, key: str, flight_id: str) -> None:
+        if self.redis_client is None:
+            return
+        stream_key: str = self._stream_key(key, flight_id)
+        try:
+            await self.redis_client.xadd(stream_key, {_DONE_FIELD: "1"})
+            # 늦게 합류한 팔로워가 재생할 수 있도록 스트림은 잠시 유지
+            await self.redis_client.expire(stream_key, int(self.ttl))
+            await self.redis_client.delete(self._owner_key(key))
+        except Exception as e:
+            logger.warning(f"[SingleFlight] redis finish failed. error: {str(e)}")
+
+    @staticmethod
+    def _owner_key(key: str) -> str:
+        return f"{key}:owner"
+
+    @staticmethod
+    def _stream_key(key: str, flight_id: str) -> str:
+        return f"{key}:{flight_id}:events"
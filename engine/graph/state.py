@@ -1,4 +1,6 @@
 from typing import TypedDict, Annotated, List, Optional, Any, TypeVar, Type, cast
+from collections.abc import Iterator, Mapping, Sequence
+from types import MappingProxyType
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 import operator
@@ -26,6 +28,23 @@ def merge_docs(existing: dict | None, new: dict | None) -> dict:
     return {**existing, **new}
 
 
+def merge_circuit(
+    existing: CircuitCheck | dict | None, new: CircuitCheck | dict | None
+) -> CircuitCheck | None:
+    """노드별 카운트 단위로 병합하여 병렬 브랜치가 각자의 카운트만 갱신할 수 있도록 함"""
+    if new is None:
+        return None
+    new_check: CircuitCheck = CircuitCheck.model_validate(new)
+    if existing is None:
+        return new_check
+    existing_check: CircuitCheck = CircuitCheck.model_validate(existing)
+    return new_check.model_copy(
+        update={
+            "circuit_stat": {**existing_check.circuit_stat, **new_check.circuit_stat}
+        }
+    )
+
+
 class AgentState(TypedDict, total=False):
     messages: Annotated[List[BaseMessage], add_messages]
     errors: Optional[str]
@@ -33,11 +52,13 @@ class AgentState(TypedDict, total=False):
     planner_response: Optional[PlannerResponse]
     next_node: Optional[NodeType]
     verifier_target_node: Optional[NodeType]
-    circuit_check: Optional[CircuitCheck]
+    parallel_targets: Optional[list[NodeType]]
+    circuit_check: Annotated[Optional[CircuitCheck], merge_circuit]
     human_feedback: Optional[HumanFeedback]
     is_verified: Optional[bool]
     evaluation_response: Optional[EvaluationResponse]
     answer: Optional[str]
+    history_summary: Optional[str]
     retrieved_docs: Annotated[dict[str, RetrievedValue], merge_docs]
     api_args: Annotated[dict[str, dict], merge_docs]
 
@@ -49,11 +70,13 @@ class StateKey(StrEnum):
     PLANNER_RESPONSE = "planner_response"
     NEXT_NODE = "next_node"
     VERIFIER_TARGET_NODE = "verifier_target_node"
+    PARALLEL_TARGETS = "parallel_targets"
     CIRCUIT_CHECK = "circuit_check"
     HUMAN_FEEDBACK = "human_feedback"
     IS_VERIFIED = "is_verified"
     EVALUATION_RESPONSE = "evaluation_response"
     ANSWER = "answer"
+    HISTORY_SUMMARY = "history_summary"
     RETRIEVED_DOCS = "retrieved_docs"
     API_ARGS = "api_args"
 
@@ -61,10 +84,41 @@ class StateKey(StrEnum):
 T = TypeVar("T")
 
 
+class MessagesView(Sequence[BaseMessage]):
+    """복사 없이 messages 리스트를 읽기 전용으로 노출"""
+
+    __slots__ = ("_messages",)
+
+    def __init__(self, messages: List[BaseMessage]) -> None:
+        self._messages = messages
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._messages[index]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        return iter(self._messages)
+
+    def __repr__(self) -> str:
+        return repr(self._messages)
+
+
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
 class StateManager:
+    """
+    AgentState 읽기 전용 접근자.
+
+    pydantic 모델 키는 인스턴스당 한 번만 변환하여 캐시하며,
+    컨테이너는 복사 대신 읽기 전용 뷰(MessagesView, MappingProxyType)로 반환한다.
+    """
 
     def __init__(self, state: AgentState):
         self._state = state
+        self._models: dict[str, Any] = {}
 
     _TYPE_MAP: dict[str, Type[BaseModel]] = {
         StateKey.PLANNER_RESPONSE: PlannerResponse,
@@ -75,23 +129,21 @@ class StateManager:
 
     def _get_as_model(self, key: str) -> Any:
         """딕셔너리 데이터를 매핑 테이블에 정의된 파이댄틱 모델로 변환"""
-        raw_data = self._state.get(key)
-
-        if raw_data is None:
-            return None
+        if key in self._models:
+            return self._models[key]
 
+        raw_data = self._state.get(key)
         model_cls = self._TYPE_MAP.get(key)
 
-        if model_cls:
-            if isinstance(raw_data, dict):
-                return model_cls.model_validate(raw_data)
-            return raw_data
+        if model_cls and isinstance(raw_data, dict):
+            raw_data = model_cls.model_validate(raw_data)
 
+        self._models[key] = raw_data
         return raw_data
 
     @property
-    def messages(self) -> List[BaseMessage]:
-        return self._state.get(StateKey.MESSAGES, []).copy()
+    def messages(self) -> MessagesView:
+        return MessagesView(self._state.get(StateKey.MESSAGES) or [])
 
     @property
     def errors(self) -> str:
@@ -107,9 +159,10 @@ class StateManager:
 
     @property
     def refined_query(self) -> str:
+        planner_response: PlannerResponse | None = self.planner_response
         return (
-            self.planner_response.refined_query
-            if self.planner_response and self.planner_response.refined_query
+            planner_response.refined_query
+            if planner_response and planner_response.refined_query
             else ""
         )
 
@@ -127,6 +180,10 @@ class StateManager:
             raise ValueError("target_node is None.")
         return NodeType(val)
 
+    @property
+    def parallel_targets(self) -> list[NodeType]:
+        return [NodeType(t) for t in self._state.get(StateKey.PARALLEL_TARGETS) or []]
+
     @property
     def circuit_check(self) -> CircuitCheck:
         obj: CircuitCheck | None = self._get_as_model(StateKey.CIRCUIT_CHECK)
@@ -161,9 +218,15 @@ class StateManager:
         return self._state.get(StateKey.ANSWER, "")
 
     @property
-    def retrieved_docs(self) -> dict[str, RetrievedValue]:
-        return self._state.get(StateKey.RETRIEVED_DOCS, {}).copy()
+    def history_summary(self) -> str | None:
+        return self._state.get(StateKey.HISTORY_SUMMARY)
+
+    @property
+    def retrieved_docs(self) -> Mapping[str, RetrievedValue]:
+        docs = self._state.get(StateKey.RETRIEVED_DOCS)
+        return MappingProxyType(docs) if docs else _EMPTY_MAPPING
 
     @property
-    def api_args(self) -> dict[str, dict]:
-        return self._state.get(StateKey.API_ARGS, {}).copy()
+    def api_args(self) -> Mapping[str, dict]:
+        args = self._state.get(StateKey.API_ARGS)
+        return MappingProxyType(args) if args else _EMPTY_MAPPING
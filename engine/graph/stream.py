@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from enum import StrEnum, auto
+from typing import Any, Optional
+
+import orjson
+from langgraph.types import StateSnapshot
+
+from .schema import NodeType
+from .state import StateKey
+
+# tasks: 노드 시작/종료, custom: 노드가 stream writer로 직접 내보내는 답변 델타
+# messages 모드는 모든 LLM 호출에 스트리밍 콜백을 붙이고 구조화 출력의 원시 JSON을 흘리므로 사용하지 않음
+STREAM_MODES: list[str] = ["tasks", "custom"]
+
+# 토큰을 사용자에게 노출하는 노드 (Planner, ToolNode 인자 생성 등 내부 LLM 호출은 제외)
+TOKEN_NODES: frozenset[str] = frozenset({NodeType.GENERATOR})
+# 보류한 토큰의 공개 여부를 판정하는 노드. PII 마스킹/PromptGuard 검사 전의 원문은 내보내지 않음
+TOKEN_GATE_NODE: str = NodeType.EVALUATOR
+
+
+class StreamEventType(StrEnum):
+    NODE_START = auto()
+    NODE_END = auto()
+    TOKEN = auto()
+    INTERRUPT = auto()
+    FINAL = auto()
+    ERROR = auto()
+
+
+TERMINAL_EVENTS: frozenset[StreamEventType] = frozenset(
+    {StreamEventType.INTERRUPT, StreamEventType.FINAL}
+)
+
+
+@dataclass(slots=True)
+class StreamEvent:
+    event: StreamEventType
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def encode(self) -> bytes:
+        """SSE 프레임(`event:`/`data:`)으로 직렬화"""
+        return (
+            b"event: "
+            + self.event.encode()
+            + b"\ndata: "
+            + orjson.dumps(self.data)
+            + b"\n\n"
+        )
+
+
+def to_stream_event(mode: str, chunk: Any) -> Optional[StreamEvent]:
+    """astream 청크를 외부 이벤트로 변환. 노출 대상이 아니면 None"""
+    if mode == "tasks":
+        if "input" in chunk:
+            return StreamEvent(StreamEventType.NODE_START, {"node": chunk["name"]})
+        data: dict[str, Any] = {"node": chunk["name"]}
+        if chunk.get("error"):
+            data["error"] = str(chunk["error"])
+        return StreamEvent(StreamEventType.NODE_END, data)
+
+    if mode == "custom":
+        if not isinstance(chunk, dict) or chunk.get("node") not in TOKEN_NODES:
+            return None
+        delta = chunk.get("delta")
+        if not isinstance(delta, str) or not delta:
+            return None
+        return StreamEvent(StreamEventType.TOKEN, {"delta": delta})
+
+    return None
+
+
+class TokenGate:
+    """
+    Generator 토큰을 Evaluator 판정까지 보류하는 필터.
+
+    Evaluator가 답변을 바꾸지 않고(마스킹 없음) 안전하다고 판정한 경우에만 보류한 토큰을 내보내고,
+    그렇지 않으면 버린다. 이 경우 클라이언트에는 final 이벤트의 검사된 답변만 전달된다.
+    Generator가 다시 실행되면(재시도) 이전 시도의 토큰은 버린다.
+    """
+
+    def __init__(self) -> None:
+        self._held: list[StreamEvent] = []
+
+    def feed(self, mode: str, chunk: Any) -> list[StreamEvent]:
+        event: Optional[StreamEvent] = to_stream_event(mode, chunk)
+        if event is None:
+            return []
+        if event.event == StreamEventType.TOKEN:
+            self._held.append(event)
+            return []
+
+        if event.event == StreamEventType.NODE_START and chunk["name"] in TOKEN_NODES:
+            self._held = []
+        elif (
+            event.event == StreamEventType.NODE_END and chunk["name"] == TOKEN_GATE_NODE
+        ):
+            held, self._held = self._held, []
+            if self._approved(held, chunk.get("result") or {}):
+                return [event, *held]
+        return [event]
+
+    @staticmethod
+    def _approved(held: list[StreamEvent], result: dict) -> bool:
+        if not held:
+            return False
+        evaluation = result.get(StateKey.EVALUATION_RESPONSE)
+        if evaluation is None or not evaluation.is_safe():
+            return False
+        return result.get(StateKey.ANSWER) == "".join(e.data["delta"] for e in held)
+
+
+def terminal_event(snapshot: StateSnapshot) -> StreamEvent:
+    """스트림 종료 후 스냅샷으로 interrupt/final 여부를 판단"""
+    if snapshot.next:
+        return StreamEvent(StreamEventType.INTERRUPT, {"next": list(snapshot.next)})
+    return StreamEvent(
+        StreamEventType.FINAL, {"answer": snapshot.values.get(StateKey.ANSWER)}
+    )
+
+
+def error_event(error: Exception) -> StreamEvent:
+    return StreamEvent(StreamEventType.ERROR, {"message": str(error)})
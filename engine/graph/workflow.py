@@ -1,6 +1,7 @@
 from langgraph.graph import StateGraph
 from langgraph.graph import StateGraph, END
 from langchain_core.language_models import BaseChatModel
+from typing import Optional
 
 from .state import AgentState, StateKey
 from .router import (
@@ -17,28 +18,69 @@ from .nodes.dispatcher import Dispatcher
 from .nodes.human_reviewer import HumanReviewer
 from .nodes.planner import Planner
 from .nodes.verifier import Verifier
+from .nodes.parallel_retriever import ParallelRetriever
 from .nodes.generator import Generator
 from .nodes.evaluator import Evaluator
 from .nodes.finalizer import Finalizer
+from ..security.privacy import PrivacyService
+from ..security.guard import PromptGuard
+from ..retrieval.law_client import LawApiClient
+from ..retrieval.law_mirror import LawMirror
+from ..retrieval.doc_search import DocumentSearch
+from .plan_cache import PlanCache
+from .history import HistoryCompactor
+from .config import config_settings
 
 
-def build_workflow(llm_map: dict[NodeType, BaseChatModel]) -> StateGraph:
+def build_workflow(
+    llm_map: dict[NodeType, BaseChatModel],
+    privacy_service: Optional[PrivacyService] = None,
+    prompt_guard: Optional[PromptGuard] = None,
+    law_client: Optional[LawApiClient] = None,
+    law_mirror: Optional[LawMirror] = None,
+    doc_search: Optional[DocumentSearch] = None,
+    plan_cache: Optional[PlanCache] = None,
+    parallel_dispatch: bool = False,
+) -> StateGraph:
     workflow: StateGraph = StateGraph(AgentState)
 
-    initializer: Initializer = Initializer()
-    planner: Planner = Planner(llm=llm_map[NodeType.PLANNER])
-    dispatcher: Dispatcher = Dispatcher()
+    prompt_guard = prompt_guard or PromptGuard()
+
+    initializer: Initializer = Initializer(prompt_guard=prompt_guard)
+    planner: Planner = Planner(llm=llm_map[NodeType.PLANNER], plan_cache=plan_cache)
+    dispatcher: Dispatcher = Dispatcher(parallel=parallel_dispatch)
     legal_retriever: LegalRetriever = LegalRetriever(
-        llm=llm_map[NodeType.LEGAL_RETRIEVER]
+        llm=llm_map[NodeType.LEGAL_RETRIEVER],
+        law_client=law_client,
+        law_mirror=law_mirror,
     )
     doc_retriever: DocumentsRetriever = DocumentsRetriever(
-        llm=llm_map[NodeType.DOC_RETRIEVER]
+        llm=llm_map[NodeType.DOC_RETRIEVER], doc_search=doc_search
+    )
+    human_reviewer: HumanReviewer = HumanReviewer(
+        llm=llm_map[NodeType.HUMAN_REVIEWER], prompt_guard=prompt_guard
+    )
+    verifier: Verifier = Verifier(prompt_guard=prompt_guard)
+    parallel_retriever: ParallelRetriever = ParallelRetriever(
+        retrievers={
+            NodeType.LEGAL_RETRIEVER: legal_retriever,
+            NodeType.DOC_RETRIEVER: doc_retriever,
+        },
+        verifier=verifier,
     )
-    human_reviewer: HumanReviewer = HumanReviewer(llm=llm_map[NodeType.HUMAN_REVIEWER])
-    verifier: Verifier = Verifier()
     generator: Generator = Generator(llm=llm_map[NodeType.GENERATOR])
-    evaluator: Evaluator = Evaluator()
-    finalizer: Finalizer = Finalizer()
+    evaluator: Evaluator = Evaluator(
+        prompt_guard=prompt_guard,
+        privacy_service=privacy_service or PrivacyService(),
+    )
+    finalizer: Finalizer = Finalizer(
+        compactor=HistoryCompactor(
+            llm=llm_map.get(NodeType.FINALIZER, llm_map[NodeType.GENERATOR]),
+            keep_turns=config_settings.HISTORY_KEEP_TURNS,
+            char_budget=config_settings.HISTORY_CHAR_BUDGET,
+            summary_max_chars=config_settings.HISTORY_SUMMARY_MAX_CHARS,
+        )
+    )
 
     workflow.add_node(NodeType.INITIALIZER, initializer)
     workflow.add_node(NodeType.PLANNER, planner)
@@ -46,6 +88,7 @@ def build_workflow(llm_map: dict[NodeType, BaseChatModel]) -> StateGraph:
     workflow.add_node(NodeType.LEGAL_RETRIEVER, legal_retriever)
     workflow.add_node(NodeType.DOC_RETRIEVER, doc_retriever)
     workflow.add_node(NodeType.HUMAN_REVIEWER, human_reviewer)
+    workflow.add_node(NodeType.PARALLEL_RETRIEVER, parallel_retriever)
     workflow.add_node(NodeType.VERIFIER, verifier)
     workflow.add_node(NodeType.GENERATOR, generator)
     workflow.add_node(NodeType.EVALUATOR, evaluator)
@@ -62,6 +105,7 @@ def build_workflow(llm_map: dict[NodeType, BaseChatModel]) -> StateGraph:
         {
             NodeType.LEGAL_RETRIEVER: NodeType.LEGAL_RETRIEVER,
             NodeType.DOC_RETRIEVER: NodeType.DOC_RETRIEVER,
+            NodeType.PARALLEL_RETRIEVER: NodeType.PARALLEL_RETRIEVER,
             NodeType.GENERATOR: NodeType.GENERATOR,
             NodeType.HUMAN_REVIEWER: NodeType.HUMAN_REVIEWER,
             NodeType.FINALIZER: NodeType.FINALIZER,
@@ -70,6 +114,7 @@ def build_workflow(llm_map: dict[NodeType, BaseChatModel]) -> StateGraph:
 
     workflow.add_edge(NodeType.LEGAL_RETRIEVER, NodeType.VERIFIER)
     workflow.add_edge(NodeType.DOC_RETRIEVER, NodeType.VERIFIER)
+    workflow.add_edge(NodeType.PARALLEL_RETRIEVER, NodeType.DISPATCHER)
 
     workflow.add_conditional_edges(
         NodeType.VERIFIER,
@@ -0,0 +1,232 @@
+import math
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Callable, Optional, Sequence, cast
+
+import numpy as np
+import orjson
+import xxhash
+
+from ..graph.logger import logger
+
+Tokenizer = Callable[[str], list[str]]
+
+
+def doc_key(payload: dict) -> str:
+    """payload 내용의 해시. 벡터 검색 결과와 BM25 결과를 같은 문서로 묶는 키"""
+    return xxhash.xxh3_64_hexdigest(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+
+
+class BM25Index:
+    """
+    증분 갱신 가능한 BM25 역색인.
+
+    포스팅은 용어별 array('I')(문서 번호, 빈도) 쌍으로 두고, 저장 시에는 CSR 형태의 uint32 배열로 직렬화한다.
+    같은 키의 문서를 다시 추가하면 이전 문서 번호를 삭제 표시하고 새 번호를 붙이며,
+    삭제 표시 비율이 compact_ratio를 넘으면 포스팅을 다시 만들어 공간을 회수한다.
+    검색은 스레드 풀에서 실행되므로 색인 변경과 점수 계산은 같은 락으로 직렬화하고,
+    토크나이즈는 락 밖에서 수행한다.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        text_field: str = "content",
+        k1: float = 1.2,
+        b: float = 0.75,
+        compact_ratio: float = 0.2,
+    ) -> None:
+        self.tokenizer = tokenizer
+        self.text_field = text_field
+        self.k1 = k1
+        self.b = b
+        self.compact_ratio = compact_ratio
+
+        self._vocab: dict[str, int] = {}
+        self._postings_docs: list[array] = []
+        self._postings_tfs: list[array] = []
+        self._doc_lens: array = array("I")
+        self._dead: bytearray = bytearray()
+        self._payloads: list[Optional[dict]] = []
+        self._doc_ids: dict[str, int] = {}
+        self._total_len: int = 0
+        self._lock = threading.RLock()
+        self.dirty: bool = False
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def add(
+        self, payloads: Sequence[dict], tokens: Optional[list[list[str]]] = None
+    ) -> int:
+        """payload[text_field]를 색인. tokens를 넘기면 토크나이저 호출을 생략(배치 토크나이즈용)"""
+        if tokens is None:
+            tokens = [self.tokenizer(p.get(self.text_field) or "") for p in payloads]
+
+        with self._lock:
+            for payload, terms in zip(payloads, tokens):
+                key: str = doc_key(payload)
+                self._remove(key)
+
+                doc_id: int = len(self._payloads)
+                self._payloads.append(payload)
+                self._doc_lens.append(len(terms))
+                self._dead.append(0)
+                self._doc_ids[key] = doc_id
+                self._total_len += len(terms)
+
+                counts: dict[str, int] = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    term_id: int = self._term_id(term)
+                    self._postings_docs[term_id].append(doc_id)
+                    self._postings_tfs[term_id].append(tf)
+
+            self.dirty = True
+            if self._dead_ratio() > self.compact_ratio:
+                self.compact()
+        return len(payloads)
+
+    def remove(self, payloads: Sequence[dict]) -> None:
+        with self._lock:
+            for payload in payloads:
+                self._remove(doc_key(payload))
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[dict, float]]:
+        terms: set[str] = set(self.tokenizer(query))
+        with self._lock:
+            return self._search(terms, limit)
+
+    def _search(self, terms: set[str], limit: int) -> list[tuple[dict, float]]:
+        live: int = len(self._doc_ids)
+        if not live:
+            return []
+
+        avg_len: float = self._total_len / live
+        doc_lens: np.ndarray = np.frombuffer(self._doc_lens, dtype=np.uint32)
+        dead: np.ndarray = np.frombuffer(self._dead, dtype=np.bool_)
+        scores: np.ndarray = np.zeros(len(self._payloads), dtype=np.float32)
+
+        for term in terms:
+            term_id: Optional[int] = self._vocab.get(term)
+            if term_id is None:
+                continue
+            docs = np.frombuffer(self._postings_docs[term_id], dtype=np.uint32)
+            tfs = np.frombuffer(self._postings_tfs[term_id], dtype=np.uint32).astype(
+                np.float32
+            )
+            df: int = len(docs) - int(np.count_nonzero(dead[docs]))
+            idf: float = math.log(1 + (live - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * doc_lens[docs] / avg_len)
+            scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm)
+
+        scores[dead] = 0
+        candidates: np.ndarray = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit)[:limit]
+            candidates = candidates[top]
+        ranked = candidates[np.argsort(-scores[candidates])]
+        return [(cast(dict, self._payloads[i]), float(scores[i])) for i in ranked]
+
+    def compact(self) -> None:
+        """삭제 표시된 문서를 포스팅에서 제거하고 문서 번호를 다시 매김 (재토크나이즈 없음)"""
+        with self._lock:
+            alive: np.ndarray = ~np.frombuffer(self._dead, dtype=np.bool_)
+            remap: np.ndarray = (np.cumsum(alive) - 1).astype(np.uint32)
+
+            for term_id in range(len(self._postings_docs)):
+                docs = np.frombuffer(self._postings_docs[term_id], dtype=np.uint32)
+                tfs = np.frombuffer(self._postings_tfs[term_id], dtype=np.uint32)
+                keep = alive[docs]
+                self._postings_docs[term_id] = array("I", remap[docs[keep]].tobytes())
+                self._postings_tfs[term_id] = array("I", tfs[keep].tobytes())
+
+            doc_lens = np.frombuffer(self._doc_lens, dtype=np.uint32)[alive]
+            self._doc_lens = array("I", doc_lens.tobytes())
+            self._payloads = [p for p in self._payloads if p is not None]
+            self._dead = bytearray(len(self._payloads))
+            self._doc_ids = {doc_key(p): i for i, p in enumerate(self._payloads)}
+            # 모든 문서가 사라진 용어는 남겨 두어도 점수에 영향이 없으므로 어휘는 유지
+            logger.debug(f"[BM25Index] compacted. docs: {len(self._payloads)}")
+
+    def save(self, path: str) -> None:
+        """CSR 형태로 저장. 임시 파일에 쓴 뒤 교체하므로 저장 중 중단되어도 기존 파일은 유지됨"""
+        target: str = path if path.endswith(".npz") else f"{path}.npz"
+        tmp: str = f"{target[: -len('.npz')]}.tmp.npz"
+        with self._lock:
+            offsets = np.zeros(len(self._vocab) + 1, dtype=np.uint64)
+            offsets[1:] = np.cumsum([len(p) for p in self._postings_docs])
+            np.savez(
+                tmp,
+                terms=np.frombuffer(orjson.dumps(list(self._vocab)), dtype=np.uint8),
+                payloads=np.frombuffer(orjson.dumps(self._payloads), dtype=np.uint8),
+                offsets=offsets,
+                docs=np.frombuffer(
+                    b"".join(p.tobytes() for p in self._postings_docs), dtype=np.uint32
+                ),
+                tfs=np.frombuffer(
+                    b"".join(p.tobytes() for p in self._postings_tfs), dtype=np.uint32
+                ),
+                doc_lens=np.array(self._doc_lens, dtype=np.uint32),
+            )
+            self.dirty = False
+        os.replace(tmp, target)
+
+    def save_if_dirty(self, path: str) -> bool:
+        """마지막 저장 이후 변경이 있을 때만 저장 (종료 훅용)"""
+        if not self.dirty:
+            return False
+        self.save(path)
+        logger.info(f"[BM25Index] saved. docs: {len(self)}, path: {path}")
+        return True
+
+    @classmethod
+    def load(cls, path: str, tokenizer: Tokenizer, **kwargs) -> "BM25Index":
+        index = cls(tokenizer, **kwargs)
+        with np.load(path if path.endswith(".npz") else f"{path}.npz") as data:
+            terms: list[str] = orjson.loads(data["terms"].tobytes())
+            index._payloads = orjson.loads(data["payloads"].tobytes())
+            offsets, docs, tfs = data["offsets"], data["docs"], data["tfs"]
+            index._doc_lens = array("I", data["doc_lens"].tobytes())
+        index._dead = bytearray(p is None for p in index._payloads)
+
+        for term_id, term in enumerate(terms):
+            start, end = int(offsets[term_id]), int(offsets[term_id + 1])
+            index._vocab[term] = term_id
+            index._postings_docs.append(array("I", docs[start:end].tobytes()))
+            index._postings_tfs.append(array("I", tfs[start:end].tobytes()))
+
+        for doc_id, payload in enumerate(index._payloads):
+            if payload is not None:
+                index._doc_ids[doc_key(payload)] = doc_id
+                index._total_len += index._doc_lens[doc_id]
+        return index
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return Path(path if path.endswith(".npz") else f"{path}.npz").exists()
+
+    def _term_id(self, term: str) -> int:
+        term_id: Optional[int] = self._vocab.get(term)
+        if term_id is None:
+            term_id = self._vocab[term] = len(self._postings_docs)
+            self._postings_docs.append(array("I"))
+            self._postings_tfs.append(array("I"))
+        return term_id
+
+    def _remove(self, key: str) -> None:
+        doc_id: Optional[int] = self._doc_ids.pop(key, None)
+        if doc_id is None:
+            return
+        self.dirty = True
+        # 포스팅에서 바로 지우지 않고 삭제 표시만 남김 (검색 시 점수를 0으로 처리)
+        self._payloads[doc_id] = None
+        self._dead[doc_id] = 1
+        self._total_len -= self._doc_lens[doc_id]
+
+    def _dead_ratio(self) -> float:
+        total: int = len(self._payloads)
+        return (total - len(self._doc_ids)) / total if total else 0.0
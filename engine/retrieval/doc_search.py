@@ -0,0 +1,159 @@
+from typing import Awaitable, Callable, Optional
+import asyncio
+
+from langchain_core.embeddings import Embeddings
+
+from .bm25 import BM25Index, doc_key
+from ..graph.logger import logger
+
+SearchFn = Callable[[str, list[float], int], Awaitable[list[dict]]]
+BatchSearchFn = Callable[[str, list[list[float]], int], Awaitable[list[list[dict]]]]
+
+DOCUMENTS_KEY: str = "documents"
+
+
+class DocumentSearch:
+    """
+    쿼리를 임베딩한 뒤 벡터 DB 유사도 검색을 수행하는 문서 검색기.
+
+    search_fn은 (collection_name, query_vector, limit) -> payload 목록 형태이며
+    서버의 search_similar_docs를 주입받아 엔진이 저장소 구현에 의존하지 않도록 한다.
+    batch_search_fn이 주어지면 search_many의 여러 쿼리 벡터를 한 번의 요청으로 검색한다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        search_fn: SearchFn,
+        collection_name: str,
+        limit: int = 5,
+        batch_search_fn: Optional[BatchSearchFn] = None,
+        max_queries: int = 4,
+        rrf_k: int = 60,
+    ) -> None:
+        self.embeddings = embeddings
+        self.search_fn = search_fn
+        self.collection_name = collection_name
+        self.limit = limit
+        self.batch_search_fn = batch_search_fn
+        self.max_queries = max_queries
+        self.rrf_k = rrf_k
+
+    async def search(self, query: str) -> dict:
+        vector: list[float] = await self.embeddings.aembed_query(query)
+        documents: list[dict] = await self.search_fn(
+            self.collection_name, vector, self.limit
+        )
+        logger.debug(
+            f"[DocumentSearch] {len(documents)} documents found. query: {query}"
+        )
+        return {DOCUMENTS_KEY: documents}
+
+    async def search_many(self, queries: list[str]) -> dict:
+        """관련 쿼리 여러 개를 한 번에 검색하고 쿼리별 결과를 RRF로 합쳐 중복 문서를 제거"""
+        queries = list(dict.fromkeys(q for q in queries if q.strip()))[
+            : self.max_queries
+        ]
+        if len(queries) <= 1:
+            return await self.search(queries[0] if queries else "")
+
+        rankings: list[list[dict]] = await self._rankings(queries)
+        documents: list[dict] = reciprocal_rank_fusion(
+            rankings, k=self.rrf_k, limit=self.limit
+        )
+        logger.debug(
+            f"[{type(self).__name__}] {len(queries)} queries, "
+            f"{sum(map(len, rankings))} hits, fused: {len(documents)}. "
+            f"queries: {queries}"
+        )
+        return {DOCUMENTS_KEY: documents}
+
+    async def _rankings(self, queries: list[str]) -> list[list[dict]]:
+        return await self._dense_many(queries, self.limit)
+
+    async def _dense_many(self, queries: list[str], limit: int) -> list[list[dict]]:
+        vectors: list[list[float]] = list(
+            await asyncio.gather(*(self.embeddings.aembed_query(q) for q in queries))
+        )
+        if self.batch_search_fn is not None:
+            return await self.batch_search_fn(self.collection_name, vectors, limit)
+        return list(
+            await asyncio.gather(
+                *(self.search_fn(self.collection_name, v, limit) for v in vectors)
+            )
+        )
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[dict]], k: int = 60, limit: Optional[int] = None
+) -> list[dict]:
+    """여러 순위 목록을 RRF(score = Σ 1 / (k + rank))로 합침. 같은 문서는 payload 해시로 식별"""
+    scores: dict[str, float] = {}
+    payloads: dict[str, dict] = {}
+    for ranking in rankings:
+        for rank, payload in enumerate(ranking, start=1):
+            key: str = doc_key(payload)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            payloads.setdefault(key, payload)
+
+    ordered: list[str] = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [payloads[key] for key in ordered[:limit]]
+
+
+class HybridDocumentSearch(DocumentSearch):
+    """
+    벡터 검색과 BM25(형태소 토큰) 검색 결과를 RRF로 합치는 하이브리드 문서 검색기.
+
+    단지명, 지번, 법령 조항처럼 정확히 일치해야 하는 토큰은 BM25가, 의미 유사도는 벡터 검색이 담당한다.
+    각 검색기에서 candidates개씩 후보를 받아 융합한 뒤 상위 limit개만 반환한다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        search_fn: SearchFn,
+        collection_name: str,
+        bm25: BM25Index,
+        limit: int = 5,
+        candidates: int = 20,
+        rrf_k: int = 60,
+        batch_search_fn: Optional[BatchSearchFn] = None,
+        max_queries: int = 4,
+    ) -> None:
+        super().__init__(
+            embeddings,
+            search_fn,
+            collection_name,
+            limit,
+            batch_search_fn=batch_search_fn,
+            max_queries=max_queries,
+            rrf_k=rrf_k,
+        )
+        self.bm25 = bm25
+        self.candidates = candidates
+
+    async def search(self, query: str) -> dict:
+        vector: list[float] = await self.embeddings.aembed_query(query)
+        dense, lexical = await asyncio.gather(
+            self.search_fn(self.collection_name, vector, self.candidates),
+            # spaCy 형태소 분석과 점수 계산은 CPU 바운드
+            asyncio.to_thread(self.bm25.search, query, self.candidates),
+        )
+
+        documents: list[dict] = reciprocal_rank_fusion(
+            [dense, [payload for payload, _ in lexical]],
+            k=self.rrf_k,
+            limit=self.limit,
+        )
+        logger.debug(
+            f"[HybridDocumentSearch] dense: {len(dense)}, lexical: {len(lexical)}, "
+            f"fused: {len(documents)}. query: {query}"
+        )
+        return {DOCUMENTS_KEY: documents}
+
+    async def _rankings(self, queries: list[str]) -> list[list[dict]]:
+        dense, *lexical = await asyncio.gather(
+            self._dense_many(queries, self.candidates),
+            *(asyncio.to_thread(self.bm25.search, q, self.candidates) for q in queries),
+        )
+        return [*dense, *([payload for payload, _ in hits] for hits in lexical)]
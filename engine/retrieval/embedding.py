@@ -0,0 +1,144 @@
+import asyncio
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import xxhash
+from langchain_core.embeddings import Embeddings
+
+from ..graph.cache import LRUCache
+from ..graph.logger import logger
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+class OnnxEmbedder(Embeddings):
+    """
+    ONNX Runtime으로 실행하는 로컬 CPU 문장 인코더 (mean pooling + L2 정규화).
+
+    model_dir에는 model.onnx와 tokenizer.json이 있어야 하며, E5 계열처럼 접두어가 필요한 모델은
+    query_prefix/passage_prefix로 지정한다.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        max_length: int = 256,
+        query_prefix: str = "",
+        passage_prefix: str = "",
+        intra_op_threads: Optional[int] = None,
+    ) -> None:
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        path = Path(model_dir)
+        self.query_prefix = query_prefix
+        self.passage_prefix = passage_prefix
+
+        self.tokenizer = Tokenizer.from_file(str(path / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(path / "model.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names: set[str] = {i.name for i in self.session.get_inputs()}
+        self._dim: Optional[int] = None
+
+    @property
+    def dim(self) -> int:
+        """출력 임베딩 차원. 모델 출력 shape이 심볼릭일 수 있어 한 번 인코딩해 확인"""
+        if self._dim is None:
+            self._dim = int(self.encode([""]).shape[1])
+        return self._dim
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.encode([self.passage_prefix + t for t in texts]).tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.encode([self.query_prefix + text])[0].tolist()
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        # 추론은 CPU 바운드이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(self.embed_query, text)
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray(
+            [e.attention_mask for e in encodings], dtype=np.int64
+        )
+
+        inputs: dict[str, np.ndarray] = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+        }
+        if "token_type_ids" in self._input_names:
+            inputs["token_type_ids"] = np.zeros_like(input_ids)
+
+        hidden: np.ndarray = self.session.run(None, inputs)[0]
+        mask = attention_mask[..., np.newaxis].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+class CachedEmbeddings(Embeddings):
+    """정규화된 쿼리 문자열의 xxhash를 키로 하는 쿼리 임베딩 LRU 캐시. 문서 임베딩은 캐시하지 않음"""
+
+    def __init__(
+        self, embeddings: Embeddings, maxsize: int = 4096, ttl: float = 3600.0
+    ) -> None:
+        self.embeddings = embeddings
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def stats(self) -> dict:
+        total: int = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._cache),
+        }
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key, vector = self._lookup(text)
+        if vector is None:
+            vector = self.embeddings.embed_query(_normalize(text))
+            self._cache.set(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key, vector = self._lookup(text)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(_normalize(text))
+            self._cache.set(key, vector)
+        return vector
+
+    def _lookup(self, text: str) -> tuple[str, Optional[list[float]]]:
+        key: str = xxhash.xxh3_64_hexdigest(_normalize(text).encode())
+        vector: Optional[list[float]] = self._cache.get(key)
+        if vector is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.debug(f"[Embedding] query cache hit. stats: {self.stats()}")
+        return key, vector
@@ -0,0 +1,133 @@
+import asyncio
+import unicodedata
+from typing import Any, Optional
+
+import httpx
+
+from ..graph.cache import TieredCache
+from ..graph.config import config_settings
+from ..graph.schema import LegalSearchQuery, NodeType
+from ..graph.utils import AgentSpecLoader
+from ..graph.logger import logger
+
+
+class LawApiClient:
+    """
+    국가법령정보 공동활용 API(법령해석례, target=expc) 비동기 클라이언트.
+
+    커넥션 풀을 공유하고, 정규화된 검색 조건을 키로 하는 2단계 캐시(LRU + Redis)를 앞단에 둔다.
+    동일 조건의 동시 요청은 하나의 업스트림 호출을 공유한다.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        cache: Optional[TieredCache] = None,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+    ) -> None:
+        self.base_url = base_url or AgentSpecLoader.load_elements(
+            NodeType.LEGAL_RETRIEVER, "base_url"
+        )
+        self.cache = cache or TieredCache(
+            namespace="legal:expc",
+            maxsize=config_settings.LEGAL_CACHE_MAXSIZE,
+            ttl=config_settings.LEGAL_CACHE_TTL_SEC,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def aclose(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        await self._client.aclose()
+
+    async def search_interpretations(self, args: LegalSearchQuery) -> dict:
+        key: str = self.cache.key(self.normalize_query(args))
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # 업스트림 호출은 클라이언트가 소유한 태스크로 분리해, 먼저 온 요청이 취소되어도
+        # 같은 조건을 기다리는 다른 요청은 결과를 받을 수 있도록 함
+        task: Optional[asyncio.Task] = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(key, args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, key: str, args: LegalSearchQuery) -> dict:
+        result: dict = await self._fetch(args)
+        await self.cache.set(key, result)
+        return result
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기 중인 요청이 없을 때 'exception was never retrieved' 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    async def list_interpretations(self, page: int, display: int = 100) -> dict:
+        """미러 동기화용 전체 목록 조회 (최신 회신일자 순, 캐시 미사용)"""
+        response = await self._client.get(
+            self.base_url,
+            params={
+                "OC": config_settings.KOREAN_LAW_OC,
+                "target": "expc",
+                "type": "JSON",
+                "sort": "ddes",
+                "page": page,
+                "display": display,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def get_interpretation(self, service_url: str, serial_no: str) -> dict:
+        """법령해석례 본문(질의요지, 회답, 이유) 조회"""
+        response = await self._client.get(
+            service_url,
+            params={
+                "OC": config_settings.KOREAN_LAW_OC,
+                "target": "expc",
+                "type": "JSON",
+                "ID": serial_no,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch(self, args: LegalSearchQuery) -> dict:
+        api_params: dict[str, Any] = {
+            "OC": config_settings.KOREAN_LAW_OC,
+            "target": "expc",
+            "type": "JSON",
+            "query": args.keyword,
+            **args.model_dump(exclude={"keyword"}, exclude_none=True),
+        }
+
+        response = await self._client.get(self.base_url, params=api_params)
+        response.raise_for_status()
+        logger.debug(f"[LawApiClient] fetched expc. keyword: {args.keyword}")
+        return response.json()
+
+    @staticmethod
+    def normalize_query(args: LegalSearchQuery) -> dict:
+        keyword: str = unicodedata.normalize("NFKC", args.keyword)
+        normalized: dict[str, Any] = {
+            "keyword": " ".join(keyword.split()).lower(),
+            **args.model_dump(exclude={"keyword"}, exclude_none=True),
+        }
+        if args.itmno:
+            normalized["itmno"] = args.itmno.replace("-", "").strip()
+        return normalized
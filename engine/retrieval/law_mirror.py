@@ -0,0 +1,273 @@
+import time
+from typing import Any, Optional
+
+import aiosqlite
+import orjson
+
+from ..graph.schema import LegalSearchQuery
+from ..graph.logger import logger
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS expc (
+    serial_no   TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    itmno       TEXT,
+    inq_code    TEXT,
+    inq_name    TEXT,
+    rpl_code    TEXT,
+    rpl_name    TEXT,
+    expl_date   INTEGER,
+    reg_date    INTEGER,
+    gana        TEXT,
+    body        TEXT NOT NULL DEFAULT '',
+    raw         TEXT NOT NULL,
+    synced_at   REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_expc_itmno ON expc (itmno);
+CREATE INDEX IF NOT EXISTS ix_expc_expl_date ON expc (expl_date);
+CREATE INDEX IF NOT EXISTS ix_expc_reg_date ON expc (reg_date);
+CREATE INDEX IF NOT EXISTS ix_expc_inq_code ON expc (inq_code);
+CREATE INDEX IF NOT EXISTS ix_expc_inq_name ON expc (inq_name);
+CREATE INDEX IF NOT EXISTS ix_expc_rpl_code ON expc (rpl_code);
+CREATE INDEX IF NOT EXISTS ix_expc_rpl_name ON expc (rpl_name);
+CREATE INDEX IF NOT EXISTS ix_expc_gana ON expc (gana);
+
+-- 한국어는 교착어라 공백 토크나이저로는 '전세사기' 같은 복합어 부분 일치가 불가능하므로 trigram 사용
+CREATE VIRTUAL TABLE IF NOT EXISTS expc_fts USING fts5(
+    title, body, content='expc', content_rowid='rowid', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS expc_ai AFTER INSERT ON expc BEGIN
+    INSERT INTO expc_fts (rowid, title, body) VALUES (new.rowid, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS expc_ad AFTER DELETE ON expc BEGIN
+    INSERT INTO expc_fts (expc_fts, rowid, title, body)
+    VALUES ('delete', old.rowid, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS expc_au AFTER UPDATE ON expc BEGIN
+    INSERT INTO expc_fts (expc_fts, rowid, title, body)
+    VALUES ('delete', old.rowid, old.title, old.body);
+    INSERT INTO expc_fts (rowid, title, body) VALUES (new.rowid, new.title, new.body);
+END;
+"""
+
+_UPSERT: str = """
+INSERT INTO expc (
+    serial_no, title, itmno, inq_code, inq_name, rpl_code, rpl_name,
+    expl_date, reg_date, gana, body, raw, synced_at
+) VALUES (
+    :serial_no, :title, :itmno, :inq_code, :inq_name, :rpl_code, :rpl_name,
+    :expl_date, :reg_date, :gana, :body, :raw, :synced_at
+)
+ON CONFLICT (serial_no) DO UPDATE SET
+    title = excluded.title,
+    itmno = excluded.itmno,
+    inq_code = excluded.inq_code,
+    inq_name = excluded.inq_name,
+    rpl_code = excluded.rpl_code,
+    rpl_name = excluded.rpl_name,
+    expl_date = excluded.expl_date,
+    reg_date = COALESCE(excluded.reg_date, expc.reg_date),
+    gana = excluded.gana,
+    body = CASE WHEN excluded.body != '' THEN excluded.body ELSE expc.body END,
+    raw = excluded.raw,
+    synced_at = excluded.synced_at
+"""
+
+# 사전식 검색(gana) 파라미터 값과 한글 초성의 대응 (쌍자음은 기본 자음으로 취급)
+_GANA_BY_INITIAL: tuple[str, ...] = (
+    "ga", "ga", "na", "da", "da", "ra", "ma", "ba", "ba", "sa",
+    "sa", "a", "ja", "ja", "cha", "ka", "ta", "pa", "ha",
+)  # fmt: skip
+
+_TRIGRAM_MIN_LEN: int = 3
+
+
+def parse_date(value: Any) -> Optional[int]:
+    digits: str = "".join(ch for ch in str(value or "") if ch.isdigit())
+    return int(digits[:8]) if len(digits) >= 8 else None
+
+
+def _date_range(value: Optional[str]) -> Optional[tuple[int, int]]:
+    if not value:
+        return None
+    start, _, end = value.partition("~")
+    start_date, end_date = parse_date(start), parse_date(end or start)
+    if start_date is None or end_date is None:
+        return None
+    return start_date, end_date
+
+
+def _gana(title: str) -> Optional[str]:
+    for ch in title:
+        code: int = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            return _GANA_BY_INITIAL[code // 588]
+        if not ch.isspace():
+            return None
+    return None
+
+
+class LawMirror:
+    """
+    법령해석례(target=expc) 코퍼스의 로컬 SQLite 미러.
+
+    검색 조건 중 itmno, regYd/explYd, inq/rpl, gana는 인덱스 컬럼으로, 키워드는 FTS5 trigram 인덱스로 처리한다.
+    결과가 없거나 오래된 레코드가 섞여 있으면 None을 반환하여 원격 API로 넘긴다.
+    """
+
+    def __init__(self, db_path: str, max_age_sec: float = 7 * 24 * 3600) -> None:
+        self.db_path = db_path
+        self.max_age_sec = max_age_sec
+        self._conn: Optional[aiosqlite.Connection] = None
+
+    async def open(self) -> None:
+        if self._conn is not None:
+            return
+        self._conn = await aiosqlite.connect(self.db_path)
+        self._conn.row_factory = aiosqlite.Row
+        await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.executescript(_SCHEMA)
+        await self._conn.commit()
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    @property
+    def conn(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            raise RuntimeError("LawMirror is not opened.")
+        return self._conn
+
+    async def search(self, args: LegalSearchQuery, limit: int = 20) -> Optional[dict]:
+        sql, params = self._build_query(args, limit)
+
+        started: float = time.perf_counter()
+        async with self.conn.execute(sql, params) as cursor:
+            rows = await cursor.fetchall()
+        elapsed_ms: float = (time.perf_counter() - started) * 1000
+
+        if not rows:
+            logger.debug(f"[LawMirror] miss. keyword: {args.keyword}")
+            return None
+
+        oldest: float = min(row["synced_at"] for row in rows)
+        if time.time() - oldest > self.max_age_sec:
+            logger.debug(f"[LawMirror] stale. keyword: {args.keyword}")
+            return None
+
+        logger.debug(f"[LawMirror] hit {len(rows)} rows in {elapsed_ms:.2f}ms.")
+        return {
+            "Expc": {
+                "target": "expc",
+                "키워드": args.keyword,
+                "page": "1",
+                "totalCnt": str(len(rows)),
+                "expc": [orjson.loads(row["raw"]) for row in rows],
+            }
+        }
+
+    async def upsert_response(self, response: dict) -> int:
+        """원격 API 검색 응답을 그대로 받아 미러에 반영"""
+        items = (response.get("Expc") or {}).get("expc") or []
+        # 결과가 1건이면 API가 리스트 대신 객체를 반환
+        if isinstance(items, dict):
+            items = [items]
+        return await self.upsert(items)
+
+    async def upsert(
+        self, items: list[dict], bodies: Optional[dict[str, str]] = None
+    ) -> int:
+        bodies = bodies or {}
+        synced_at: float = time.time()
+        rows: list[dict] = []
+
+        for item in items:
+            serial_no = item.get("법령해석례일련번호")
+            title: str = item.get("안건명") or ""
+            if not serial_no or not title:
+                continue
+
+            rows.append(
+                {
+                    "serial_no": str(serial_no),
+                    "title": title,
+                    "itmno": (item.get("안건번호") or "").replace("-", "") or None,
+                    "inq_code": item.get("질의기관코드"),
+                    "inq_name": item.get("질의기관명"),
+                    "rpl_code": item.get("회신기관코드"),
+                    "rpl_name": item.get("회신기관명"),
+                    "expl_date": parse_date(item.get("회신일자")),
+                    "reg_date": parse_date(item.get("등록일자")),
+                    "gana": _gana(title),
+                    "body": bodies.get(str(serial_no), ""),
+                    "raw": orjson.dumps(item).decode(),
+                    "synced_at": synced_at,
+                }
+            )
+
+        if rows:
+            await self.conn.executemany(_UPSERT, rows)
+            await self.conn.commit()
+        return len(rows)
+
+    def _build_query(self, args: LegalSearchQuery, limit: int) -> tuple[str, list]:
+        where: list[str] = []
+        params: list[Any] = []
+        use_fts: bool = False
+
+        match_terms: list[str] = []
+        for term in args.keyword.split():
+            if len(term) >= _TRIGRAM_MIN_LEN:
+                match_terms.append('"' + term.replace('"', '""') + '"')
+            else:
+                # trigram 인덱스는 3글자 미만 토큰을 다루지 못하므로 LIKE로 처리
+                if args.search == 2:
+                    where.append("(e.title LIKE ? OR e.body LIKE ?)")
+                    params.extend([f"%{term}%", f"%{term}%"])
+                else:
+                    where.append("e.title LIKE ?")
+                    params.append(f"%{term}%")
+
+        if match_terms:
+            use_fts = True
+            expr: str = " AND ".join(match_terms)
+            where.append("expc_fts MATCH ?")
+            params.append(expr if args.search == 2 else f"title : ({expr})")
+
+        if args.itmno:
+            where.append("e.itmno = ?")
+            params.append(args.itmno.replace("-", "").strip())
+
+        for column, value in (("inq", args.inq), ("rpl", args.rpl)):
+            if value:
+                where.append(f"(e.{column}_code = ? OR e.{column}_name = ?)")
+                params.extend([value, value])
+
+        if args.gana:
+            where.append("e.gana = ?")
+            params.append(args.gana)
+
+        for column, value in (("reg_date", args.regYd), ("expl_date", args.explYd)):
+            date_range = _date_range(value)
+            if date_range:
+                where.append(f"e.{column} BETWEEN ? AND ?")
+                params.extend(date_range)
+
+        source: str = (
+            "expc_fts JOIN expc AS e ON e.rowid = expc_fts.rowid"
+            if use_fts
+            else "expc AS e"
+        )
+        order: str = "bm25(expc_fts)" if use_fts else "e.expl_date DESC"
+        sql: str = (
+            f"SELECT e.raw, e.synced_at FROM {source}"
+            f"{' WHERE ' + ' AND '.join(where) if where else ''}"
+            f" ORDER BY {order} LIMIT ?"
+        )
+        params.append(limit)
+        return sql, params
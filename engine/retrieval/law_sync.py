@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+from typing import Optional
+
+from .law_client import LawApiClient
+from .law_mirror import LawMirror, parse_date
+from ..graph.schema import NodeType
+from ..graph.utils import AgentSpecLoader
+from ..graph.config import config_settings
+from ..graph.logger import logger
+
+_BODY_FIELDS: tuple[str, ...] = ("질의요지", "회답", "이유")
+
+
+async def sync_interpretations(
+    mirror: LawMirror,
+    client: LawApiClient,
+    display: int = 100,
+    max_pages: Optional[int] = None,
+    since: Optional[int] = None,
+    with_body: bool = False,
+    body_concurrency: int = 4,
+) -> int:
+    """
+    법령해석례 목록을 최신 회신일자 순으로 페이지 단위 순회하며 미러에 반영.
+
+    :param since: YYYYMMDD. 이 날짜보다 오래된 회신일자를 만나면 중단 (증분 동기화)
+    :param with_body: 본문(질의요지/회답/이유)까지 받아 전문 검색(search=2)에 사용
+    """
+    service_url: str = AgentSpecLoader.load_elements(
+        NodeType.LEGAL_RETRIEVER, "service_url"
+    )
+    semaphore = asyncio.Semaphore(body_concurrency)
+
+    async def fetch_body(serial_no: str) -> tuple[str, str]:
+        async with semaphore:
+            try:
+                detail: dict = await client.get_interpretation(service_url, serial_no)
+            except Exception as e:
+                logger.warning(f"[LawSync] body fetch failed. id: {serial_no}, {e}")
+                return serial_no, ""
+        service: dict = detail.get("ExpcService") or {}
+        return serial_no, "\n".join(str(service.get(f) or "") for f in _BODY_FIELDS)
+
+    synced: int = 0
+    page: int = 1
+
+    while max_pages is None or page <= max_pages:
+        response: dict = await client.list_interpretations(page=page, display=display)
+        items = (response.get("Expc") or {}).get("expc") or []
+        if isinstance(items, dict):
+            items = [items]
+        if not items:
+            break
+
+        if since is not None:
+            items = [i for i in items if (parse_date(i.get("회신일자")) or 0) >= since]
+
+        bodies: dict[str, str] = {}
+        if with_body and items:
+            bodies = dict(
+                await asyncio.gather(
+                    *(fetch_body(str(i.get("법령해석례일련번호"))) for i in items)
+                )
+            )
+
+        synced += await mirror.upsert(items, bodies=bodies)
+        logger.info(f"[LawSync] page {page} synced. total: {synced}")
+
+        if len(items) < display:
+            break
+        page += 1
+
+    return synced
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="법령해석례 로컬 미러 동기화")
+    parser.add_argument("--db", default=config_settings.LEGAL_MIRROR_PATH)
+    parser.add_argument("--display", type=int, default=100)
+    parser.add_argument("--max-pages", type=int, default=None)
+    parser.add_argument("--since", type=int, default=None, help="YYYYMMDD")
+    parser.add_argument("--with-body", action="store_true")
+    cli_args = parser.parse_args()
+
+    if not cli_args.db:
+        raise ValueError("LEGAL_MIRROR_PATH is not set. Pass --db explicitly.")
+
+    mirror = LawMirror(db_path=cli_args.db)
+    client = LawApiClient()
+    await mirror.open()
+    try:
+        total: int = await sync_interpretations(
+            mirror,
+            client,
+            display=cli_args.display,
+            max_pages=cli_args.max_pages,
+            since=cli_args.since,
+            with_body=cli_args.with_body,
+        )
+        logger.info(f"[LawSync] done. {total} interpretations mirrored.")
+    finally:
+        await client.aclose()
+        await mirror.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+import unicodedata
+from typing import Iterable
+
+# 세종 품사 태그 중 검색어로 의미 있는 형태소: 명사류, 용언 어간, 어근, 외국어, 한자, 숫자
+_CONTENT_TAG_PREFIXES: tuple[str, ...] = (
+    "NN",
+    "NP",
+    "NR",
+    "VV",
+    "VA",
+    "XR",
+    "SL",
+    "SH",
+    "SN",
+)
+
+
+class KoreanTokenizer:
+    """
+    spaCy 한국어 모델(ko_core_news_lg)의 형태소 분석 결과로 BM25용 토큰을 만드는 토크나이저.
+
+    모델은 lemma를 `서대문구+에서`, tag를 `NNP+JKB`처럼 형태소 단위 `+`로 이어서 내므로 이를 나눠
+    조사/어미/기호를 버리고 내용 형태소만 남긴다. 개수가 맞지 않으면 토큰 원형을 그대로 쓴다.
+    """
+
+    def __init__(self, model_name: str = "ko_core_news_lg", nlp=None) -> None:
+        if nlp is None:
+            import spacy
+
+            nlp = spacy.load(model_name, disable=["parser", "ner"])
+        self.nlp = nlp
+
+    def __call__(self, text: str) -> list[str]:
+        return self._tokens(self.nlp(self._normalize(text)))
+
+    def tokenize_batch(
+        self, texts: Iterable[str], batch_size: int = 64
+    ) -> list[list[str]]:
+        docs = self.nlp.pipe((self._normalize(t) for t in texts), batch_size=batch_size)
+        return [self._tokens(doc) for doc in docs]
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return unicodedata.normalize("NFKC", text or "").lower()
+
+    @staticmethod
+    def _tokens(doc) -> list[str]:
+        tokens: list[str] = []
+        for token in doc:
+            if token.is_space or token.is_punct:
+                continue
+            morphs: list[str] = (token.lemma_ or token.text).split("+")
+            tags: list[str] = (token.tag_ or "").split("+")
+            if len(morphs) != len(tags):
+                tokens.append(token.text)
+                continue
+            tokens.extend(
+                morph
+                for morph, tag in zip(morphs, tags)
+                if morph and tag.startswith(_CONTENT_TAG_PREFIXES)
+            )
+        return tokens
@@ -1,5 +1,5 @@
-import requests
-from typing import List, Union, Any
+import httpx
+from typing import List, Union, Any, Optional
 from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
@@ -12,8 +12,28 @@ from ..graph.config import config_settings
 
 
 class PromptGuard:
-    def __init__(self):
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        timeout: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.BASE_URL = "https://api.lakera.ai/v2/guard"
+        # 프로세스 전역에서 공유하는 커넥션 풀 (HTTP/2 멀티플렉싱 + keep-alive)
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            headers={"Authorization": f"Bearer {config_settings.LAKERA_GUARD_API_KEY}"},
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     async def is_secured(self, messages: List[BaseMessage]) -> bool:
         try:
@@ -26,12 +46,8 @@ class PromptGuard:
     async def _guard_messages(self, messages: List[BaseMessage]) -> dict:
         lakera_messages = self._map_langchain_to_dict(messages)
 
-        session = requests.Session()
-        response = session.post(
-            self.BASE_URL,
-            json={"messages": lakera_messages},
-            headers={"Authorization": f"Bearer {config_settings.LAKERA_GUARD_API_KEY}"},
-            timeout=5.0,
+        response = await self._client.post(
+            self.BASE_URL, json={"messages": lakera_messages}
         )
 
         response.raise_for_status()
@@ -1,6 +1,6 @@
 import json
 from typing import List, Union, Any
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from ..graph.logger import logger
 from ..graph.config import config_settings
@@ -9,6 +9,16 @@ from ..graph.config import config_settings
 class HallucinationDetector:
     def __init__(self):
         self.BASE_URL = "https://api.upstage.ai/v1"
+        self._client: AsyncOpenAI | None = None
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=config_settings.UPSTAGE_API_KEY,
+                base_url=self.BASE_URL,
+            )
+        return self._client
 
     async def is_grounded(self, context: Union[str, list, dict], answer: str) -> bool:
         try:
@@ -41,14 +51,9 @@ class HallucinationDetector:
                 - 'not_grounded': 답변 중에 근거 문서에 없는 내용이나 모순이 포함됨 (할루시네이션)
                 - 'not_sure': 근거가 부족하거나 모델이 확신할 수 없음
         """
-        client = OpenAI(
-            api_key=config_settings.UPSTAGE_API_KEY,
-            base_url=self.BASE_URL,
-        )
-
         serialize_context: str = self._serialize_context(context)
 
-        response = client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model="groundedness-check-240502",
             messages=[
                 {
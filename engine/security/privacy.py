@@ -2,6 +2,10 @@ from presidio_analyzer import AnalyzerEngine, PatternRecognizer, Pattern
 from presidio_analyzer.nlp_engine import NlpEngineProvider
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import asyncio
 from typing import Any
 
 from ..graph.logger import logger
@@ -40,18 +44,7 @@ class PresidioKoreanEngine:
         self.analyzer.registry.add_recognizer(rrn_recognizer)
         self.analyzer.registry.add_recognizer(ko_phone_recognizer)
 
-    async def process(self, text: str, entities: list | None = None) -> dict[str, Any]:
-        try:
-            return await self._process(text=text, entities=entities)
-        except Exception as e:
-            logger.warning(f"HallucinationDetector failed. error: {str(e)}")
-            return {
-                "is_pii": False,
-                "masked_text": "",
-                "detected_entities": [],
-            }
-
-    async def _process(self, text: str, entities: list | None = None) -> dict[str, Any]:
+    def analyze(self, text: str, entities: list | None = None) -> dict[str, Any]:
         """
         :param text: 처리할 전체 텍스트
         :param entities: 탐지할 엔티티 리스트 (None일 경우 전체 탐지)
@@ -73,3 +66,103 @@ class PresidioKoreanEngine:
             "masked_text": anonymized_result.text,
             "detected_entities": detected_types,
         }
+
+
+def redacted_result() -> dict[str, Any]:
+    """PII 검사를 끝내지 못했을 때의 판정. 마스킹되지 않은 원문이 나가지 않도록 답변을 비움(fail-closed)"""
+    return {
+        "is_pii": True,
+        "masked_text": "",
+        "detected_entities": [],
+    }
+
+
+# 워커 프로세스마다 한 번만 로드되는 엔진 (ProcessPoolExecutor initializer에서 생성)
+_worker_engine: PresidioKoreanEngine | None = None
+
+
+def _init_worker() -> None:
+    global _worker_engine
+    _worker_engine = PresidioKoreanEngine()
+
+
+def _analyze_in_worker(text: str, entities: list | None) -> dict[str, Any]:
+    if _worker_engine is None:
+        raise RuntimeError("PresidioKoreanEngine is not loaded in this worker.")
+    return _worker_engine.analyze(text=text, entities=entities)
+
+
+class PrivacyService:
+    """
+    프로세스 전역에서 공유하는 PII 탐지 서비스.
+
+    spaCy 기반 Presidio 분석은 CPU 바운드 작업이므로 이벤트 루프가 아닌
+    크기가 제한된 프로세스 풀에서 실행하며, 각 워커 프로세스는 기동 시 엔진을 한 번만 로드한다.
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._executor is not None:
+                return
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+
+            # 워커별 모델 로딩을 기동 시점에 끝내 첫 요청이 로딩 비용을 떠안지 않도록 함
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, _analyze_in_worker, "", None)
+                    for _ in range(self.max_workers)
+                )
+            )
+            logger.info(f"PrivacyService started with {self.max_workers} workers.")
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._executor is None:
+                return
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def process(self, text: str, entities: list | None = None) -> dict[str, Any]:
+        try:
+            return await self._process(text=text, entities=entities)
+        except Exception as e:
+            logger.warning(f"PrivacyService failed. error: {str(e)}")
+            return redacted_result()
+
+    async def _process(self, text: str, entities: list | None = None) -> dict[str, Any]:
+        if self._executor is None:
+            await self.start()
+
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                executor, _analyze_in_worker, text, entities
+            )
+        except BrokenProcessPool:
+            # 워커가 죽으면(OOM, spaCy segfault 등) 풀 전체가 못 쓰게 되므로 새 풀로 한 번 재시도
+            logger.warning("PrivacyService process pool broken. restarting.")
+            await self._restart(executor)
+            return await loop.run_in_executor(
+                self._executor, _analyze_in_worker, text, entities
+            )
+
+    async def _restart(self, broken: ProcessPoolExecutor | None) -> None:
+        async with self._lock:
+            # 동시에 실패한 다른 요청이 이미 새 풀을 만들었으면 그대로 사용
+            if self._executor is broken:
+                self._executor = None
+                if broken is not None:
+                    broken.shutdown(wait=False, cancel_futures=True)
+        await self.start()
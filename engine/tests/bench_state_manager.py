@@ -0,0 +1,162 @@
+"""
+StateManager superstep 오버헤드 마이크로 벤치마크.
+
+    python -m engine.tests.bench_state_manager --messages 50 500 5000
+
+노드/라우터가 superstep마다 StateManager를 새로 만들어 접근하는 패턴을 재현하여
+변경 전(매 접근마다 model_validate 및 컨테이너 복사)과 현재 구현을 비교한다.
+"""
+
+import argparse
+import timeit
+from typing import Any, cast
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from engine.graph.schema import (
+    CircuitCheck,
+    HumanFeedback,
+    NodeType,
+    PlannerResponse,
+)
+from engine.graph.state import AgentState, StateKey, StateManager
+
+
+class LegacyStateManager(StateManager):
+    """변경 전 동작: 모델 키는 접근마다 재검증, 컨테이너는 접근마다 복사"""
+
+    def _model(self, key: str, default: Any = None) -> Any:
+        raw = self._state.get(key)
+        if raw is None:
+            return default
+        model_cls = self._TYPE_MAP[key]
+        return model_cls.model_validate(raw) if isinstance(raw, dict) else raw
+
+    @property
+    def messages(self):  # type: ignore[override]
+        return self._state.get(StateKey.MESSAGES, []).copy()
+
+    @property
+    def planner_response(self):  # type: ignore[override]
+        return self._model(StateKey.PLANNER_RESPONSE)
+
+    @property
+    def refined_query(self) -> str:
+        return (
+            self.planner_response.refined_query
+            if self.planner_response and self.planner_response.refined_query
+            else ""
+        )
+
+    @property
+    def circuit_check(self):  # type: ignore[override]
+        return self._model(StateKey.CIRCUIT_CHECK) or CircuitCheck.initialize()
+
+    @property
+    def human_feedback(self):  # type: ignore[override]
+        return self._model(StateKey.HUMAN_FEEDBACK) or HumanFeedback(
+            content="", human_action=None
+        )
+
+    @property
+    def retrieved_docs(self):  # type: ignore[override]
+        return self._state.get(StateKey.RETRIEVED_DOCS, {}).copy()
+
+    @property
+    def api_args(self):  # type: ignore[override]
+        return self._state.get(StateKey.API_ARGS, {}).copy()
+
+
+def build_state(n_messages: int, as_dict: bool) -> AgentState:
+    messages = [
+        (HumanMessage if i % 2 == 0 else AIMessage)(content=f"메시지 {i} " * 20)
+        for i in range(n_messages)
+    ]
+    planner = PlannerResponse(
+        refined_query="전세 보증금 반환",
+        intention="법률 상담",
+        node_stack=[NodeType.LEGAL_RETRIEVER, NodeType.GENERATOR],
+    )
+    circuit = CircuitCheck.initialize()
+    feedback = HumanFeedback(content="더 자세히", human_action=None)
+    docs = {
+        NodeType.LEGAL_RETRIEVER: {"Expc": [{"안건명": f"전세 {i}"} for i in range(50)]}
+    }
+
+    def dump(model):
+        return model.model_dump() if as_dict else model
+
+    return cast(
+        AgentState,
+        {
+            StateKey.MESSAGES: messages,
+            StateKey.QUERY: "전세 사기",
+            StateKey.PLANNER_RESPONSE: dump(planner),
+            StateKey.CIRCUIT_CHECK: dump(circuit),
+            StateKey.HUMAN_FEEDBACK: dump(feedback),
+            StateKey.VERIFIER_TARGET_NODE: NodeType.LEGAL_RETRIEVER,
+            StateKey.NEXT_NODE: NodeType.LEGAL_RETRIEVER,
+            StateKey.IS_VERIFIED: True,
+            StateKey.RETRIEVED_DOCS: docs,
+            StateKey.API_ARGS: {NodeType.LEGAL_RETRIEVER: {"query": "전세"}},
+        },
+    )
+
+
+def superstep(manager_cls: type[StateManager], state: AgentState) -> None:
+    # Dispatcher
+    sm = manager_cls(state)
+    sm.planner_response.is_exhausted()
+    manager_cls(state).next_node
+
+    # ToolNode
+    sm = manager_cls(state)
+    sm.refined_query or sm.query
+    sm.feedback
+    sm.api_args
+
+    # Verifier + route_after_verifier
+    sm = manager_cls(state)
+    sm.retrieved_docs.get(sm.target_node)
+    sm.circuit_check
+    sm.errors
+    sm = manager_cls(state)
+    sm.is_verified
+    sm.circuit_check.is_over_limit(sm.target_node)
+
+    # Generator
+    sm = manager_cls(state)
+    len(sm.messages)
+    sm.retrieved_docs
+    sm.refined_query
+    sm.feedback
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'messages':>8} {'models':>6} {'legacy(us)':>11} {'current(us)':>12} {'speedup':>8}"
+    )
+    for n_messages in args.messages:
+        for as_dict in (False, True):
+            state = build_state(n_messages, as_dict)
+            legacy = timeit.timeit(
+                lambda: superstep(LegacyStateManager, state), number=args.number
+            )
+            current = timeit.timeit(
+                lambda: superstep(StateManager, state), number=args.number
+            )
+            print(
+                f"{n_messages:>8} {'dict' if as_dict else 'model':>6} "
+                f"{legacy / args.number * 1e6:>11.1f} "
+                f"{current / args.number * 1e6:>12.1f} "
+                f"{legacy / current:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
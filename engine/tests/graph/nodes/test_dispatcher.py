@@ -1,9 +1,11 @@
+import asyncio
 import pytest
+from typing import cast
 from unittest.mock import MagicMock, patch
 from pydantic import BaseModel
 from engine.graph.nodes.base import ToolNode, LLMNode
 from engine.graph.state import StateManager, AgentState, StateKey
-from engine.graph.schema import NodeType
+from engine.graph.schema import NodeType, PlannerResponse
 from engine.graph.nodes.dispatcher import Dispatcher
 
 
@@ -33,3 +35,35 @@ def test_dispatcher_routing(MockManager, dispatcher):
     # 검증: 에러 없고 플래너 객체 그대로 반환되는지
     assert res2[StateKey.ERRORS] is None
     assert res2[StateKey.PLANNER_RESPONSE] == planner
+
+
+def _planner_response(node_stack):
+    return PlannerResponse(refined_query="q", intention="i", node_stack=node_stack)
+
+
+def test_dispatcher_groups_retrievers_when_parallel():
+    """병렬 모드에서 연속된 리트리버는 PARALLEL_RETRIEVER로 묶여야 함"""
+    planner = _planner_response(
+        [NodeType.LEGAL_RETRIEVER, NodeType.DOC_RETRIEVER, NodeType.GENERATOR]
+    )
+    state = cast(AgentState, {StateKey.PLANNER_RESPONSE: planner})
+
+    res = asyncio.run(Dispatcher(parallel=True)(state))
+
+    assert res[StateKey.NEXT_NODE] == NodeType.PARALLEL_RETRIEVER
+    assert res[StateKey.PARALLEL_TARGETS] == [
+        NodeType.LEGAL_RETRIEVER,
+        NodeType.DOC_RETRIEVER,
+    ]
+    assert res[StateKey.PLANNER_RESPONSE].node_stack == [NodeType.GENERATOR]
+
+
+def test_dispatcher_single_retriever_stays_serial():
+    """리트리버가 하나뿐이면 기존 직렬 경로를 그대로 사용"""
+    planner = _planner_response([NodeType.LEGAL_RETRIEVER, NodeType.GENERATOR])
+    state = cast(AgentState, {StateKey.PLANNER_RESPONSE: planner})
+
+    res = asyncio.run(Dispatcher(parallel=True)(state))
+
+    assert res[StateKey.NEXT_NODE] == NodeType.LEGAL_RETRIEVER
+    assert res[StateKey.PARALLEL_TARGETS] is None
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from engine.graph.nodes.evaluator import Evaluator
+from engine.graph.schema import EvaluationResponse
+from engine.graph.state import StateKey
+
+
+def _build_evaluator(timeout: float) -> Evaluator:
+    prompt_guard = MagicMock()
+    prompt_guard.is_secured = AsyncMock(return_value=True)
+    privacy_service = MagicMock()
+    privacy_service.process = AsyncMock(
+        return_value={
+            "is_pii": True,
+            "masked_text": "<PHONE_NUMBER>",
+            "detected_entities": [],
+        }
+    )
+    evaluator = Evaluator(
+        prompt_guard=prompt_guard, privacy_service=privacy_service, timeout=timeout
+    )
+    evaluator.hallucination_detector = MagicMock()
+    evaluator.hallucination_detector.is_grounded = AsyncMock(return_value=True)
+    return evaluator
+
+
+def test_evaluator_runs_checks_concurrently():
+    """세 검사가 순차 합이 아닌 가장 느린 검사 시간 안에 끝나는지 테스트"""
+    evaluator = _build_evaluator(timeout=1.0)
+
+    async def slow(result):
+        await asyncio.sleep(0.2)
+        return result
+
+    evaluator.prompt_guard.is_secured = MagicMock(side_effect=lambda _: slow(True))
+    evaluator.hallucination_detector.is_grounded = MagicMock(
+        side_effect=lambda **_: slow(True)
+    )
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await evaluator({StateKey.ANSWER: "010-1234-5678"})
+        return result, loop.time() - started
+
+    result, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.35
+    assert result[StateKey.ERRORS] is None
+    assert result[StateKey.ANSWER] == "<PHONE_NUMBER>"
+
+    evaluation: EvaluationResponse = result[StateKey.EVALUATION_RESPONSE]
+    assert {c.name for c in evaluation.checks} == {
+        Evaluator.PROMPT_GUARD,
+        Evaluator.GROUNDEDNESS,
+        Evaluator.PRIVACY,
+    }
+    assert all(c.finished for c in evaluation.checks)
+
+
+def test_evaluator_uses_fallback_on_timeout():
+    """제한 시간을 넘긴 검사는 fallback 판정과 미완료 리포트로 대체되는지 테스트"""
+    evaluator = _build_evaluator(timeout=0.05)
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    evaluator.privacy_service.process = hang
+
+    result = asyncio.run(evaluator({StateKey.ANSWER: "원문 답변"}))
+
+    # 마스킹 여부를 확인하지 못한 원문은 내보내지 않음
+    assert result[StateKey.ANSWER] == ""
+
+    checks = {c.name: c for c in result[StateKey.EVALUATION_RESPONSE].checks}
+    assert checks[Evaluator.PRIVACY].finished is False
+    assert checks[Evaluator.PROMPT_GUARD].finished is True
+
+
+def test_evaluator_reports_real_elapsed_for_failed_check():
+    """예외로 끝난 검사는 제한 시간이 아닌 실제 소요 시간으로 리포트되는지 테스트"""
+    evaluator = _build_evaluator(timeout=1.0)
+    evaluator.privacy_service.process = AsyncMock(side_effect=RuntimeError("boom"))
+
+    result = asyncio.run(evaluator({StateKey.ANSWER: "원문 답변"}))
+
+    assert result[StateKey.ANSWER] == ""
+    checks = {c.name: c for c in result[StateKey.EVALUATION_RESPONSE].checks}
+    assert checks[Evaluator.PRIVACY].finished is False
+    assert checks[Evaluator.PRIVACY].elapsed_ms < 500
@@ -1,32 +1,34 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 from engine.graph.nodes.legal_retriever import LegalRetriever
 from engine.graph.schema import LegalSearchQuery
 from engine.graph.state import StateKey
+from engine.retrieval.law_client import LawApiClient
 
 
-@patch("engine.graph.nodes.legal_retriever.requests")
 @patch("engine.graph.nodes.legal_retriever.AgentSpecLoader")  # 1. 자식 모듈 패치
 @patch("engine.graph.nodes.base.AgentSpecLoader")  # 2. 부모 모듈 패치
-def test_legal_retriever_execute_tool(MockBaseLoader, MockLocalLoader, MockRequests):
+def test_legal_retriever_execute_tool(MockBaseLoader, MockLocalLoader):
     # 두 Mock 객체에 동일한 설정 적용
     for loader in [MockBaseLoader, MockLocalLoader]:
         loader.load_tool_argument_prompt.return_value = "dummy prompt"
         loader.load_elements.return_value = "https://api.law.go.kr/test"
 
     # API Mock 설정
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"totalCount": "1", "items": [{"title": "판례1"}]}
-    mock_response.status_code = 200
-    MockRequests.get.return_value = mock_response
+    law_client = MagicMock()
+    law_client.search_interpretations = AsyncMock(
+        return_value={"totalCount": "1", "items": [{"title": "판례1"}]}
+    )
 
     # 실행
     args = LegalSearchQuery(keyword="임대차보호법", search=2, itmno="123456")
-    retriever = LegalRetriever(llm=MagicMock(), version="v1")
-    result = retriever._execute_tool(args)
+    retriever = LegalRetriever(llm=MagicMock(), law_client=law_client)
+    result = asyncio.run(retriever._execute_tool(args))
 
     # 검증
     assert result["totalCount"] == "1"
+    law_client.search_interpretations.assert_awaited_once_with(args)
 
 
 def test_legal_retriever_error_handling():
@@ -35,9 +37,7 @@ def test_legal_retriever_error_handling():
         "engine.graph.nodes.base.AgentSpecLoader"
     ) as MockBaseLoader, patch(
         "engine.graph.nodes.legal_retriever.AgentSpecLoader"
-    ) as MockLocalLoader, patch(
-        "engine.graph.nodes.legal_retriever.requests"
-    ) as MockRequests:
+    ) as MockLocalLoader:
 
         # Mock 공통 설정
         for l in [MockBaseLoader, MockLocalLoader]:
@@ -46,13 +46,106 @@ def test_legal_retriever_error_handling():
 
         mock_llm = MagicMock()
         mock_llm.with_structured_output.return_value = mock_llm
-        mock_llm.invoke.return_value = LegalSearchQuery(keyword="test")
+        mock_llm.ainvoke = AsyncMock(return_value=LegalSearchQuery(keyword="test"))
 
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = Exception("API Server Error")
-        MockRequests.get.return_value = mock_response
+        law_client = MagicMock()
+        law_client.search_interpretations = AsyncMock(
+            side_effect=Exception("API Server Error")
+        )
 
-        retriever = LegalRetriever(llm=mock_llm, version="v1")
-        result = retriever({})
+        retriever = LegalRetriever(llm=mock_llm, law_client=law_client)
+        result = asyncio.run(retriever({}))
 
         assert result[StateKey.ERRORS] == "API Server Error"
+
+
+class TestLawApiClient:
+
+    @pytest.fixture
+    def client(self):
+        client = LawApiClient(base_url="http://test.com")
+        client._fetch = AsyncMock(return_value={"Expc": {"expc": []}})
+        return client
+
+    def test_normalized_query_hits_cache(self, client):
+        """공백/대소문자/하이픈만 다른 동일 조건은 업스트림을 한 번만 호출하는지 테스트"""
+
+        async def run():
+            await client.search_interpretations(
+                LegalSearchQuery(keyword="전세사기  ", itmno="13-0217")
+            )
+            await client.search_interpretations(
+                LegalSearchQuery(keyword=" 전세사기", itmno="130217")
+            )
+
+        asyncio.run(run())
+        assert client._fetch.await_count == 1
+
+    def test_concurrent_misses_share_one_fetch(self, client):
+        """동시에 들어온 동일 조건 요청은 하나의 업스트림 호출을 공유하는지 테스트"""
+
+        async def slow_fetch(args):
+            await asyncio.sleep(0.05)
+            return {"Expc": {"expc": [{"안건명": "전세사기"}]}}
+
+        client._fetch = AsyncMock(side_effect=slow_fetch)
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    client.search_interpretations(LegalSearchQuery(keyword="전세사기"))
+                    for _ in range(5)
+                )
+            )
+
+        results = asyncio.run(run())
+        assert client._fetch.await_count == 1
+        assert all(r == results[0] for r in results)
+
+    def test_cancelled_leader_does_not_cancel_followers(self, client):
+        """먼저 요청한 쪽이 취소되어도 같은 조건을 기다리던 요청은 결과를 받는지 테스트"""
+        expected = {"Expc": {"expc": [{"안건명": "전세사기"}]}}
+
+        async def slow_fetch(args):
+            await asyncio.sleep(0.05)
+            return expected
+
+        client._fetch = AsyncMock(side_effect=slow_fetch)
+
+        async def run():
+            query = LegalSearchQuery(keyword="전세사기")
+            leader = asyncio.create_task(client.search_interpretations(query))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.search_interpretations(query))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return leader, await follower
+
+        leader, result = asyncio.run(run())
+        assert leader.cancelled()
+        assert result == expected
+        assert client._fetch.await_count == 1
+
+
+@patch("engine.graph.nodes.legal_retriever.AgentSpecLoader")
+@patch("engine.graph.nodes.base.AgentSpecLoader")
+def test_legal_retriever_prefers_local_mirror(MockBaseLoader, MockLocalLoader):
+    """로컬 미러 적중 시 원격 API를 호출하지 않고, 미스 시에만 호출 후 미러를 갱신하는지 테스트"""
+    law_client = MagicMock()
+    law_client.search_interpretations = AsyncMock(return_value={"Expc": {"expc": []}})
+    law_mirror = MagicMock()
+    law_mirror.search = AsyncMock(return_value={"Expc": {"totalCnt": "1"}})
+    law_mirror.upsert_response = AsyncMock()
+
+    retriever = LegalRetriever(
+        llm=MagicMock(), law_client=law_client, law_mirror=law_mirror
+    )
+    args = LegalSearchQuery(keyword="전세사기")
+
+    assert asyncio.run(retriever._execute_tool(args)) == {"Expc": {"totalCnt": "1"}}
+    law_client.search_interpretations.assert_not_awaited()
+
+    law_mirror.search = AsyncMock(return_value=None)
+    asyncio.run(retriever._execute_tool(args))
+    law_client.search_interpretations.assert_awaited_once_with(args)
+    law_mirror.upsert_response.assert_awaited_once()
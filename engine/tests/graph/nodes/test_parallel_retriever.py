@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+from engine.graph.nodes.parallel_retriever import ParallelRetriever
+from engine.graph.schema import NodeType, CircuitCheck
+from engine.graph.state import AgentState, StateKey, merge_circuit
+
+
+def _retriever(node_type: NodeType, docs: list, delay: float = 0.0):
+    calls = iter(docs)
+
+    async def run(state):
+        await asyncio.sleep(delay)
+        return {
+            StateKey.MESSAGES: [],
+            StateKey.ERRORS: None,
+            StateKey.RETRIEVED_DOCS: {node_type: next(calls)},
+            StateKey.VERIFIER_TARGET_NODE: node_type,
+            StateKey.API_ARGS: {node_type: {"query": "전세"}},
+        }
+
+    return MagicMock(side_effect=run)
+
+
+def _verifier():
+    verifier = MagicMock()
+    verifier.verify = AsyncMock(
+        side_effect=lambda target, target_doc, errors: bool(target_doc)
+    )
+    return verifier
+
+
+def _state(target: NodeType) -> AgentState:
+    return cast(
+        AgentState,
+        {
+            StateKey.QUERY: "전세 사기",
+            StateKey.VERIFIER_TARGET_NODE: target,
+            StateKey.CIRCUIT_CHECK: CircuitCheck.initialize(),
+        },
+    )
+
+
+def test_branch_retries_until_verified():
+    """검증 실패 시 브랜치 내부에서 재시도하고 자신의 카운트만 반환"""
+    retriever = _retriever(NodeType.LEGAL_RETRIEVER, [{}, {"Expc": [1]}])
+    node = ParallelRetriever(
+        retrievers={NodeType.LEGAL_RETRIEVER: retriever}, verifier=_verifier()
+    )
+
+    res = asyncio.run(node(_state(NodeType.LEGAL_RETRIEVER)))
+
+    assert retriever.call_count == 2
+    assert res[StateKey.RETRIEVED_DOCS] == {NodeType.LEGAL_RETRIEVER: {"Expc": [1]}}
+    assert res[StateKey.CIRCUIT_CHECK].circuit_stat == {NodeType.LEGAL_RETRIEVER: 1}
+    assert StateKey.ERRORS not in res
+
+
+def test_branch_stops_at_circuit_limit():
+    """circuit 한도에 도달하면 검증 실패 상태로 종료"""
+    retriever = _retriever(NodeType.DOC_RETRIEVER, [{}] * 5)
+    node = ParallelRetriever(
+        retrievers={NodeType.DOC_RETRIEVER: retriever}, verifier=_verifier()
+    )
+
+    res = asyncio.run(node(_state(NodeType.DOC_RETRIEVER)))
+
+    assert retriever.call_count == CircuitCheck.initialize().LIMIT
+    assert res[StateKey.CIRCUIT_CHECK].get_count(NodeType.DOC_RETRIEVER) == 3
+
+
+def test_branches_run_concurrently_and_merge():
+    """두 브랜치가 동시에 실행되고 리듀서로 충돌 없이 병합되는지 테스트"""
+    node = ParallelRetriever(
+        retrievers={
+            NodeType.LEGAL_RETRIEVER: _retriever(
+                NodeType.LEGAL_RETRIEVER, [{"Expc": [1]}], delay=0.2
+            ),
+            NodeType.DOC_RETRIEVER: _retriever(
+                NodeType.DOC_RETRIEVER, [{}, ["doc"]], delay=0.1
+            ),
+        },
+        verifier=_verifier(),
+    )
+
+    async def run_all():
+        return await asyncio.gather(
+            node(_state(NodeType.LEGAL_RETRIEVER)),
+            node(_state(NodeType.DOC_RETRIEVER)),
+        )
+
+    started = time.perf_counter()
+    legal, doc = asyncio.run(run_all())
+    assert time.perf_counter() - started < 0.35
+
+    merged = merge_circuit(
+        merge_circuit(CircuitCheck.initialize(), legal[StateKey.CIRCUIT_CHECK]),
+        doc[StateKey.CIRCUIT_CHECK],
+    )
+    assert merged.circuit_stat == {
+        NodeType.LEGAL_RETRIEVER: 0,
+        NodeType.DOC_RETRIEVER: 1,
+    }
@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from engine.graph.cache import LRUCache, TieredCache, make_cache_key
+
+
+class TestLRUCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_expired_entry_is_dropped(self):
+        cache = LRUCache(ttl=-1)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+class TestTieredCache:
+
+    def test_cache_key_ignores_field_order(self):
+        assert make_cache_key("ns", {"a": 1, "b": 2}) == make_cache_key(
+            "ns", {"b": 2, "a": 1}
+        )
+
+    def test_redis_hit_is_promoted_to_local(self):
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(return_value='{"v": 1}')
+        cache = TieredCache(namespace="ns", redis_client=redis_client)
+
+        async def run():
+            first = await cache.get("ns:key")
+            second = await cache.get("ns:key")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == {"v": 1}
+        redis_client.get.assert_awaited_once()
+
+    def test_redis_failure_is_treated_as_miss(self):
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis_client.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = TieredCache(namespace="ns", redis_client=redis_client)
+
+        async def run():
+            assert await cache.get("ns:key") is None
+            await cache.set("ns:key", {"v": 1})
+            return await cache.get("ns:key")
+
+        assert asyncio.run(run()) == {"v": 1}
@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langgraph.graph.message import add_messages
+
+from engine.graph.history import (
+    SYSTEM_PROMPT_ID,
+    HistoryCompactor,
+    new_turn_id,
+    split_turns,
+)
+
+
+def _turn(i: int, size: int = 100) -> list:
+    return [
+        SystemMessage(content="시스템 메시지", id=SYSTEM_PROMPT_ID),
+        HumanMessage(content=f"요청 메시지: 질문 {i}", id=new_turn_id()),
+        AIMessage(content="답" * size, id=f"ai-{i}"),
+    ]
+
+
+def _history(turns: int, size: int = 100) -> list:
+    messages: list = []
+    for i in range(turns):
+        messages = add_messages(messages, _turn(i, size))
+    return messages
+
+
+def _compactor(summary: str = "요약") -> HistoryCompactor:
+    llm = MagicMock()
+    llm.ainvoke = AsyncMock(return_value=AIMessage(content=summary))
+    return HistoryCompactor(llm=llm, keep_turns=2, char_budget=500)
+
+
+def test_system_prompt_kept_once():
+    """매 턴 추가되는 시스템 프롬프트가 한 번만 남아야 함"""
+    pinned, turns = split_turns(_history(turns=5))
+
+    assert len(pinned) == 1
+    assert len(turns) == 5
+
+
+def test_compact_under_budget_is_noop():
+    """예산 이내면 요약하지 않음"""
+    compactor = _compactor()
+
+    removals, summary = asyncio.run(compactor.compact(_history(5, size=10), "기존"))
+
+    assert removals == []
+    assert summary == "기존"
+    compactor.llm.ainvoke.assert_not_called()
+
+
+def test_compact_folds_old_turns():
+    """오래된 턴은 요약으로 병합되고 최근 턴은 원문으로 남아야 함"""
+    compactor = _compactor(summary="전세 보증금 반환 상담")
+    messages = _history(turns=5, size=200)
+
+    removals, summary = asyncio.run(compactor.compact(messages, None))
+    compacted = add_messages(messages, removals)
+    pinned, turns = split_turns(compacted)
+
+    assert summary == "전세 보증금 반환 상담"
+    assert len(removals) == 6
+    assert len(pinned) == 1
+    assert [t[-1].id for t in turns] == ["ai-3", "ai-4"]
+
+
+def test_compact_keeps_history_on_llm_failure():
+    """요약 실패 시 기록을 유지"""
+    compactor = _compactor()
+    compactor.llm.ainvoke = AsyncMock(side_effect=RuntimeError("timeout"))
+
+    removals, summary = asyncio.run(compactor.compact(_history(5, size=200), "기존"))
+
+    assert removals == []
+    assert summary == "기존"
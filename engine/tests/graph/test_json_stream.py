@@ -0,0 +1,70 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from langchain_core.messages import AIMessageChunk
+
+from engine.graph.json_stream import JsonStringFieldParser
+from engine.graph.nodes.generator import Generator
+from engine.graph.schema import GeneratorResponse, NodeType
+
+ANSWER = '전세 "보증금"은\n반환 대상입니다 \\ 확인 🏠'
+RAW = json.dumps({"answer": ANSWER})
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, len(RAW)])
+def test_parser_decodes_across_chunk_boundaries(size):
+    """이스케이프와 서로게이트 쌍이 청크 경계에서 잘려도 원문이 복원되는지 테스트"""
+    parser = JsonStringFieldParser(field="answer")
+
+    decoded = "".join(parser.feed(RAW[i : i + size]) for i in range(0, len(RAW), size))
+
+    assert decoded == ANSWER
+    assert parser.done
+    assert parser.raw == RAW
+
+
+def test_parser_waits_for_field_key():
+    """필드 키가 완성되기 전에는 아무것도 내보내지 않음"""
+    parser = JsonStringFieldParser(field="answer")
+
+    assert parser.feed('{"ans') == ""
+    assert parser.feed('wer": "안') == "안"
+    assert parser.feed('녕"}') == "녕"
+    assert parser.feed(" ") == ""
+
+
+def _chunks(raw: str, size: int):
+    for i in range(0, len(raw), size):
+        yield AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": None, "args": raw[i : i + size], "id": None, "index": 0}
+            ],
+        )
+
+
+def test_generator_streams_answer_deltas():
+    """Generator가 answer 델타를 writer로 내보내고 검증된 응답을 반환하는지 테스트"""
+    llm = MagicMock()
+
+    async def astream(_):
+        for chunk in _chunks(RAW, 4):
+            yield chunk
+
+    llm.bind_tools.return_value.astream = astream
+    generator = Generator(llm=llm)
+    llm.bind_tools.assert_called_once_with(
+        [GeneratorResponse], tool_choice="GeneratorResponse"
+    )
+
+    written = []
+    with patch(
+        "engine.graph.nodes.base.get_stream_writer", return_value=written.append
+    ):
+        response = asyncio.run(generator._ask_llm("prompt"))
+
+    assert response == GeneratorResponse(answer=ANSWER)
+    assert len(written) > 1
+    assert all(w["node"] == NodeType.GENERATOR for w in written)
+    assert "".join(w["delta"] for w in written) == ANSWER
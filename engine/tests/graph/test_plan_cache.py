@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import patch
+import pytest
+from langchain_core.embeddings import Embeddings
+from engine.graph.plan_cache import PlanCache
+from engine.graph.schema import NodeType, PlannerResponse
+
+
+class FakeEmbeddings(Embeddings):
+    """문장에 포함된 키워드로 방향이 정해지는 가짜 임베딩"""
+
+    VOCAB = ["전세", "사기", "매매", "실거래가", "세금"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return [1.0 if word in text else 0.0 for word in self.VOCAB] + [0.1]
+
+
+PLAN = PlannerResponse(
+    refined_query="전세사기 대응 방법",
+    intention="전세사기 법률 대응",
+    node_stack=[NodeType.LEGAL_RETRIEVER, NodeType.GENERATOR],
+)
+
+
+class TestPlanCache:
+
+    @pytest.fixture
+    def cache(self):
+        return PlanCache(embeddings=FakeEmbeddings(), threshold=0.95)
+
+    def test_paraphrase_hits_and_returns_independent_copy(self, cache):
+        """유사 쿼리는 저장된 계획을 반환하고, 반환 객체 변경이 캐시에 영향을 주지 않는지 테스트"""
+
+        async def run():
+            await cache.put("전세 사기 당했어요", "", PLAN)
+            first = await cache.get("전세사기 당하면 어떻게 해?", "")
+            first.pop_stack()
+            second = await cache.get("전세 사기 대처법", "")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first.node_stack == [NodeType.GENERATOR]
+        assert second.node_stack == PLAN.node_stack
+        assert cache.stats()["hits"] == 2
+
+    def test_hit_keeps_live_query_as_refined_query(self, cache):
+        """엔티티만 다른 유사 쿼리는 계획만 재사용하고 refined_query는 현재 쿼리를 유지하는지 테스트"""
+        plan = PlannerResponse(
+            refined_query="강남구 전세 시세",
+            intention="전세 시세 조회",
+            node_stack=[NodeType.DOC_RETRIEVER, NodeType.GENERATOR],
+        )
+
+        async def run():
+            await cache.put("강남구 전세", "", plan)
+            return await cache.get("서초구 전세", "")
+
+        cached = asyncio.run(run())
+        assert cached is not None
+        assert cached.refined_query == "서초구 전세"
+        assert cached.intention == plan.intention
+        assert cached.node_stack == plan.node_stack
+
+    def test_different_feedback_or_topic_misses(self, cache):
+
+        async def run():
+            await cache.put("전세 사기 당했어요", "", PLAN)
+            return (
+                await cache.get("전세 사기 당했어요", "판례 위주로 다시"),
+                await cache.get("매매 실거래가 알려줘", ""),
+            )
+
+        assert asyncio.run(run()) == (None, None)
+        assert cache.hit_rate == 0.0
+
+    def test_lru_eviction_and_ttl(self):
+        cache = PlanCache(embeddings=FakeEmbeddings(), threshold=0.95, maxsize=1)
+
+        async def run():
+            await cache.put("전세 사기", "", PLAN)
+            await cache.put("세금 문의", "", PLAN)
+            return await cache.get("전세 사기", ""), await cache.get("세금 문의", "")
+
+        evicted, kept = asyncio.run(run())
+        assert evicted is None and kept is not None
+
+        expired = PlanCache(embeddings=FakeEmbeddings(), ttl=-1)
+        asyncio.run(expired.put("전세 사기", "", PLAN))
+        assert asyncio.run(expired.get("전세 사기", "")) is None
+
+    def test_stats_summary_logged_per_interval(self):
+        """적중/미스마다가 아니라 log_interval마다 한 번 info로 요약해야 함"""
+        quiet = PlanCache(embeddings=FakeEmbeddings(), log_interval=3600)
+        chatty = PlanCache(embeddings=FakeEmbeddings(), log_interval=0)
+
+        with patch("engine.graph.plan_cache.logger") as logger:
+            asyncio.run(quiet.get("전세 사기", ""))
+            assert logger.info.call_count == 0
+
+            asyncio.run(chatty.get("전세 사기", ""))
+            logger.info.assert_called_once()
+            assert "'misses': 1" in logger.info.call_args.args[0]
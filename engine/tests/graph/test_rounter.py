@@ -2,6 +2,7 @@ import pytest
 from engine.graph.schema import NodeType, HumanAction, EvaluationResponse, HumanFeedback
 from engine.graph.state import StateKey, AgentState
 from typing import cast
+from langgraph.types import Send
 from engine.graph.router import (
     route_after_dispatcher,
     route_after_verifier,
@@ -17,6 +18,27 @@ class TestRouterLogic:
         state = cast(AgentState, {StateKey.NEXT_NODE: NodeType.LEGAL_RETRIEVER})
         assert route_after_dispatcher(state) == NodeType.LEGAL_RETRIEVER
 
+    def test_route_after_dispatcher_parallel(self):
+        """PARALLEL_RETRIEVER면 대상 리트리버마다 Send로 분기"""
+        state = cast(
+            AgentState,
+            {
+                StateKey.NEXT_NODE: NodeType.PARALLEL_RETRIEVER,
+                StateKey.PARALLEL_TARGETS: [
+                    NodeType.LEGAL_RETRIEVER,
+                    NodeType.DOC_RETRIEVER,
+                ],
+            },
+        )
+        sends = route_after_dispatcher(state)
+
+        assert all(isinstance(s, Send) for s in sends)
+        assert [s.node for s in sends] == [NodeType.PARALLEL_RETRIEVER] * 2
+        assert [s.arg[StateKey.VERIFIER_TARGET_NODE] for s in sends] == [
+            NodeType.LEGAL_RETRIEVER,
+            NodeType.DOC_RETRIEVER,
+        ]
+
     def test_route_after_verifier(self):
         """Verifier 검증 결과에 따른 루프/진행 테스트"""
         # Case 1: 검증 실패 시 해당 노드로 다시 돌아감 (Retry)
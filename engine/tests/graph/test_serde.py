@@ -0,0 +1,51 @@
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from engine.graph.schema import NodeType, PlannerResponse
+from engine.graph.serde import CompressedSerializer
+
+
+def _state() -> dict:
+    return {
+        "messages": [
+            HumanMessage(content="전세 보증금을 돌려받지 못했어요. " * 20),
+            AIMessage(content="임차권등기명령을 신청할 수 있습니다. " * 20),
+        ],
+        "planner_response": PlannerResponse(
+            refined_query="전세 보증금 반환",
+            intention="법률 상담",
+            node_stack=[NodeType.LEGAL_RETRIEVER, NodeType.GENERATOR],
+        ),
+        "retrieved_docs": {"legal_retriever": {"Expc": [{"안건명": "전세"}] * 50}},
+    }
+
+
+def test_roundtrip_compresses_large_values():
+    """큰 상태는 zstd로 압축되고 원래 객체로 복원되는지 테스트"""
+    serde = CompressedSerializer()
+    state = _state()
+
+    type_, data = serde.dumps_typed(state)
+
+    assert type_ == "msgpack+zstd"
+    assert serde.loads_typed((type_, data)) == state
+    assert serde.stats.stored_bytes < serde.stats.raw_bytes
+    assert serde.stats.ratio < 0.5
+
+
+def test_small_values_stay_uncompressed():
+    """min_size 미만 값은 압축하지 않음"""
+    serde = CompressedSerializer(min_size=512)
+
+    type_, data = serde.dumps_typed({"answer": "네"})
+
+    assert not type_.endswith("+zstd")
+    assert serde.loads_typed((type_, data)) == {"answer": "네"}
+
+
+def test_reads_legacy_uncompressed_checkpoints():
+    """기존 JsonPlusSerializer로 저장된 체크포인트도 읽을 수 있어야 함"""
+    state = _state()
+    legacy = JsonPlusSerializer().dumps_typed(state)
+
+    assert CompressedSerializer().loads_typed(legacy) == state
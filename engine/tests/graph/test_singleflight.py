@@ -0,0 +1,99 @@
+import asyncio
+import orjson
+from unittest.mock import AsyncMock, MagicMock
+
+from engine.graph.singleflight import SingleFlight, flight_key
+from engine.graph.stream import StreamEvent, StreamEventType
+
+EVENTS = [
+    StreamEvent(StreamEventType.NODE_START, {"node": "planner"}),
+    StreamEvent(StreamEventType.TOKEN, {"delta": "답변"}),
+    StreamEvent(StreamEventType.FINAL, {"answer": "답변"}),
+]
+
+
+def _source(calls: list):
+    async def source():
+        calls.append(1)
+        for event in EVENTS:
+            await asyncio.sleep(0.01)
+            yield event
+
+    return source
+
+
+async def _collect(flight: SingleFlight, key: str, origin: dict, source):
+    return [item async for item in flight.join(key, origin, source)]
+
+
+def test_flight_key_normalizes_query():
+    """공백/대소문자/전각 차이는 같은 키로 취급"""
+    assert flight_key("전세  사기 ＡＢＣ") == flight_key(" 전세 사기 abc ")
+    assert flight_key("전세 사기", {"지역": "서울"}) != flight_key("전세 사기")
+
+
+def test_concurrent_joins_share_one_execution():
+    """동시 요청은 한 번만 실행되고 모두 같은 이벤트를 받아야 함"""
+    calls: list = []
+    flight = SingleFlight()
+
+    async def run():
+        return await asyncio.gather(
+            _collect(flight, "k", {"thread_id": "a"}, _source(calls)),
+            _collect(flight, "k", {"thread_id": "b"}, _source(calls)),
+        )
+
+    leader, follower = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert [e for e, _ in leader] == EVENTS
+    assert [e for e, _ in follower] == EVENTS
+    assert all(origin is None for _, origin in leader)
+    assert all(origin == {"thread_id": "a"} for _, origin in follower)
+
+
+def test_leader_disconnect_does_not_stop_followers():
+    """리더 요청이 중간에 끊겨도 팔로워는 끝까지 받아야 함"""
+    calls: list = []
+    flight = SingleFlight()
+
+    async def run():
+        leader = flight.join("k", {"thread_id": "a"}, _source(calls))
+        await leader.__anext__()
+        follower = asyncio.create_task(
+            _collect(flight, "k", {"thread_id": "b"}, _source(calls))
+        )
+        await leader.aclose()
+        return await follower
+
+    follower = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert [e for e, _ in follower] == EVENTS
+
+
+def test_remote_follower_replays_redis_stream():
+    """다른 워커가 리더면 Redis Stream의 이벤트를 재생"""
+    redis = MagicMock()
+    redis.set = AsyncMock(return_value=False)
+    redis.get = AsyncMock(
+        return_value=orjson.dumps(
+            {"origin": {"thread_id": "remote"}, "flight_id": "f1"}
+        ).decode()
+    )
+    entries = [
+        (f"{i}-0", {"event": e.event.value, "data": orjson.dumps(e.data).decode()})
+        for i, e in enumerate(EVENTS, start=1)
+    ]
+    redis.xread = AsyncMock(
+        return_value=[("k:f1:events", [*entries, ("9-0", {"done": "1"})])]
+    )
+    calls: list = []
+
+    follower = asyncio.run(
+        _collect(SingleFlight(redis_client=redis), "k", {}, _source(calls))
+    )
+
+    assert calls == []
+    assert [e for e, _ in follower] == EVENTS
+    assert all(origin == {"thread_id": "remote"} for _, origin in follower)
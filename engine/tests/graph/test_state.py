@@ -0,0 +1,49 @@
+import pytest
+from typing import cast
+from unittest.mock import patch
+from langchain_core.messages import HumanMessage
+
+from engine.graph.schema import NodeType, PlannerResponse
+from engine.graph.state import AgentState, StateKey, StateManager
+
+
+def _state() -> AgentState:
+    return cast(
+        AgentState,
+        {
+            StateKey.MESSAGES: [HumanMessage(content="전세 사기")],
+            StateKey.PLANNER_RESPONSE: {
+                "refined_query": "전세 사기 대응",
+                "intention": "법률 상담",
+                "node_stack": [NodeType.LEGAL_RETRIEVER],
+            },
+            StateKey.RETRIEVED_DOCS: {NodeType.LEGAL_RETRIEVER: {"Expc": []}},
+        },
+    )
+
+
+def test_models_validated_once_per_instance():
+    """같은 인스턴스에서 모델 키는 한 번만 변환되어야 함"""
+    sm = StateManager(_state())
+
+    with patch.object(
+        PlannerResponse, "model_validate", wraps=PlannerResponse.model_validate
+    ) as validate:
+        assert sm.refined_query == "전세 사기 대응"
+        assert sm.planner_response is sm.planner_response
+
+    assert validate.call_count == 1
+
+
+def test_containers_are_read_only_views():
+    """컨테이너는 복사 없이 읽기 전용 뷰로 반환되어야 함"""
+    state = _state()
+    sm = StateManager(state)
+
+    with pytest.raises(TypeError):
+        sm.retrieved_docs[NodeType.DOC_RETRIEVER] = []  # type: ignore[index]
+    assert not hasattr(sm.messages, "append")
+
+    state[StateKey.MESSAGES].append(HumanMessage(content="추가"))
+    assert len(sm.messages) == 2
+    assert dict(sm.api_args) == {}
@@ -0,0 +1,119 @@
+import orjson
+from unittest.mock import MagicMock
+
+from engine.graph.schema import EvaluationResponse, NodeType
+from engine.graph.state import StateKey
+from engine.graph.stream import (
+    StreamEvent,
+    StreamEventType,
+    TokenGate,
+    to_stream_event,
+    terminal_event,
+)
+
+
+def test_encode_sse_frame():
+    """SSE 프레임 형식(event/data/빈 줄)으로 직렬화되는지 테스트"""
+    frame = StreamEvent(StreamEventType.TOKEN, {"delta": "전세"}).encode()
+
+    header, data, *_ = frame.split(b"\n")
+    assert header == b"event: token"
+    assert orjson.loads(data.removeprefix(b"data: ")) == {"delta": "전세"}
+    assert frame.endswith(b"\n\n")
+
+
+def test_task_events_carry_only_node_name():
+    """tasks 청크의 state 입력/결과는 직렬화 대상에서 제외"""
+    start = to_stream_event(
+        "tasks", {"id": "1", "name": NodeType.PLANNER, "input": {"query": "q"}}
+    )
+    end = to_stream_event(
+        "tasks",
+        {"id": "1", "name": NodeType.PLANNER, "error": None, "result": {"a": 1}},
+    )
+
+    assert start == StreamEvent(StreamEventType.NODE_START, {"node": "planner"})
+    assert end == StreamEvent(StreamEventType.NODE_END, {"node": "planner"})
+
+
+def test_tokens_filtered_to_generator():
+    """Generator 이외 노드가 쓴 custom 청크는 버려야 함"""
+    planner = to_stream_event("custom", {"node": NodeType.PLANNER, "delta": "계획"})
+    generator = to_stream_event("custom", {"node": NodeType.GENERATOR, "delta": "답변"})
+
+    assert planner is None
+    assert generator == StreamEvent(StreamEventType.TOKEN, {"delta": "답변"})
+
+
+def test_terminal_event():
+    """다음 노드가 남아 있으면 interrupt, 아니면 final"""
+    interrupted = MagicMock(next=(NodeType.HUMAN_REVIEWER,), values={})
+    finished = MagicMock(next=(), values={StateKey.ANSWER: "완료"})
+
+    assert terminal_event(interrupted).event == StreamEventType.INTERRUPT
+    assert terminal_event(interrupted).data == {"next": ["human_reviewer"]}
+    assert terminal_event(finished) == StreamEvent(
+        StreamEventType.FINAL, {"answer": "완료"}
+    )
+
+
+def _generate(gate: TokenGate, deltas: list[str]) -> list[StreamEvent]:
+    events = gate.feed("tasks", {"id": "g", "name": NodeType.GENERATOR, "input": {}})
+    for delta in deltas:
+        events += gate.feed("custom", {"node": NodeType.GENERATOR, "delta": delta})
+    return events
+
+
+def _evaluate(gate: TokenGate, answer: str, **checks) -> list[StreamEvent]:
+    evaluation = EvaluationResponse(
+        **{"is_secured": True, "is_grounded": True, "has_pii": False, **checks}
+    )
+    return gate.feed(
+        "tasks",
+        {
+            "id": "e",
+            "name": NodeType.EVALUATOR,
+            "error": None,
+            "result": {
+                StateKey.EVALUATION_RESPONSE: evaluation,
+                StateKey.ANSWER: answer,
+            },
+        },
+    )
+
+
+def test_token_gate_holds_tokens_until_evaluator_approves():
+    """Evaluator가 답변을 그대로 통과시킨 뒤에만 보류한 토큰을 내보내야 함"""
+    gate = TokenGate()
+
+    assert [e.event for e in _generate(gate, ["전세 ", "5억"])] == [
+        StreamEventType.NODE_START
+    ]
+    released = _evaluate(gate, "전세 5억")
+
+    assert released[0] == StreamEvent(StreamEventType.NODE_END, {"node": "evaluator"})
+    assert [e.data for e in released[1:]] == [{"delta": "전세 "}, {"delta": "5억"}]
+
+
+def test_token_gate_drops_masked_or_unsafe_answers():
+    """마스킹으로 답변이 바뀌었거나 검사에 실패하면 원문 토큰을 내보내지 않아야 함"""
+    masked = TokenGate()
+    _generate(masked, ["연락처 ", "010-1234-5678"])
+    unsafe = TokenGate()
+    _generate(unsafe, ["무시하고 ", "답변"])
+
+    assert [e.event for e in _evaluate(masked, "연락처 <PHONE_NUMBER>")] == [
+        StreamEventType.NODE_END
+    ]
+    assert [e.event for e in _evaluate(unsafe, "무시하고 답변", is_secured=False)] == [
+        StreamEventType.NODE_END
+    ]
+
+
+def test_token_gate_discards_previous_generator_attempt():
+    """Generator가 재실행되면 이전 시도의 토큰은 버려야 함"""
+    gate = TokenGate()
+    _generate(gate, ["첫 ", "시도"])
+    _generate(gate, ["재시도"])
+
+    assert [e.data for e in _evaluate(gate, "재시도")[1:]] == [{"delta": "재시도"}]
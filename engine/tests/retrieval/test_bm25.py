@@ -0,0 +1,156 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from engine.retrieval.bm25 import BM25Index
+from engine.retrieval.doc_search import (
+    DOCUMENTS_KEY,
+    HybridDocumentSearch,
+    reciprocal_rank_fusion,
+)
+from engine.retrieval.tokenizer import KoreanTokenizer
+
+DOCS = [
+    {"content": "서대문구 래미안 아파트 전세"},
+    {"content": "마포구 원룸 월세"},
+    {"content": "서대문구 빌라 매매"},
+]
+
+
+def _contents(results) -> list[str]:
+    return [payload["content"] for payload, _ in results]
+
+
+def test_bm25_ranks_exact_tokens():
+    index = BM25Index(tokenizer=str.split)
+    index.add(DOCS)
+
+    assert _contents(index.search("서대문구 래미안", limit=2)) == [
+        "서대문구 래미안 아파트 전세",
+        "서대문구 빌라 매매",
+    ]
+    assert index.search("강남구") == []
+
+
+def test_bm25_incremental_update_and_compaction():
+    """같은 문서 재추가/삭제 후에도 compact 전후 검색 결과와 점수가 같아야 함"""
+    index = BM25Index(tokenizer=str.split, compact_ratio=1.0)
+    index.add(DOCS)
+    index.add([DOCS[0]])
+    index.remove([DOCS[1]])
+
+    assert len(index) == 2
+    before = index.search("서대문구 월세")
+    index.compact()
+    after = index.search("서대문구 월세")
+
+    assert _contents(before) == _contents(after)
+    assert [score for _, score in before] == [score for _, score in after]
+    assert "마포구 원룸 월세" not in _contents(after)
+
+
+def test_bm25_save_and_load(tmp_path):
+    index = BM25Index(tokenizer=str.split)
+    index.add(DOCS)
+    index.remove([DOCS[2]])
+    path = str(tmp_path / "bm25")
+    index.save(path)
+
+    assert BM25Index.exists(path)
+    loaded = BM25Index.load(path, tokenizer=str.split)
+    assert len(loaded) == 2
+    assert loaded.search("서대문구 아파트") == index.search("서대문구 아파트")
+
+
+def test_reciprocal_rank_fusion_prefers_documents_in_both_rankings():
+    a, b, c = DOCS
+    fused = reciprocal_rank_fusion([[a, b], [c, b]], k=60, limit=2)
+
+    assert fused[0] == b
+    assert len(fused) == 2
+
+
+def test_korean_tokenizer_keeps_content_morphemes():
+    """조사/어미/기호 형태소는 버리고 명사·숫자 형태소만 남겨야 함"""
+    tokens = [
+        SimpleNamespace(
+            text="서대문구에서",
+            lemma_="서대문구+에서",
+            tag_="NNP+JKB",
+            is_space=False,
+            is_punct=False,
+        ),
+        SimpleNamespace(
+            text="101동", lemma_="101+동", tag_="SN+NNB", is_space=False, is_punct=False
+        ),
+        SimpleNamespace(text=".", lemma_=".", tag_="SF", is_space=False, is_punct=True),
+    ]
+    nlp = MagicMock(return_value=tokens)
+
+    assert KoreanTokenizer(nlp=nlp)("서대문구에서 101동.") == ["서대문구", "101", "동"]
+
+
+def test_hybrid_document_search_fuses_dense_and_lexical():
+    index = BM25Index(tokenizer=str.split)
+    index.add(DOCS)
+    embeddings = MagicMock()
+    embeddings.aembed_query = AsyncMock(return_value=[0.1])
+    search_fn = AsyncMock(return_value=[DOCS[1], DOCS[2]])
+
+    doc_search = HybridDocumentSearch(
+        embeddings=embeddings,
+        search_fn=search_fn,
+        collection_name="documents",
+        bm25=index,
+        limit=2,
+        candidates=10,
+    )
+    result = asyncio.run(doc_search.search("서대문구 빌라"))
+
+    search_fn.assert_awaited_once_with("documents", [0.1], 10)
+    assert result[DOCUMENTS_KEY][0] == DOCS[2]
+    assert len(result[DOCUMENTS_KEY]) == 2
+
+
+def test_bm25_concurrent_add_and_search():
+    """스레드에서 검색하는 동안 색인을 추가/삭제해도 버퍼 크기 변경 오류가 없어야 함"""
+    index = BM25Index(tokenizer=str.split, compact_ratio=0.5)
+    index.add(DOCS)
+    errors: list[Exception] = []
+
+    def search():
+        try:
+            for _ in range(300):
+                index.search("서대문구 월세")
+        except Exception as e:
+            errors.append(e)
+
+    def update():
+        try:
+            for i in range(300):
+                doc = {"content": f"서대문구 오피스텔 월세 {i}"}
+                index.add([doc])
+                index.remove([doc])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=search), threading.Thread(target=update)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(index) == 3
+
+
+def test_bm25_save_if_dirty(tmp_path):
+    path = str(tmp_path / "bm25")
+    index = BM25Index(tokenizer=str.split)
+
+    assert index.save_if_dirty(path) is False
+    index.add(DOCS)
+    assert index.save_if_dirty(path) is True
+    assert index.save_if_dirty(path) is False
+    assert len(BM25Index.load(path, tokenizer=str.split)) == 3
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from engine.graph.nodes.doc_retriever import DocumentsRetriever
+from engine.graph.nodes.verifier import Verifier
+from engine.graph.schema import DocumentSearchQuery, NodeType
+from engine.retrieval.doc_search import DOCUMENTS_KEY, DocumentSearch
+from engine.retrieval.embedding import CachedEmbeddings
+
+
+def _embeddings() -> MagicMock:
+    embeddings = MagicMock()
+    embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+    return embeddings
+
+
+def test_cached_embeddings_hits_on_normalized_query():
+    """공백/유니코드 정규화 후 같은 쿼리는 인코더를 다시 호출하지 않아야 함"""
+    inner = _embeddings()
+    cached = CachedEmbeddings(inner, maxsize=8)
+
+    async def scenario():
+        first = await cached.aembed_query("서대문구  아파트 ")
+        second = await cached.aembed_query("서대문구 아파트")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second == [0.1, 0.2]
+    inner.aembed_query.assert_awaited_once_with("서대문구 아파트")
+    assert cached.stats()["hits"] == 1
+    assert cached.stats()["misses"] == 1
+
+
+def test_document_search_embeds_and_searches():
+    """쿼리 임베딩으로 search_fn을 호출하고 documents 키로 결과를 반환해야 함"""
+    search_fn = AsyncMock(return_value=[{"content": "매물1"}])
+    doc_search = DocumentSearch(
+        embeddings=_embeddings(),
+        search_fn=search_fn,
+        collection_name="documents",
+        limit=3,
+    )
+
+    result = asyncio.run(doc_search.search("마포구 전세"))
+
+    assert result == {DOCUMENTS_KEY: [{"content": "매물1"}]}
+    search_fn.assert_awaited_once_with("documents", [0.1, 0.2], 3)
+
+
+@patch("engine.graph.nodes.base.AgentSpecLoader")
+def test_documents_retriever_execute_tool(MockBaseLoader):
+    MockBaseLoader.load_tool_argument_prompt.return_value = "dummy prompt"
+    doc_search = MagicMock()
+    doc_search.search = AsyncMock(return_value={DOCUMENTS_KEY: [{"content": "a"}]})
+
+    retriever = DocumentsRetriever(llm=MagicMock(), doc_search=doc_search)
+    result = asyncio.run(retriever._execute_tool(DocumentSearchQuery(query="실거래가")))
+
+    assert result[DOCUMENTS_KEY] == [{"content": "a"}]
+    doc_search.search.assert_awaited_once_with("실거래가")
+
+
+def test_verifier_counts_retrieved_documents():
+    verifier = Verifier(prompt_guard=MagicMock())
+
+    assert (
+        verifier.doc_len(
+            target_node=NodeType.DOC_RETRIEVER,
+            target_doc={DOCUMENTS_KEY: [{"content": "a"}, {"content": "b"}]},
+        )
+        == 2
+    )
+    assert verifier.doc_len(target_node=NodeType.DOC_RETRIEVER, target_doc={}) == 0
+
+
+def test_search_many_uses_single_batch_call_and_dedupes():
+    """여러 쿼리는 batch_search_fn 한 번으로 검색하고 겹친 문서는 한 번만 반환해야 함"""
+    a, b, c = {"content": "a"}, {"content": "b"}, {"content": "c"}
+    search_fn = AsyncMock()
+    batch_search_fn = AsyncMock(return_value=[[a, b], [b, c]])
+    doc_search = DocumentSearch(
+        embeddings=_embeddings(),
+        search_fn=search_fn,
+        collection_name="documents",
+        limit=3,
+        batch_search_fn=batch_search_fn,
+    )
+
+    result = asyncio.run(
+        doc_search.search_many(["전세 매물", "전세 서류", "전세 매물"])
+    )
+
+    batch_search_fn.assert_awaited_once_with("documents", [[0.1, 0.2], [0.1, 0.2]], 3)
+    search_fn.assert_not_awaited()
+    assert result[DOCUMENTS_KEY][0] == b
+    assert len(result[DOCUMENTS_KEY]) == 3
+
+
+def test_search_many_falls_back_to_single_search():
+    search_fn = AsyncMock(return_value=[{"content": "a"}])
+    doc_search = DocumentSearch(
+        embeddings=_embeddings(), search_fn=search_fn, collection_name="documents"
+    )
+
+    result = asyncio.run(doc_search.search_many(["전세", " "]))
+
+    assert result == {DOCUMENTS_KEY: [{"content": "a"}]}
+    search_fn.assert_awaited_once_with("documents", [0.1, 0.2], 5)
+
+
+@patch("engine.graph.nodes.base.AgentSpecLoader")
+def test_documents_retriever_batches_sub_queries(MockBaseLoader):
+    MockBaseLoader.load_tool_argument_prompt.return_value = "dummy prompt"
+    doc_search = MagicMock()
+    doc_search.search_many = AsyncMock(return_value={DOCUMENTS_KEY: []})
+
+    retriever = DocumentsRetriever(llm=MagicMock(), doc_search=doc_search)
+    asyncio.run(
+        retriever._execute_tool(
+            DocumentSearchQuery(query="마포구 전세", sub_queries=["전세 계약 서류"])
+        )
+    )
+
+    doc_search.search_many.assert_awaited_once_with(["마포구 전세", "전세 계약 서류"])
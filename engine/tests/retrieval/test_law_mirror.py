@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+from engine.graph.schema import LegalSearchQuery
+from engine.retrieval.law_mirror import LawMirror
+
+ITEMS = [
+    {
+        "법령해석례일련번호": "313107",
+        "안건명": "전세사기 피해자 지원 및 주거안정에 관한 특별법 제3조 관련",
+        "안건번호": "23-0512",
+        "질의기관코드": "1613000",
+        "질의기관명": "국토교통부",
+        "회신기관코드": "1170000",
+        "회신기관명": "법제처",
+        "회신일자": "2023.09.14",
+    },
+    {
+        "법령해석례일련번호": "300001",
+        "안건명": "주택임대차보호법 제3조의2 관련",
+        "안건번호": "19-0101",
+        "질의기관코드": "1270000",
+        "질의기관명": "법무부",
+        "회신기관코드": "1170000",
+        "회신기관명": "법제처",
+        "회신일자": "2019.03.02",
+    },
+]
+
+
+def run_with_mirror(coro_fn, max_age_sec: float = 3600):
+    async def run():
+        mirror = LawMirror(db_path=":memory:", max_age_sec=max_age_sec)
+        await mirror.open()
+        try:
+            await mirror.upsert(
+                ITEMS, bodies={"300001": "대항력 취득 시점에 관한 회답"}
+            )
+            return await coro_fn(mirror)
+        finally:
+            await mirror.close()
+
+    return asyncio.run(run())
+
+
+def titles(result: dict | None) -> list[str]:
+    assert result is not None
+    return [item["안건명"] for item in result["Expc"]["expc"]]
+
+
+def test_keyword_search_matches_compound_korean_words():
+    """trigram 인덱스로 복합어 내부 부분 일치가 되는지 테스트"""
+    result = run_with_mirror(lambda m: m.search(LegalSearchQuery(keyword="전세사기")))
+    assert titles(result) == [ITEMS[0]["안건명"]]
+
+
+def test_short_keyword_and_body_search():
+    """3글자 미만 키워드와 본문 검색(search=2)이 동작하는지 테스트"""
+    result = run_with_mirror(
+        lambda m: m.search(LegalSearchQuery(keyword="대항력", search=2))
+    )
+    assert titles(result) == [ITEMS[1]["안건명"]]
+
+    result = run_with_mirror(lambda m: m.search(LegalSearchQuery(keyword="제3조")))
+    assert len(titles(result)) == 2
+
+
+def test_indexed_filters():
+    """itmno, 날짜 범위, 질의기관, gana 필터가 적용되는지 테스트"""
+
+    async def run(mirror: LawMirror):
+        return (
+            await mirror.search(LegalSearchQuery(keyword="관련", itmno="23-0512")),
+            await mirror.search(
+                LegalSearchQuery(keyword="관련", explYd="20190101~20191231")
+            ),
+            await mirror.search(LegalSearchQuery(keyword="관련", inq="법무부")),
+            await mirror.search(LegalSearchQuery(keyword="관련", gana="ja")),
+        )
+
+    by_itmno, by_date, by_inq, by_gana = run_with_mirror(run)
+    assert titles(by_itmno) == [ITEMS[0]["안건명"]]
+    assert titles(by_date) == [ITEMS[1]["안건명"]]
+    assert titles(by_inq) == [ITEMS[1]["안건명"]]
+    assert titles(by_gana) == [ITEMS[0]["안건명"], ITEMS[1]["안건명"]]
+
+
+def test_miss_and_stale_records_fall_through():
+    """결과가 없거나 오래된 레코드는 None을 반환해 원격 API로 넘기는지 테스트"""
+    assert (
+        run_with_mirror(lambda m: m.search(LegalSearchQuery(keyword="재개발조합")))
+        is None
+    )
+    assert (
+        run_with_mirror(
+            lambda m: m.search(LegalSearchQuery(keyword="전세사기")), max_age_sec=-1
+        )
+        is None
+    )
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+from langchain_core.messages import HumanMessage
+
+from engine.graph.schema import NodeType
+from engine.graph.workflow import build_workflow
+from engine.security.guard import PromptGuard
+
+MESSAGES = [HumanMessage(content="서대문구 전세 시세 알려줘")]
+
+
+def _guard(handler) -> PromptGuard:
+    return PromptGuard(transport=httpx.MockTransport(handler))
+
+
+def test_nodes_share_injected_guard():
+    """build_workflow에 주입한 PromptGuard 하나를 모든 노드가 공유하고 새로 만들지 않아야 함"""
+    guard = _guard(lambda request: httpx.Response(200, json={"flagged": False}))
+
+    with patch("engine.graph.workflow.PromptGuard") as factory:
+        workflow = build_workflow(
+            {node_type: MagicMock() for node_type in NodeType},
+            privacy_service=MagicMock(),
+            prompt_guard=guard,
+        )
+
+    factory.assert_not_called()
+    nodes = [spec.runnable.afunc for spec in workflow.nodes.values()]
+    guards = [node.prompt_guard for node in nodes if hasattr(node, "prompt_guard")]
+    assert len(guards) == 4
+    assert all(g is guard for g in guards)
+
+
+def test_concurrent_checks_reuse_one_client():
+    """동시 검사 요청이 요청마다 클라이언트를 만들지 않고 같은 커넥션 풀을 거쳐야 함"""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"flagged": len(requests) == 3})
+
+    async def run():
+        with patch(
+            "engine.security.guard.httpx.AsyncClient", side_effect=httpx.AsyncClient
+        ) as factory:
+            guard = _guard(handler)
+            results = await asyncio.gather(
+                *(guard.is_secured(MESSAGES) for _ in range(3))
+            )
+            await guard.aclose()
+        return factory.call_count, results
+
+    created, results = asyncio.run(run())
+
+    assert created == 1
+    assert len(requests) == 3
+    assert sorted(results) == [False, True, True]
+    assert requests[0].headers["Authorization"].startswith("Bearer ")
+
+
+def test_aclose_closes_pooled_client():
+    guard = _guard(lambda request: httpx.Response(200, json={"flagged": False}))
+
+    asyncio.run(guard.aclose())
+
+    assert guard._client.is_closed
+
+
+def test_transport_error_fails_closed():
+    """네트워크 오류는 기존 실패 경로(안전하지 않음 판정)를 따라야 함"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    guard = _guard(handler)
+
+    async def run():
+        try:
+            return await guard.is_secured(MESSAGES)
+        finally:
+            await guard.aclose()
+
+    assert asyncio.run(run()) is False
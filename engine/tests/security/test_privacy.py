@@ -0,0 +1,53 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+from engine.security.privacy import PrivacyService
+
+
+def _service() -> PrivacyService:
+    service = PrivacyService(max_workers=1)
+
+    async def start():
+        if service._executor is None:
+            service._executor = ThreadPoolExecutor(max_workers=1)
+
+    service.start = start
+    return service
+
+
+def test_process_fails_closed():
+    """분석 실패 시 마스킹되지 않은 원문을 반환하지 않아야 함"""
+    service = _service()
+
+    with patch(
+        "engine.security.privacy._analyze_in_worker",
+        side_effect=RuntimeError("boom"),
+    ):
+        result = asyncio.run(service.process("010-1234-5678로 연락주세요"))
+
+    assert result["masked_text"] == ""
+    assert result["is_pii"] is True
+
+
+def test_process_restarts_broken_pool_once():
+    """워커 풀이 깨지면 새 풀을 만들어 한 번 재시도해야 함"""
+    service = _service()
+    masked = {"is_pii": True, "masked_text": "<PHONE_NUMBER>", "detected_entities": []}
+
+    with patch(
+        "engine.security.privacy._analyze_in_worker",
+        side_effect=[BrokenProcessPool("worker died"), masked],
+    ):
+
+        async def scenario():
+            await service.start()
+            broken = service._executor
+            result = await service.process("010-1234-5678")
+            return broken, result
+
+        broken, result = asyncio.run(scenario())
+
+    assert result == masked
+    assert service._executor is not broken
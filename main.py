@@ -1,13 +1,27 @@
 from fastapi import FastAPI
-from contextlib import asynccontextmanager
-import aiosqlite
+import asyncio
+from functools import partial
+from contextlib import asynccontextmanager, AsyncExitStack
 from pydantic import SecretStr
+from qdrant_client.models import PayloadSchemaType
 
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.language_models import BaseChatModel
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 from engine import GraphEngine
+from engine.security.privacy import PrivacyService
+from engine.security.guard import PromptGuard
+from engine.retrieval.law_client import LawApiClient
+from engine.retrieval.law_mirror import LawMirror
+from engine.retrieval.doc_search import DocumentSearch, HybridDocumentSearch
+from engine.retrieval.bm25 import BM25Index
+from engine.retrieval.tokenizer import KoreanTokenizer
+from engine.retrieval.embedding import CachedEmbeddings, OnnxEmbedder
+from engine.graph.cache import TieredCache
+from engine.graph.plan_cache import PlanCache
+from engine.graph.serde import CompressedSerializer
+from engine.graph.singleflight import SingleFlight
+from engine.graph.config import config_settings
 
 from engine.graph.schema import NodeType
 from server.logger import logger
@@ -15,7 +29,19 @@ from server.api import api_router
 from server.config import settings
 from server.storage.redis_client import redis_client
 from server.storage.postgresql_client import postgresql_engine
-from server.storage.qdrant_client import qdrant_client
+from server.storage.qdrant_client import (
+    qdrant_client,
+    search_similar_docs,
+    search_similar_docs_many,
+)
+from server.storage.qdrant_collections import (
+    CollectionSpec,
+    ensure_collections,
+    search_params,
+)
+from server.storage.checkpointer import open_checkpointer
+from server.storage.persona_cache import PersonaCache
+from server.storage.sqlite_vec_store import SqliteVecStore
 
 
 @asynccontextmanager
@@ -49,17 +75,189 @@ async def lifespan(app: FastAPI):
             api_key=SecretStr(settings.OPENAI_API_KEY),
             temperature=0,
         ),
+        NodeType.FINALIZER: ChatOpenAI(
+            model="gpt-4o-mini",
+            api_key=SecretStr(settings.OPENAI_API_KEY),
+            temperature=0,
+        ),
     }
 
-    sqlite_conn = await aiosqlite.connect("checkpoints.db")
-    checkpointer = AsyncSqliteSaver(sqlite_conn)
-    await checkpointer.setup()
+    resources = AsyncExitStack()
+    checkpointer = await resources.enter_async_context(
+        open_checkpointer(
+            backend=settings.CHECKPOINTER_BACKEND,
+            sqlite_path=settings.CHECKPOINTER_SQLITE_PATH,
+            postgresql_engine=postgresql_engine,
+            redis_url=settings.REDIS_URL,
+            ttl_min=settings.CHECKPOINTER_TTL_MIN,
+            serde=CompressedSerializer(),
+        )
+    )
 
     app.state.postgresql = postgresql_engine
     app.state.redis_client = redis_client
     app.state.qdrant_client = qdrant_client
 
-    app.state.engine = GraphEngine(llm_map=llm_map, checkpointer=checkpointer)
+    persona_cache = PersonaCache(
+        redis_client=redis_client,
+        maxsize=settings.PERSONA_CACHE_MAXSIZE,
+        ttl=settings.PERSONA_CACHE_TTL_SEC,
+    )
+    await persona_cache.start()
+    app.state.persona_cache = persona_cache
+
+    privacy_service = PrivacyService(max_workers=config_settings.PII_MAX_WORKERS)
+    await privacy_service.start()
+
+    prompt_guard = PromptGuard()
+
+    law_client = LawApiClient(
+        cache=TieredCache(
+            namespace="legal:expc",
+            redis_client=redis_client,
+            maxsize=config_settings.LEGAL_CACHE_MAXSIZE,
+            ttl=config_settings.LEGAL_CACHE_TTL_SEC,
+        )
+    )
+
+    law_mirror: LawMirror | None = None
+    if config_settings.LEGAL_MIRROR_PATH:
+        law_mirror = LawMirror(
+            db_path=config_settings.LEGAL_MIRROR_PATH,
+            max_age_sec=config_settings.LEGAL_MIRROR_MAX_AGE_SEC,
+        )
+        await law_mirror.open()
+
+    doc_search: DocumentSearch | None = None
+    if config_settings.DOC_EMBEDDING_MODEL_DIR:
+        doc_encoder = OnnxEmbedder(
+            model_dir=config_settings.DOC_EMBEDDING_MODEL_DIR,
+            query_prefix=config_settings.DOC_EMBEDDING_QUERY_PREFIX,
+            intra_op_threads=config_settings.DOC_EMBEDDING_THREADS,
+        )
+        doc_embeddings = CachedEmbeddings(
+            doc_encoder,
+            maxsize=config_settings.DOC_EMBEDDING_CACHE_MAXSIZE,
+            ttl=config_settings.DOC_EMBEDDING_CACHE_TTL_SEC,
+        )
+
+        batch_search_fn = None
+        if settings.VECTOR_BACKEND == "qdrant":
+            if settings.QDRANT_BOOTSTRAP:
+                # 기존 컬렉션 설정이 다르면 서버 재색인이 일어나므로 명시적으로 켠 경우에만 실행
+                await ensure_collections(
+                    qdrant_client,
+                    [
+                        CollectionSpec(
+                            name=config_settings.DOC_COLLECTION,
+                            dim=doc_encoder.dim,
+                            hnsw_m=settings.QDRANT_HNSW_M,
+                            hnsw_ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+                            quantization=settings.QDRANT_QUANTIZATION,
+                            on_disk=settings.QDRANT_ON_DISK,
+                            payload_indexes={
+                                "user_id": PayloadSchemaType.KEYWORD,
+                                "source": PayloadSchemaType.KEYWORD,
+                            },
+                        )
+                    ],
+                )
+            qdrant_search_params = search_params(
+                hnsw_ef=settings.QDRANT_HNSW_EF,
+                oversampling=settings.QDRANT_OVERSAMPLING,
+            )
+            search_fn = partial(search_similar_docs, search_params=qdrant_search_params)
+            batch_search_fn = partial(
+                search_similar_docs_many, search_params=qdrant_search_params
+            )
+        else:
+            # 단일 테넌트 배포에서는 네트워크 왕복 없이 노드 로컬 인덱스를 검색
+            vector_store = SqliteVecStore(
+                db_path=settings.SQLITE_VEC_PATH,
+                dim=doc_encoder.dim,
+                mmap_size_mb=settings.SQLITE_VEC_MMAP_MB,
+            )
+            await vector_store.open()
+            resources.push_async_callback(vector_store.close)
+            # vector_sync가 만든 테이블과 인코더 차원이 다르면 첫 검색이 아니라 기동 시 실패
+            await vector_store.ensure_collection(config_settings.DOC_COLLECTION)
+            search_fn = vector_store.search
+
+        bm25_path: str | None = config_settings.DOC_BM25_INDEX_PATH
+        if bm25_path and not BM25Index.exists(bm25_path):
+            # 빈 색인과 RRF를 섞으면 벡터 검색과 다를 바 없으므로 색인을 빌드하기 전까지는 벡터 검색만 사용
+            logger.warning(
+                f"BM25 index not found, hybrid search disabled. path: {bm25_path} "
+                "(build it with `python -m server.storage.bm25_sync`)"
+            )
+            bm25_path = None
+
+        if bm25_path:
+            bm25 = BM25Index.load(
+                bm25_path,
+                tokenizer=KoreanTokenizer(config_settings.DOC_TOKENIZER_MODEL),
+                text_field=config_settings.DOC_BM25_TEXT_FIELD,
+            )
+            # 서빙 중 add/remove로 변경된 경우에만 종료 시 저장 (빌드 CLI가 교체한 파일을 덮어쓰지 않음)
+            resources.push_async_callback(
+                asyncio.to_thread,
+                bm25.save_if_dirty,
+                bm25_path,
+            )
+            doc_search = HybridDocumentSearch(
+                embeddings=doc_embeddings,
+                search_fn=search_fn,
+                collection_name=config_settings.DOC_COLLECTION,
+                bm25=bm25,
+                limit=config_settings.DOC_SEARCH_LIMIT,
+                candidates=config_settings.DOC_HYBRID_CANDIDATES,
+                rrf_k=config_settings.DOC_RRF_K,
+                batch_search_fn=batch_search_fn,
+                max_queries=config_settings.DOC_MAX_QUERIES,
+            )
+        else:
+            doc_search = DocumentSearch(
+                embeddings=doc_embeddings,
+                search_fn=search_fn,
+                collection_name=config_settings.DOC_COLLECTION,
+                limit=config_settings.DOC_SEARCH_LIMIT,
+                batch_search_fn=batch_search_fn,
+                max_queries=config_settings.DOC_MAX_QUERIES,
+                rrf_k=config_settings.DOC_RRF_K,
+            )
+
+    plan_cache: PlanCache | None = None
+    if config_settings.PLAN_CACHE_ENABLED:
+        plan_cache = PlanCache(
+            embeddings=OpenAIEmbeddings(
+                model="text-embedding-3-small",
+                api_key=SecretStr(settings.OPENAI_API_KEY),
+            ),
+            threshold=config_settings.PLAN_CACHE_THRESHOLD,
+            maxsize=config_settings.PLAN_CACHE_MAXSIZE,
+            ttl=config_settings.PLAN_CACHE_TTL_SEC,
+        )
+
+    app.state.plan_cache = plan_cache
+
+    single_flight: SingleFlight | None = None
+    if config_settings.SINGLE_FLIGHT_ENABLED:
+        single_flight = SingleFlight(
+            redis_client=redis_client, ttl=config_settings.SINGLE_FLIGHT_TTL_SEC
+        )
+
+    app.state.engine = GraphEngine(
+        llm_map=llm_map,
+        checkpointer=checkpointer,
+        privacy_service=privacy_service,
+        prompt_guard=prompt_guard,
+        law_client=law_client,
+        law_mirror=law_mirror,
+        doc_search=doc_search,
+        plan_cache=plan_cache,
+        parallel_dispatch=config_settings.PARALLEL_DISPATCH,
+        single_flight=single_flight,
+    )
 
     logger.info("AI Graph Engine Initialized.")
 
@@ -68,7 +266,13 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("Shutting down resources...")
 
-        await sqlite_conn.close()
+        await resources.aclose()
+        await persona_cache.aclose()
+        await privacy_service.close()
+        await prompt_guard.aclose()
+        await law_client.aclose()
+        if law_mirror is not None:
+            await law_mirror.close()
         await postgresql_engine.dispose()
         await redis_client.close()
         await qdrant_client.close()
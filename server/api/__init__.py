@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
 from .inference import router as inference_router
+from .metrics import router as metrics_router
 
 
 api_router = APIRouter()
 
 
 api_router.include_router(prefix="/chat", router=inference_router)
+api_router.include_router(prefix="/metrics", router=metrics_router)
@@ -5,7 +5,7 @@ import uuid
 from typing import AsyncGenerator
 from wrapt import partial
 
-from engine import GraphEngine
+from engine import GraphEngine, StreamEvent
 
 from server.storage.operations import (
     enqueue_memory_task,
@@ -30,8 +30,9 @@ async def new(
         thread_id=thread_id,
         user_id=user_id,
         external_fns=_external_deps(request),
+        coalesce=True,
     )
-    return StreamingResponse(generator, media_type="text/event-stream")
+    return _event_stream(generator)
 
 
 @router.post("/chat/{thread_id}")
@@ -48,7 +49,7 @@ async def run(
         user_id=user_id,
         external_fns=_external_deps(request),
     )
-    return StreamingResponse(generator, media_type="text/event-stream")
+    return _event_stream(generator)
 
 
 @router.post("/chat/{thread_id}/resume")
@@ -65,7 +66,7 @@ async def resume(
         user_id=user_id,
         external_fns=_external_deps(request),
     )
-    return StreamingResponse(generator, media_type="text/event-stream")
+    return _event_stream(generator)
 
 
 @router.get("/chat/{thread_id}/state")
@@ -81,10 +82,24 @@ async def state(
     return state
 
 
+def _event_stream(events: AsyncGenerator[StreamEvent, None]) -> StreamingResponse:
+    async def encode() -> AsyncGenerator[bytes, None]:
+        async for event in events:
+            yield event.encode()
+
+    return StreamingResponse(
+        encode(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def _external_deps(request: Request) -> dict:
     return {
         "search_memory_fn": partial(
-            get_user_persona, db_engine=request.app.state.postgresql
+            get_user_persona,
+            db_engine=request.app.state.postgresql,
+            cache=request.app.state.persona_cache,
         ),
         "push_task_fn": partial(
             enqueue_memory_task, redis_client=request.app.state.redis_client
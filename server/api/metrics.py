@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Request
+
+from server.storage.redis_client import task_stream
+
+router = APIRouter()
+
+
+@router.get("/tasks")
+async def task_metrics() -> dict:
+    """오토스케일러용 작업 스트림 지표 (length, lag, pending, consumers)"""
+    return await task_stream.metrics()
+
+
+@router.get("/plan-cache")
+async def plan_cache_metrics(request: Request) -> dict:
+    """Planner 의미 캐시 적중 지표 (hits, misses, hit_rate, size). 비활성화 시 enabled=False"""
+    plan_cache = request.app.state.plan_cache
+    if plan_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **plan_cache.stats()}
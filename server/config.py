@@ -1,5 +1,6 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Literal
 import os
 
 
@@ -16,7 +17,40 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256")
     QDRANT_HOST: str | None = Field(default=None)
     QDRANT_PORT: int | None = Field(default=None)
+    QDRANT_BOOTSTRAP: bool = Field(default=False)
+    QDRANT_HNSW_M: int = Field(default=16)
+    QDRANT_HNSW_EF_CONSTRUCT: int = Field(default=128)
+    QDRANT_HNSW_EF: int | None = Field(default=128)
+    QDRANT_QUANTIZATION: Literal["none", "scalar", "binary"] = Field(default="scalar")
+    QDRANT_OVERSAMPLING: float = Field(default=2.0)
+    QDRANT_ON_DISK: bool = Field(default=True)
     POSTGRESQL_DSN: str | None = Field(default=None)
+    # sqlite/postgres는 변경되지 않은 채널을 참조로 저장, redis는 매 체크포인트마다 전체 채널을 기록
+    CHECKPOINTER_BACKEND: Literal["sqlite", "postgres", "redis"] = Field(
+        default="sqlite"
+    )
+    CHECKPOINTER_SQLITE_PATH: str = Field(default="checkpoints.db")
+    CHECKPOINTER_TTL_MIN: int | None = Field(default=None)
+    VECTOR_BACKEND: Literal["qdrant", "sqlite_vec"] = Field(default="qdrant")
+    SQLITE_VEC_PATH: str = Field(default="vectors.db")
+    SQLITE_VEC_MMAP_MB: int = Field(default=1024)
+    TASK_STREAM_NAME: str = Field(default="task_stream")
+    TASK_STREAM_GROUP: str = Field(default="persona_extractors")
+    TASK_STREAM_MAXLEN: int = Field(default=100_000)
+    TASK_STREAM_CLAIM_IDLE_MS: int = Field(default=60_000)
+    TASK_STREAM_MAX_DELIVERIES: int = Field(default=5)
+    WORKER_BATCH_SIZE: int = Field(default=32)
+    WORKER_BATCH_WAIT_MS: int = Field(default=50)
+    PERSONA_CACHE_MAXSIZE: int = Field(default=4096)
+    PERSONA_CACHE_TTL_SEC: int = Field(default=3600)
+    PERSONA_FLUSH_ROWS: int = Field(default=256)
+    PERSONA_FLUSH_INTERVAL_MS: int = Field(default=500)
+    PERSONA_MAX_PENDING: int | None = Field(default=None)
+    PERSONA_BACKEND: Literal["torch", "onnx"] = Field(default="torch")
+    PERSONA_ONNX_DIR: str | None = Field(default=None)
+    PERSONA_ONNX_QUANTIZE: bool = Field(default=True)
+    PERSONA_INTRA_OP_THREADS: int | None = Field(default=None)
+    PERSONA_INTER_OP_THREADS: int = Field(default=1)
 
     model_config = SettingsConfigDict(
         env_file=("server/.env", f"server/.env.{app_env}"),
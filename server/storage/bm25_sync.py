@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+
+from engine.graph.config import config_settings
+from engine.retrieval.bm25 import BM25Index
+from engine.retrieval.tokenizer import KoreanTokenizer
+
+from ..config import settings
+from ..logger import logger
+
+
+async def build_from_qdrant(
+    index: BM25Index,
+    client: AsyncQdrantClient,
+    collection_name: str,
+    batch_size: int = 1024,
+) -> int:
+    """
+    Qdrant 컬렉션의 payload를 scroll로 순회하며 BM25 색인에 추가.
+
+    적재 경로(upsert_points)는 Qdrant에만 쓰므로 하이브리드 검색용 색인은 이 빌드로 만든다.
+    토크나이저에 tokenize_batch가 있으면 배치 단위로 토크나이즈하고, 색인 갱신은 스레드에서 수행한다.
+    """
+    tokenize_batch = getattr(index.tokenizer, "tokenize_batch", None)
+    indexed: int = 0
+    offset: Optional[str] = None
+
+    while True:
+        points, offset = await client.scroll(
+            collection_name=collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        payloads: list[dict] = [point.payload or {} for point in points]
+        if payloads:
+            tokens: Optional[list[list[str]]] = (
+                await asyncio.to_thread(
+                    tokenize_batch,
+                    [p.get(index.text_field) or "" for p in payloads],
+                )
+                if tokenize_batch is not None
+                else None
+            )
+            indexed += await asyncio.to_thread(index.add, payloads, tokens)
+            logger.info(
+                f"[BM25Sync] {indexed} documents indexed. collection: {collection_name}"
+            )
+        if offset is None:
+            break
+
+    return indexed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Qdrant 컬렉션으로 하이브리드 검색용 BM25 색인을 빌드"
+    )
+    parser.add_argument("--collection", default=config_settings.DOC_COLLECTION)
+    parser.add_argument("--index", default=config_settings.DOC_BM25_INDEX_PATH)
+    parser.add_argument("--text-field", default=config_settings.DOC_BM25_TEXT_FIELD)
+    parser.add_argument("--model", default=config_settings.DOC_TOKENIZER_MODEL)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    cli_args = parser.parse_args()
+
+    if not cli_args.index:
+        raise ValueError("DOC_BM25_INDEX_PATH is not set. Pass --index explicitly.")
+
+    # Qdrant에서 삭제된 문서가 남지 않도록 매번 새로 빌드한 뒤 기존 파일을 원자적으로 교체
+    index = BM25Index(
+        tokenizer=KoreanTokenizer(cli_args.model), text_field=cli_args.text_field
+    )
+    client = AsyncQdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)
+    try:
+        total: int = await build_from_qdrant(
+            index, client, cli_args.collection, batch_size=cli_args.batch_size
+        )
+    finally:
+        await client.close()
+
+    await asyncio.to_thread(index.save, cli_args.index)
+    logger.info(f"[BM25Sync] done. {total} documents indexed. path: {cli_args.index}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,522 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Literal, Optional, Sequence
+import random
+
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from sqlalchemy import (
+    JSON,
+    Column,
+    Integer,
+    LargeBinary,
+    MetaData,
+    Table,
+    Text,
+    event,
+    select,
+    delete,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection, create_async_engine
+
+from ..logger import logger
+
+CheckpointerBackend = Literal["sqlite", "postgres", "redis"]
+
+_metadata = MetaData()
+
+checkpoints_table = Table(
+    "graph_checkpoints",
+    _metadata,
+    Column("thread_id", Text, primary_key=True),
+    Column("checkpoint_ns", Text, primary_key=True, server_default=""),
+    Column("checkpoint_id", Text, primary_key=True),
+    Column("parent_checkpoint_id", Text),
+    Column("type", Text),
+    Column("checkpoint", LargeBinary, nullable=False),
+    Column(
+        "metadata",
+        JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=False,
+        server_default="{}",
+    ),
+)
+
+# 채널 값은 (channel, version) 단위로 한 번만 저장하고 체크포인트는 channel_versions로 참조
+blobs_table = Table(
+    "graph_checkpoint_blobs",
+    _metadata,
+    Column("thread_id", Text, primary_key=True),
+    Column("checkpoint_ns", Text, primary_key=True, server_default=""),
+    Column("channel", Text, primary_key=True),
+    Column("version", Text, primary_key=True),
+    Column("type", Text, nullable=False),
+    Column("blob", LargeBinary),
+)
+
+writes_table = Table(
+    "graph_checkpoint_writes",
+    _metadata,
+    Column("thread_id", Text, primary_key=True),
+    Column("checkpoint_ns", Text, primary_key=True, server_default=""),
+    Column("checkpoint_id", Text, primary_key=True),
+    Column("task_id", Text, primary_key=True),
+    Column("idx", Integer, primary_key=True),
+    Column("channel", Text, nullable=False),
+    Column("type", Text),
+    Column("value", LargeBinary),
+    Column("task_path", Text, nullable=False, server_default=""),
+)
+
+
+class SqlCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    SQLAlchemy AsyncEngine 커넥션 풀을 사용하는 LangGraph 체크포인터 (PostgreSQL/asyncpg, SQLite/aiosqlite).
+
+    요청마다 풀에서 커넥션을 빌려 쓰므로 동시 세션의 쓰기가 하나의 커넥션에 직렬화되지 않고,
+    PostgreSQL에서는 여러 워커/호스트가 같은 DB를 공유할 수 있다.
+    채널 값은 버전이 바뀐 경우에만 blob으로 기록하고 체크포인트는 channel_versions로 참조한다.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, serde: Optional[SerializerProtocol] = None
+    ) -> None:
+        super().__init__(serde=serde)
+        self.engine = engine
+        self.last_put_bytes: int = 0
+        self.total_put_bytes: int = 0
+        self._is_postgres: bool = engine.dialect.name == "postgresql"
+        self._insert = postgresql.insert if self._is_postgres else sqlite.insert
+
+    async def setup(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(_metadata.create_all)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id: str = str(config["configurable"]["thread_id"])
+        checkpoint_ns: str = config["configurable"].get("checkpoint_ns", "")
+
+        stmt = select(checkpoints_table).where(
+            checkpoints_table.c.thread_id == thread_id,
+            checkpoints_table.c.checkpoint_ns == checkpoint_ns,
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            stmt = stmt.where(checkpoints_table.c.checkpoint_id == checkpoint_id)
+        else:
+            stmt = stmt.order_by(checkpoints_table.c.checkpoint_id.desc()).limit(1)
+
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(stmt)).mappings().first()
+            if row is None:
+                return None
+            return await self._to_tuple(conn, row)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        stmt = select(checkpoints_table)
+        if config is not None:
+            stmt = stmt.where(
+                checkpoints_table.c.thread_id
+                == str(config["configurable"]["thread_id"])
+            )
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                stmt = stmt.where(checkpoints_table.c.checkpoint_ns == checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                stmt = stmt.where(checkpoints_table.c.checkpoint_id == checkpoint_id)
+        # JSONB 포함 연산(@>)은 PostgreSQL 전용이므로 SQLite에서는 메타데이터 필터를 조회 후 적용
+        filter_in_db: bool = bool(filter) and self._is_postgres
+        if filter_in_db:
+            stmt = stmt.where(checkpoints_table.c.metadata.contains(filter))
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            stmt = stmt.where(checkpoints_table.c.checkpoint_id < before_id)
+        stmt = stmt.order_by(checkpoints_table.c.checkpoint_id.desc())
+        if limit is not None and (filter_in_db or not filter):
+            stmt = stmt.limit(limit)
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(stmt)).mappings().all()
+            if filter and not filter_in_db:
+                rows = [
+                    row
+                    for row in rows
+                    if all(row["metadata"].get(k) == v for k, v in filter.items())
+                ][:limit]
+            for row in rows:
+                yield await self._to_tuple(conn, row)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id: str = str(config["configurable"]["thread_id"])
+        checkpoint_ns: str = config["configurable"].get("checkpoint_ns", "")
+
+        # 이번 superstep에서 버전이 바뀐 채널만 blob으로 기록
+        checkpoint = checkpoint.copy()
+        channel_values: dict[str, Any] = checkpoint.pop("channel_values", {})  # type: ignore[misc]
+        blobs: list[dict[str, Any]] = []
+        for channel, version in new_versions.items():
+            if channel in channel_values:
+                blob_type, blob = self.serde.dumps_typed(channel_values[channel])
+            else:
+                blob_type, blob = "empty", None
+            blobs.append(
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "channel": channel,
+                    "version": str(version),
+                    "type": blob_type,
+                    "blob": blob,
+                }
+            )
+
+        type_, serialized = self.serde.dumps_typed(checkpoint)
+
+        values: dict[str, Any] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint["id"],
+            "parent_checkpoint_id": config["configurable"].get("checkpoint_id"),
+            "type": type_,
+            "checkpoint": serialized,
+            "metadata": get_checkpoint_metadata(config, metadata),
+        }
+        stmt = self._insert(checkpoints_table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["thread_id", "checkpoint_ns", "checkpoint_id"],
+            set_={
+                "type": stmt.excluded.type,
+                "checkpoint": stmt.excluded.checkpoint,
+                "metadata": stmt.excluded.metadata,
+            },
+        )
+
+        async with self.engine.begin() as conn:
+            if blobs:
+                await conn.execute(
+                    self._insert(blobs_table).on_conflict_do_nothing(
+                        index_elements=[
+                            "thread_id",
+                            "checkpoint_ns",
+                            "channel",
+                            "version",
+                        ]
+                    ),
+                    blobs,
+                )
+            await conn.execute(stmt)
+
+        self.last_put_bytes = len(serialized) + sum(
+            len(b["blob"] or b"") for b in blobs
+        )
+        self.total_put_bytes += self.last_put_bytes
+        logger.debug(
+            f"[Checkpointer] {checkpoint['id']} wrote {self.last_put_bytes} bytes "
+            f"({len(blobs)}/{len(checkpoint['channel_versions'])} channels)."
+        )
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        if not writes:
+            return
+
+        rows: list[dict[str, Any]] = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized = self.serde.dumps_typed(value)
+            rows.append(
+                {
+                    "thread_id": str(config["configurable"]["thread_id"]),
+                    "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+                    "checkpoint_id": str(config["configurable"]["checkpoint_id"]),
+                    "task_id": task_id,
+                    "idx": WRITES_IDX_MAP.get(channel, idx),
+                    "channel": channel,
+                    "type": type_,
+                    "value": serialized,
+                    "task_path": task_path,
+                }
+            )
+
+        stmt = self._insert(writes_table)
+        index_elements: list[str] = [
+            "thread_id",
+            "checkpoint_ns",
+            "checkpoint_id",
+            "task_id",
+            "idx",
+        ]
+        # 특수 채널(ERROR, INTERRUPT 등)은 덮어쓰고, 일반 쓰기는 최초 값을 유지
+        if all(channel in WRITES_IDX_MAP for channel, _ in writes):
+            stmt = stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={
+                    "channel": stmt.excluded.channel,
+                    "type": stmt.excluded.type,
+                    "value": stmt.excluded.value,
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt, rows)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                delete(blobs_table).where(blobs_table.c.thread_id == str(thread_id))
+            )
+            await conn.execute(
+                delete(writes_table).where(writes_table.c.thread_id == str(thread_id))
+            )
+            await conn.execute(
+                delete(checkpoints_table).where(
+                    checkpoints_table.c.thread_id == str(thread_id)
+                )
+            )
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    async def _to_tuple(self, conn: AsyncConnection, row) -> CheckpointTuple:
+        writes = await conn.execute(
+            select(
+                writes_table.c.task_id,
+                writes_table.c.channel,
+                writes_table.c.type,
+                writes_table.c.value,
+            )
+            .where(
+                writes_table.c.thread_id == row["thread_id"],
+                writes_table.c.checkpoint_ns == row["checkpoint_ns"],
+                writes_table.c.checkpoint_id == row["checkpoint_id"],
+            )
+            .order_by(writes_table.c.task_id, writes_table.c.idx)
+        )
+
+        checkpoint: Checkpoint = self.serde.loads_typed(
+            (row["type"], row["checkpoint"])
+        )
+        checkpoint["channel_values"] = {
+            **checkpoint.get("channel_values", {}),
+            **await self._load_blobs(
+                conn,
+                row["thread_id"],
+                row["checkpoint_ns"],
+                checkpoint["channel_versions"],
+            ),
+        }
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": row["thread_id"],
+                    "checkpoint_ns": row["checkpoint_ns"],
+                    "checkpoint_id": row["checkpoint_id"],
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=row["metadata"] or {},
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": row["thread_id"],
+                        "checkpoint_ns": row["checkpoint_ns"],
+                        "checkpoint_id": row["parent_checkpoint_id"],
+                    }
+                }
+                if row["parent_checkpoint_id"]
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((type_, value)))
+                for task_id, channel, type_, value in writes
+            ],
+        )
+
+    async def _load_blobs(
+        self,
+        conn: AsyncConnection,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel_versions: ChannelVersions,
+    ) -> dict[str, Any]:
+        if not channel_versions:
+            return {}
+
+        result = await conn.execute(
+            select(blobs_table.c.channel, blobs_table.c.type, blobs_table.c.blob).where(
+                blobs_table.c.thread_id == thread_id,
+                blobs_table.c.checkpoint_ns == checkpoint_ns,
+                tuple_(blobs_table.c.channel, blobs_table.c.version).in_(
+                    [(channel, str(v)) for channel, v in channel_versions.items()]
+                ),
+            )
+        )
+        return {
+            channel: self.serde.loads_typed((type_, blob))
+            for channel, type_, blob in result
+            if type_ != "empty"
+        }
+
+
+def _sqlite_pragmas(dbapi_connection, _) -> None:
+    # 풀의 여러 커넥션이 동시에 읽고 쓸 수 있도록 WAL 사용
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+async def _migrate_legacy_sqlite(
+    saver: SqlCheckpointSaver, sqlite_path: str, serde: Optional[SerializerProtocol]
+) -> int:
+    """
+    같은 파일에 AsyncSqliteSaver 테이블(checkpoints/writes)이 남아 있고 새 테이블이 비어 있으면
+    기존 체크포인트와 pending writes를 한 번 옮긴다. 옮긴 뒤에는 새 테이블이 채워져 있으므로 다시 실행되지 않으며,
+    원본 테이블은 롤백에 대비해 지우지 않는다.
+    """
+    async with saver.engine.connect() as conn:
+        legacy: set[str] = set(
+            (
+                await conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND name IN ('checkpoints', 'writes')"
+                )
+            ).scalars()
+        )
+        if legacy != {"checkpoints", "writes"}:
+            return 0
+        if (await conn.execute(select(checkpoints_table.c.thread_id).limit(1))).first():
+            return 0
+
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    migrated: int = 0
+    async with aiosqlite.connect(sqlite_path, timeout=30) as legacy_conn:
+        legacy_saver = AsyncSqliteSaver(legacy_conn, serde=serde)
+        async for item in legacy_saver.alist(None):
+            configurable: dict[str, Any] = item.config["configurable"]
+            parent_id: Optional[str] = (
+                item.parent_config["configurable"]["checkpoint_id"]
+                if item.parent_config
+                else None
+            )
+            # 참조할 이전 blob이 없으므로 모든 채널을 새 버전으로 기록
+            config: RunnableConfig = await saver.aput(
+                {
+                    "configurable": {
+                        "thread_id": configurable["thread_id"],
+                        "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                        "checkpoint_id": parent_id,
+                    }
+                },
+                item.checkpoint,
+                item.metadata,
+                item.checkpoint["channel_versions"],
+            )
+            writes_by_task: dict[str, list[tuple[str, Any]]] = {}
+            for task_id, channel, value in item.pending_writes or []:
+                writes_by_task.setdefault(task_id, []).append((channel, value))
+            for task_id, writes in writes_by_task.items():
+                await saver.aput_writes(config, writes, task_id)
+            migrated += 1
+
+    if migrated:
+        logger.info(
+            f"[Checkpointer] migrated {migrated} checkpoints from AsyncSqliteSaver tables."
+        )
+    return migrated
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    backend: CheckpointerBackend,
+    sqlite_path: str = "checkpoints.db",
+    postgresql_engine: Optional[AsyncEngine] = None,
+    redis_url: Optional[str] = None,
+    ttl_min: Optional[int] = None,
+    serde: Optional[SerializerProtocol] = None,
+) -> AsyncIterator[BaseCheckpointSaver]:
+    """백엔드별 체크포인터를 열고 종료 시 정리"""
+    match backend:
+        case "sqlite":
+            engine = create_async_engine(
+                f"sqlite+aiosqlite:///{sqlite_path}", connect_args={"timeout": 30}
+            )
+            event.listen(engine.sync_engine, "connect", _sqlite_pragmas)
+            try:
+                saver = SqlCheckpointSaver(engine, serde=serde)
+                await saver.setup()
+                await _migrate_legacy_sqlite(saver, sqlite_path, serde)
+                logger.info("Checkpointer: sqlite")
+                yield saver
+            finally:
+                await engine.dispose()
+
+        case "postgres":
+            if postgresql_engine is None:
+                raise ValueError("postgresql_engine is required for postgres backend.")
+            saver = SqlCheckpointSaver(postgresql_engine, serde=serde)
+            await saver.setup()
+            logger.info("Checkpointer: postgres")
+            yield saver
+
+        case "redis":
+            from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+
+            if not redis_url:
+                raise ValueError("redis_url is required for redis backend.")
+            # RedisSaver는 RediSearch 인덱싱을 위해 자체 JSON 직렬화를 사용하므로 serde를 적용하지 않음
+            # 체크포인터는 바이트 응답이 필요하므로 decode_responses=True인 공용 클라이언트 대신 URL로 연결
+            ttl = {"default_ttl": ttl_min, "refresh_on_read": True} if ttl_min else None
+            async with AsyncRedisSaver.from_conn_string(redis_url, ttl=ttl) as saver:
+                await saver.asetup()
+                logger.info("Checkpointer: redis")
+                yield saver
+
+        case _:
+            raise ValueError(f"Unknown checkpointer backend: {backend}")
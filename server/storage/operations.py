@@ -1,12 +1,23 @@
+from typing import Optional
+
 from ..storage.redis_client import push_task
 from ..storage.postgresql_client import get_persona
+from ..storage.persona_cache import PersonaCache
 
 
-async def get_user_persona(user_id: str, db_engine) -> dict:
+async def _load_persona(user_id: str) -> dict:
     user = await get_persona(user_id=user_id)
     return user.extracted_keywords if user else {}
 
 
+async def get_user_persona(
+    user_id: str, db_engine, cache: Optional[PersonaCache] = None
+) -> dict:
+    if cache is not None:
+        return await cache.get(user_id, _load_persona)
+    return await _load_persona(user_id)
+
+
 async def enqueue_memory_task(data: dict, redis_client) -> None:
     if data:
-        await push_task(queue_name="task_queue", data=data)
+        await push_task(data=data)
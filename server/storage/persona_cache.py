@@ -0,0 +1,100 @@
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+
+import orjson
+
+from engine.graph.cache import TieredCache
+
+from ..logger import logger
+
+INVALIDATION_CHANNEL: str = "persona:invalidate"
+
+PersonaLoader = Callable[[str], Awaitable[dict]]
+
+
+class PersonaCache:
+    """
+    사용자 페르소나 read-through 캐시 (프로세스 내 LRU + Redis, TTL).
+
+    워커는 upsert 커밋 후 update()로 Redis 값을 갱신하고 무효화 채널에 user_id를 발행한다.
+    API 프로세스는 listen()으로 채널을 구독해 로컬 LRU 항목만 지우고, 다음 조회는 Redis에서 최신 값을 읽는다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        maxsize: int = 4096,
+        ttl: float = 3600.0,
+    ) -> None:
+        self.redis_client = redis_client
+        self.cache = TieredCache(
+            namespace="persona", redis_client=redis_client, maxsize=maxsize, ttl=ttl
+        )
+        self._listener: Optional[asyncio.Task] = None
+
+    async def get(self, user_id: str, loader: PersonaLoader) -> dict:
+        key: str = self.cache.key(user_id)
+        persona: Optional[dict] = await self.cache.get(key)
+        if persona is not None:
+            return persona
+
+        # 페르소나가 없는 사용자도 빈 dict로 캐시해 매 턴 DB를 조회하지 않도록 함
+        persona = await loader(user_id) or {}
+        # DB 조회 후 워커가 update()로 넣은 최신 값을 덮어쓰지 않도록 비어 있을 때만 채움
+        if not await self.cache.set(key, persona, nx=True):
+            return await self.cache.get(key) or persona
+        return persona
+
+    async def update(self, personas: dict[str, dict]) -> None:
+        if not personas:
+            return
+
+        for user_id, persona in personas.items():
+            await self.cache.set(self.cache.key(user_id), persona)
+
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.publish(
+                INVALIDATION_CHANNEL, orjson.dumps(list(personas)).decode()
+            )
+        except Exception as e:
+            logger.warning(
+                f"[PersonaCache] invalidation publish failed. error: {str(e)}"
+            )
+
+    def invalidate_local(self, user_ids: list[str]) -> None:
+        for user_id in user_ids:
+            self.cache.local.delete(self.cache.key(user_id))
+
+    async def start(self) -> None:
+        if self.redis_client is not None and self._listener is None:
+            self._listener = asyncio.create_task(self.listen())
+
+    async def aclose(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def listen(self, retry_delay: float = 1.0) -> None:
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.invalidate_local(orjson.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[PersonaCache] subscription lost. error: {str(e)}")
+                # 구독이 끊긴 동안의 무효화는 놓칠 수 있으므로 로컬 캐시를 비우고 재구독
+                self.cache.local.clear()
+                await asyncio.sleep(retry_delay)
+            finally:
+                await pubsub.aclose()
@@ -43,6 +43,34 @@ async def upsert_persona(user_id: str, new_data: dict) -> None:
         await session.commit()
 
 
+async def upsert_personas(personas: dict[str, dict]) -> dict[str, dict]:
+    """여러 사용자의 페르소나를 단일 INSERT ... ON CONFLICT 문으로 병합 저장하고 병합된 최종 값을 반환"""
+    if not personas:
+        return {}
+
+    async with _AsyncSessionLocal() as session:
+        stmt = insert(UserPersona).values(
+            [
+                {"user_id": user_id, "extracted_keywords": data}
+                for user_id, data in personas.items()
+            ]
+        )
+
+        upsert_stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "extracted_keywords": UserPersona.extracted_keywords.concat(
+                    stmt.excluded.extracted_keywords
+                ),
+                "updated_at": func.now(),
+            },
+        ).returning(UserPersona.user_id, UserPersona.extracted_keywords)
+        result = await session.execute(upsert_stmt)
+        merged: dict[str, dict] = {row[0]: row[1] for row in result.all()}
+        await session.commit()
+        return merged
+
+
 async def get_persona(user_id: str) -> Optional[UserPersona]:
     async with _AsyncSessionLocal() as session:
         return await session.get(UserPersona, user_id)
@@ -1,8 +1,20 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+import asyncio
+
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import PointStruct
-import uuid
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PointStruct,
+    QueryRequest,
+    SearchParams,
+)
 
 from ..config import settings
+from .vector_ingest import point_id, upsert_points
 
 qdrant_client = AsyncQdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)
 
@@ -10,15 +22,134 @@ qdrant_client = AsyncQdrantClient(host=settings.QDRANT_HOST, port=settings.QDRAN
 async def upsert_vector_data(collection_name: str, vector: list, payload: dict):
     await qdrant_client.upsert(
         collection_name=collection_name,
-        points=[PointStruct(id=str(uuid.uuid4()), vector=vector, payload=payload)],
+        points=[PointStruct(id=point_id(payload), vector=vector, payload=payload)],
     )
 
 
-async def search_similar_docs(collection_name: str, query_vector: list, limit: int = 5):
+async def upsert_vectors(
+    collection_name: str,
+    vectors: Sequence[list[float]],
+    payloads: Sequence[dict],
+    id_field: Optional[str] = None,
+    batch_size: int = 256,
+    parallel: int = 4,
+    wait: bool = True,
+) -> int:
+    return await upsert_points(
+        qdrant_client,
+        collection_name,
+        vectors,
+        payloads,
+        id_field=id_field,
+        batch_size=batch_size,
+        parallel=parallel,
+        wait=wait,
+    )
+
+
+def build_filter(conditions: Optional[dict[str, Any]]) -> Optional[Filter]:
+    """{필드: 값} 형태의 조건을 must 필터로 변환. 값이 리스트면 그중 하나와 일치하는 포인트를 찾음"""
+    if not conditions:
+        return None
+    return Filter(
+        must=[
+            FieldCondition(
+                key=key,
+                match=(
+                    MatchAny(any=list(value))
+                    if isinstance(value, (list, tuple, set))
+                    else MatchValue(value=value)
+                ),
+            )
+            for key, value in conditions.items()
+        ]
+    )
+
+
+async def search_similar_docs(
+    collection_name: str,
+    query_vector: list,
+    limit: int = 5,
+    filters: Optional[dict[str, Any] | Filter] = None,
+    search_params: Optional[SearchParams] = None,
+):
     response = await qdrant_client.query_points(
         collection_name=collection_name,
         query=query_vector,
+        query_filter=filters if isinstance(filters, Filter) else build_filter(filters),
+        search_params=search_params,
         limit=limit,
         with_payload=True,
     )
     return [point.payload for point in response.points]
+
+
+@dataclass(frozen=True)
+class VectorQuery:
+    collection_name: str
+    vector: list[float]
+    limit: int = 5
+    filters: Optional[dict[str, Any] | Filter] = None
+    search_params: Optional[SearchParams] = None
+
+    def request(self) -> QueryRequest:
+        return QueryRequest(
+            query=self.vector,
+            filter=(
+                self.filters
+                if isinstance(self.filters, Filter)
+                else build_filter(self.filters)
+            ),
+            params=self.search_params,
+            limit=self.limit,
+            with_payload=True,
+        )
+
+
+async def search_similar_docs_batch(queries: Sequence[VectorQuery]) -> list[list[dict]]:
+    """
+    여러 쿼리 벡터를 컬렉션별 query_batch_points 한 번으로 검색해 쿼리 순서대로 payload 목록을 반환.
+    쿼리 간에 겹치는 포인트는 그대로 두고 호출 측의 RRF 융합이 합치며, 쿼리마다 별도의 payload 객체를 반환한다.
+    """
+    by_collection: dict[str, list[int]] = {}
+    for index, query in enumerate(queries):
+        by_collection.setdefault(query.collection_name, []).append(index)
+
+    # query_batch_points는 컬렉션 단위 API이므로 컬렉션이 다르면 요청을 나눠 동시에 보냄
+    names: list[str] = list(by_collection)
+    responses = await asyncio.gather(
+        *(
+            qdrant_client.query_batch_points(
+                collection_name=name,
+                requests=[queries[i].request() for i in by_collection[name]],
+            )
+            for name in names
+        )
+    )
+
+    results: list[list[dict]] = [[] for _ in queries]
+    for name, batch in zip(names, responses):
+        for index, response in zip(by_collection[name], batch):
+            results[index] = [point.payload for point in response.points]
+    return results
+
+
+async def search_similar_docs_many(
+    collection_name: str,
+    query_vectors: Sequence[list[float]],
+    limit: int = 5,
+    filters: Optional[dict[str, Any] | Filter] = None,
+    search_params: Optional[SearchParams] = None,
+) -> list[list[dict]]:
+    return await search_similar_docs_batch(
+        [
+            VectorQuery(
+                collection_name=collection_name,
+                vector=vector,
+                limit=limit,
+                filters=filters,
+                search_params=search_params,
+            )
+            for vector in query_vectors
+        ]
+    )
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from typing import Literal, Optional, Sequence
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CollectionInfo,
+    Disabled,
+    Distance,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
+
+from ..logger import logger
+
+Quantization = Literal["none", "scalar", "binary"]
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """
+    코드로 선언하는 Qdrant 컬렉션 설정.
+
+    on_disk=True면 원본 벡터는 mmap으로 디스크에 두고, 양자화 벡터만 RAM에 올려(always_ram) 후보를 고른 뒤
+    검색 시 rescore로 원본 벡터에서 최종 점수를 다시 계산한다.
+    """
+
+    name: str
+    dim: int
+    distance: Distance = Distance.COSINE
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 128
+    quantization: Quantization = "scalar"
+    on_disk: bool = True
+    payload_indexes: dict[str, PayloadSchemaType] = field(default_factory=dict)
+
+    def vectors_config(self) -> VectorParams:
+        return VectorParams(size=self.dim, distance=self.distance, on_disk=self.on_disk)
+
+    def hnsw_config(self) -> HnswConfigDiff:
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self) -> ScalarQuantization | BinaryQuantization | None:
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+
+def _quantization_of(info: CollectionInfo) -> Quantization:
+    config = info.config.quantization_config
+    if isinstance(config, ScalarQuantization):
+        return "scalar"
+    if isinstance(config, BinaryQuantization):
+        return "binary"
+    return "none"
+
+
+async def ensure_collection(client: AsyncQdrantClient, spec: CollectionSpec) -> None:
+    """
+    컬렉션이 없으면 생성하고, 있으면 선언과 다른 설정만 갱신. 같은 설정으로 여러 번 호출해도 안전하다.
+    HNSW/양자화 변경은 서버에서 세그먼트 재색인을 일으키므로 달라진 경우에만 update_collection을 호출한다.
+    """
+    if not await client.collection_exists(spec.name):
+        await client.create_collection(
+            collection_name=spec.name,
+            vectors_config=spec.vectors_config(),
+            hnsw_config=spec.hnsw_config(),
+            quantization_config=spec.quantization_config(),
+        )
+        logger.info(f"[Qdrant] collection created. name: {spec.name}")
+    else:
+        info: CollectionInfo = await client.get_collection(spec.name)
+        vectors = info.config.params.vectors
+        if not isinstance(vectors, VectorParams):
+            raise ValueError(f"named vectors are not supported. name: {spec.name}")
+        if vectors.size != spec.dim or vectors.distance != spec.distance:
+            # 차원/거리 함수는 생성 후 바꿀 수 없으므로 재적재가 필요
+            raise ValueError(
+                f"collection vector params mismatch. name: {spec.name}, "
+                f"size: {vectors.size} != {spec.dim}, "
+                f"distance: {vectors.distance} != {spec.distance}"
+            )
+
+        hnsw = info.config.hnsw_config
+        hnsw_changed: bool = (hnsw.m, hnsw.ef_construct) != (
+            spec.hnsw_m,
+            spec.hnsw_ef_construct,
+        )
+        quantization_changed: bool = _quantization_of(info) != spec.quantization
+        on_disk_changed: bool = bool(vectors.on_disk) != spec.on_disk
+
+        if hnsw_changed or quantization_changed or on_disk_changed:
+            await client.update_collection(
+                collection_name=spec.name,
+                vectors_config=(
+                    {"": VectorParamsDiff(on_disk=spec.on_disk)}
+                    if on_disk_changed
+                    else None
+                ),
+                hnsw_config=spec.hnsw_config() if hnsw_changed else None,
+                quantization_config=(
+                    (spec.quantization_config() or Disabled.DISABLED)
+                    if quantization_changed
+                    else None
+                ),
+            )
+            logger.info(
+                f"[Qdrant] collection updated. name: {spec.name}, hnsw: {hnsw_changed}, "
+                f"quantization: {quantization_changed}, on_disk: {on_disk_changed}"
+            )
+
+    existing = (await client.get_collection(spec.name)).payload_schema
+    for field_name, schema in spec.payload_indexes.items():
+        if field_name in existing:
+            continue
+        await client.create_payload_index(
+            collection_name=spec.name,
+            field_name=field_name,
+            field_schema=schema,
+            wait=True,
+        )
+        logger.info(
+            f"[Qdrant] payload index created. name: {spec.name}, field: {field_name}"
+        )
+
+
+async def ensure_collections(
+    client: AsyncQdrantClient, specs: Sequence[CollectionSpec]
+) -> None:
+    for spec in specs:
+        await ensure_collection(client, spec)
+
+
+def search_params(
+    hnsw_ef: Optional[int] = None,
+    rescore: bool = True,
+    oversampling: Optional[float] = None,
+    exact: bool = False,
+) -> SearchParams:
+    """쿼리별 검색 파라미터. 양자화 컬렉션에서는 oversampling 배수만큼 후보를 더 뽑아 원본 벡터로 재채점"""
+    return SearchParams(
+        hnsw_ef=hnsw_ef,
+        exact=exact,
+        quantization=QuantizationSearchParams(
+            rescore=rescore, oversampling=oversampling
+        ),
+    )
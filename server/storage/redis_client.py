@@ -1,10 +1,9 @@
 import redis.asyncio as aioredis
-import json
 
 from redis.asyncio import Redis
 
 from ..config import settings
-from ..logger import logger
+from .task_stream import TaskStream
 
 
 if not settings.REDIS_URL:
@@ -13,14 +12,15 @@ if not settings.REDIS_URL:
 redis_client: Redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
 
 
-async def push_task(queue_name: str, data: dict):
-    await redis_client.rpush(queue_name, json.dumps(data))
+task_stream = TaskStream(
+    redis_client,
+    stream=settings.TASK_STREAM_NAME,
+    group=settings.TASK_STREAM_GROUP,
+    maxlen=settings.TASK_STREAM_MAXLEN,
+    claim_idle_ms=settings.TASK_STREAM_CLAIM_IDLE_MS,
+    max_deliveries=settings.TASK_STREAM_MAX_DELIVERIES,
+)
 
 
-async def run_redis_worker(queue_name: str):
-    logger.info(f"[*] Worker monitoring queue: {queue_name}")
-    while True:
-        _, task_data = await redis_client.blpop(queue_name, timeout=0)
-        task = json.loads(task_data)
-
-        logger.info(f"[Worker] Processing task for user: {task.get('user_id')}")
+async def push_task(data: dict) -> str:
+    return await task_stream.push(data)
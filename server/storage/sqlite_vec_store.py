@@ -0,0 +1,170 @@
+import re
+import time
+from typing import Optional, Sequence
+
+import aiosqlite
+import numpy as np
+import orjson
+import sqlite_vec
+import xxhash
+
+from ..logger import logger
+from .vector_ingest import point_id
+
+_COLLECTION_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS {name}_points (
+    rowid       INTEGER PRIMARY KEY,
+    point_id    TEXT NOT NULL UNIQUE,
+    payload     TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS {name}_vec USING vec0(
+    embedding float[{dim}] distance_metric=cosine
+);
+"""
+
+_VEC_DIM = re.compile(r"float\[(\d+)\]")
+
+_UPSERT_POINT: str = """
+INSERT INTO {name}_points (rowid, point_id, payload) VALUES (?, ?, ?)
+ON CONFLICT (rowid) DO UPDATE SET payload = excluded.payload
+"""
+
+# vec0의 KNN은 LIMIT 대신 `k = ?` 제약으로 후보 수를 지정
+_SEARCH: str = """
+WITH knn AS (
+    SELECT rowid, distance FROM {name}_vec WHERE embedding MATCH ? AND k = ?
+)
+SELECT p.payload FROM knn JOIN {name}_points p ON p.rowid = knn.rowid
+ORDER BY knn.distance
+"""
+
+
+def _serialize(vector: Sequence[float]) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _rowid(pid: str) -> int:
+    # point_id에서 rowid를 결정적으로 만들어 RETURNING 없이 executemany로 일괄 적재
+    return xxhash.xxh3_64_intdigest(pid.encode()) & 0x7FFF_FFFF_FFFF_FFFF
+
+
+class SqliteVecStore:
+    """
+    sqlite-vec 기반 프로세스 내 벡터 저장소. search_similar_docs와 같은 인터페이스로 검색한다.
+
+    컬렉션마다 payload 테이블과 vec0 가상 테이블을 두고 rowid로 연결한다.
+    vec0는 전수 비교(정확 KNN)이므로 노드 메모리에 들어가는 중소 규모 컬렉션에 적합하며,
+    mmap_size로 DB 파일을 메모리 매핑해 페이지 캐시에서 바로 읽는다.
+    문서 적재는 Qdrant로만 이루어지므로 `python -m server.storage.vector_sync <collection>`으로 채운다.
+    """
+
+    def __init__(self, db_path: str, dim: int, mmap_size_mb: int = 1024) -> None:
+        self.db_path = db_path
+        self.dim = dim
+        self.mmap_size_mb = mmap_size_mb
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._collections: set[str] = set()
+
+    async def open(self) -> None:
+        if self._conn is not None:
+            return
+        self._conn = await aiosqlite.connect(self.db_path)
+        await self._conn.enable_load_extension(True)
+        await self._conn.load_extension(sqlite_vec.loadable_path())
+        await self._conn.enable_load_extension(False)
+        await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute(f"PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}")
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            self._collections.clear()
+
+    @property
+    def conn(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            raise RuntimeError("SqliteVecStore is not opened.")
+        return self._conn
+
+    async def ensure_collection(self, collection_name: str) -> None:
+        if collection_name in self._collections:
+            return
+        if not _COLLECTION_NAME.match(collection_name):
+            raise ValueError(f"invalid collection name: {collection_name}")
+
+        # vec0 차원은 생성 후 바꿀 수 없으므로 다른 차원으로 만든 기존 테이블은 조용히 쓰지 않고 실패
+        async with self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (f"{collection_name}_vec",)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is not None and (match := _VEC_DIM.search(row[0])):
+            if int(match.group(1)) != self.dim:
+                raise ValueError(
+                    f"vector dimension mismatch. collection: {collection_name}, "
+                    f"table: {match.group(1)} != {self.dim}"
+                )
+
+        await self.conn.executescript(
+            _SCHEMA.format(name=collection_name, dim=self.dim)
+        )
+        await self.conn.commit()
+        self._collections.add(collection_name)
+
+    async def upsert(
+        self,
+        collection_name: str,
+        vectors: Sequence[Sequence[float]],
+        payloads: Sequence[dict],
+        ids: Optional[Sequence[str]] = None,
+    ) -> int:
+        """결정적 id(기본값: payload 해시)로 upsert하므로 같은 내용을 다시 적재해도 중복되지 않음"""
+        await self.ensure_collection(collection_name)
+
+        # 같은 호출 안의 중복 id는 마지막 값만 남김
+        points: dict[str, tuple[Sequence[float], dict]] = {}
+        for i, (vector, payload) in enumerate(zip(vectors, payloads)):
+            points[ids[i] if ids is not None else point_id(payload)] = (
+                vector,
+                payload,
+            )
+        rowids: dict[str, int] = {pid: _rowid(pid) for pid in points}
+
+        await self.conn.executemany(
+            _UPSERT_POINT.format(name=collection_name),
+            [
+                (rowids[pid], pid, orjson.dumps(payload).decode())
+                for pid, (_, payload) in points.items()
+            ],
+        )
+        # vec0는 UPSERT를 지원하지 않으므로 기존 벡터를 지우고 다시 삽입
+        await self.conn.executemany(
+            f"DELETE FROM {collection_name}_vec WHERE rowid = ?",
+            [(rowid,) for rowid in rowids.values()],
+        )
+        await self.conn.executemany(
+            f"INSERT INTO {collection_name}_vec (rowid, embedding) VALUES (?, ?)",
+            [(rowids[pid], _serialize(vector)) for pid, (vector, _) in points.items()],
+        )
+        await self.conn.commit()
+        return len(points)
+
+    async def search(
+        self, collection_name: str, query_vector: list, limit: int = 5
+    ) -> list[dict]:
+        await self.ensure_collection(collection_name)
+
+        started: float = time.perf_counter()
+        async with self.conn.execute(
+            _SEARCH.format(name=collection_name), (_serialize(query_vector), limit)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        logger.debug(
+            f"[SqliteVecStore] {len(rows)} rows in "
+            f"{(time.perf_counter() - started) * 1000:.2f}ms."
+        )
+        return [orjson.loads(row[0]) for row in rows]
@@ -0,0 +1,192 @@
+from typing import Any, Optional
+import asyncio
+import json
+import os
+import socket
+
+from redis.exceptions import ResponseError
+
+from ..logger import logger
+
+TaskEntry = tuple[str, dict]
+
+
+class TaskStream:
+    """
+    컨슈머 그룹 기반 Redis Streams 작업 큐.
+
+    push()는 MAXLEN ~ 으로 길이를 제한하며 XADD하고, read()는 다른 컨슈머가 claim_idle_ms 이상 처리하지 못한
+    pending 항목을 먼저 회수한 뒤 XREADGROUP으로 새 항목을 마이크로 배치로 읽는다.
+    max_deliveries번 넘게 전달된 항목은 처리 불가로 보고 dead 스트림으로 옮긴 뒤 ack한다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        stream: str,
+        group: str,
+        consumer: Optional[str] = None,
+        maxlen: int = 100_000,
+        claim_idle_ms: int = 60_000,
+        max_deliveries: int = 5,
+    ) -> None:
+        self.redis_client = redis_client
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.maxlen = maxlen
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+
+    @property
+    def dead_stream(self) -> str:
+        return f"{self.stream}:dead"
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis_client.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def push(self, data: dict) -> str:
+        return await self.redis_client.xadd(
+            self.stream,
+            {"data": json.dumps(data)},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+
+    async def read(
+        self, count: int, max_wait: float, block_ms: int = 5000
+    ) -> list[TaskEntry]:
+        """첫 항목은 최대 block_ms 동안 기다리고, 이후 count개 또는 max_wait초 중 먼저 도달할 때까지 모아서 반환"""
+        entries: list[TaskEntry] = await self._reclaim(count)
+        if not entries:
+            entries = await self._read_new(count, block_ms)
+        if not entries:
+            return []
+
+        loop = asyncio.get_running_loop()
+        deadline: float = loop.time() + max_wait
+        while len(entries) < count:
+            remaining_ms: int = int((deadline - loop.time()) * 1000)
+            if remaining_ms <= 0:
+                break
+            more: list[TaskEntry] = await self._read_new(
+                count - len(entries), remaining_ms
+            )
+            if not more:
+                break
+            entries.extend(more)
+        return entries
+
+    async def ack(self, entry_ids: list[str]) -> int:
+        if not entry_ids:
+            return 0
+        return await self.redis_client.xack(self.stream, self.group, *entry_ids)
+
+    async def metrics(self) -> dict:
+        """오토스케일러용 지표. lag은 아직 어떤 컨슈머에게도 전달되지 않은 항목 수, pending은 미확인 항목 수"""
+        length: int = await self.redis_client.xlen(self.stream)
+        try:
+            groups: list[dict] = await self.redis_client.xinfo_groups(self.stream)
+        except ResponseError:
+            # 스트림이 아직 생성되지 않음
+            groups = []
+
+        for group in groups:
+            if group["name"] == self.group:
+                return {
+                    "stream": self.stream,
+                    "group": self.group,
+                    "length": length,
+                    "lag": group.get("lag"),
+                    "pending": group["pending"],
+                    "consumers": group["consumers"],
+                }
+        return {
+            "stream": self.stream,
+            "group": self.group,
+            "length": length,
+            "lag": length,
+            "pending": 0,
+            "consumers": 0,
+        }
+
+    async def _read_new(self, count: int, block_ms: int) -> list[TaskEntry]:
+        response = await self.redis_client.xreadgroup(
+            self.group, self.consumer, {self.stream: ">"}, count=count, block=block_ms
+        )
+        entries: list[TaskEntry] = []
+        for _, stream_entries in response or []:
+            entries.extend(self._decode(stream_entries))
+        return entries
+
+    async def _reclaim(self, count: int) -> list[TaskEntry]:
+        pending: list[dict] = await self.redis_client.xpending_range(
+            self.stream,
+            self.group,
+            min="-",
+            max="+",
+            count=count,
+            idle=self.claim_idle_ms,
+        )
+        if not pending:
+            return []
+
+        dead: list[str] = [
+            p["message_id"]
+            for p in pending
+            if p["times_delivered"] >= self.max_deliveries
+        ]
+        stuck: list[str] = [
+            p["message_id"] for p in pending if p["message_id"] not in dead
+        ]
+
+        if dead:
+            await self._bury(dead)
+        if not stuck:
+            return []
+
+        claimed = await self.redis_client.xclaim(
+            self.stream, self.group, self.consumer, self.claim_idle_ms, stuck
+        )
+        logger.info(f"[TaskStream] reclaimed {len(claimed)} stuck tasks.")
+        return self._decode(claimed)
+
+    async def _bury(self, entry_ids: list[str]) -> None:
+        for entry_id in entry_ids:
+            entries = await self.redis_client.xrange(
+                self.stream, min=entry_id, max=entry_id
+            )
+            for _, fields in entries:
+                await self.redis_client.xadd(
+                    self.dead_stream,
+                    {**fields, "source_id": entry_id},
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+        await self.ack(entry_ids)
+        logger.error(
+            f"[TaskStream] moved {len(entry_ids)} tasks to {self.dead_stream}."
+        )
+
+    @staticmethod
+    def _decode(stream_entries: list) -> list[TaskEntry]:
+        entries: list[TaskEntry] = []
+        for entry_id, fields in stream_entries:
+            # MAXLEN으로 잘려 나간 항목은 필드가 비어 있음. 디코딩할 수 없는 항목도 빈 작업으로 넘겨
+            # 워커가 검증 단계에서 버리고 ack하도록 해 배치 전체가 재전달되지 않게 함
+            task: dict = {}
+            if fields and "data" in fields:
+                try:
+                    task = json.loads(fields["data"])
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        f"[TaskStream] malformed task. id: {entry_id}, error: {str(e)}"
+                    )
+            entries.append((entry_id, task if isinstance(task, dict) else {}))
+        return entries
@@ -0,0 +1,83 @@
+from typing import Any, Iterable, Iterator, Optional, Sequence
+import asyncio
+import uuid
+
+import orjson
+import xxhash
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+from ..logger import logger
+
+
+def point_id(content: Any) -> str:
+    """내용(문자열 또는 JSON 직렬화 가능한 값)의 xxh3-128 해시로 만든 결정적 UUID. 같은 내용을 다시 적재해도 같은 포인트를 덮어씀"""
+    raw: bytes = (
+        content.encode()
+        if isinstance(content, str)
+        else orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    )
+    return str(uuid.UUID(bytes=xxhash.xxh3_128_digest(raw)))
+
+
+def _chunks(points: Iterable[PointStruct], size: int) -> Iterator[list[PointStruct]]:
+    chunk: list[PointStruct] = []
+    for point in points:
+        chunk.append(point)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def upsert_points(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    vectors: Sequence[list[float]],
+    payloads: Sequence[dict],
+    ids: Optional[Sequence[str]] = None,
+    id_field: Optional[str] = None,
+    batch_size: int = 256,
+    parallel: int = 4,
+    wait: bool = True,
+) -> int:
+    """
+    벡터를 batch_size 단위로 나눠 최대 parallel개 요청을 동시에 upsert하고 적재한 포인트 수를 반환.
+
+    ids가 없으면 payload[id_field](없으면 payload 전체)의 해시로 id를 만든다.
+    wait=False면 서버 반영을 기다리지 않으므로 처리량은 높지만 반환 직후 검색 결과에 보이지 않을 수 있다.
+    """
+    if len(vectors) != len(payloads) or (ids is not None and len(ids) != len(vectors)):
+        raise ValueError("vectors, payloads and ids must have the same length.")
+
+    points = (
+        PointStruct(
+            id=(
+                ids[i]
+                if ids is not None
+                else point_id(payloads[i][id_field] if id_field else payloads[i])
+            ),
+            vector=vectors[i],
+            payload=payloads[i],
+        )
+        for i in range(len(vectors))
+    )
+
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def upload(chunk: list[PointStruct]) -> int:
+        async with semaphore:
+            await client.upsert(
+                collection_name=collection_name, points=chunk, wait=wait
+            )
+        return len(chunk)
+
+    counts: list[int] = await asyncio.gather(
+        *(upload(chunk) for chunk in _chunks(points, batch_size))
+    )
+    logger.debug(
+        f"[Qdrant] upserted {sum(counts)} points in {len(counts)} batches. "
+        f"collection: {collection_name}"
+    )
+    return sum(counts)
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import VectorParams
+
+from ..config import settings
+from ..logger import logger
+from .sqlite_vec_store import SqliteVecStore
+
+
+async def sync_from_qdrant(
+    store: SqliteVecStore,
+    client: AsyncQdrantClient,
+    collection_name: str,
+    batch_size: int = 1024,
+) -> int:
+    """
+    Qdrant 컬렉션의 포인트를 scroll로 순회하며 sqlite-vec 저장소에 같은 id로 upsert.
+
+    적재 경로(upsert_vectors 등)는 Qdrant에만 쓰므로 VECTOR_BACKEND=sqlite_vec 배포는
+    이 동기화로 노드 로컬 DB를 채운다. 같은 id로 덮어쓰므로 반복 실행해도 안전하다.
+    """
+    synced: int = 0
+    offset: Optional[str] = None
+
+    while True:
+        points, offset = await client.scroll(
+            collection_name=collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        if points:
+            synced += await store.upsert(
+                collection_name,
+                vectors=[point.vector for point in points],
+                payloads=[point.payload or {} for point in points],
+                ids=[str(point.id) for point in points],
+            )
+            logger.info(
+                f"[VectorSync] {synced} points synced. collection: {collection_name}"
+            )
+        if offset is None:
+            break
+
+    return synced
+
+
+async def collection_dim(client: AsyncQdrantClient, collection_name: str) -> int:
+    """원본 Qdrant 컬렉션의 벡터 차원. sqlite-vec 테이블을 같은 차원으로 만들기 위해 사용"""
+    info = await client.get_collection(collection_name)
+    vectors = info.config.params.vectors
+    if not isinstance(vectors, VectorParams):
+        raise ValueError(f"named vectors are not supported. name: {collection_name}")
+    return vectors.size
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Qdrant 컬렉션을 sqlite-vec 저장소로 동기화"
+    )
+    parser.add_argument("collection")
+    parser.add_argument("--db", default=settings.SQLITE_VEC_PATH)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    cli_args = parser.parse_args()
+
+    client = AsyncQdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)
+    store: Optional[SqliteVecStore] = None
+    try:
+        # 서빙은 인코더 차원으로 같은 DB를 열므로, 기존 테이블과 차원이 다르면 ensure_collection에서 실패
+        store = SqliteVecStore(
+            db_path=cli_args.db, dim=await collection_dim(client, cli_args.collection)
+        )
+        await store.open()
+        await store.ensure_collection(cli_args.collection)
+        total: int = await sync_from_qdrant(
+            store, client, cli_args.collection, batch_size=cli_args.batch_size
+        )
+        logger.info(f"[VectorSync] done. {total} points synced.")
+    finally:
+        await client.close()
+        if store is not None:
+            await store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
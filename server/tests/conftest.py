@@ -0,0 +1,4 @@
+import os
+
+# server.config는 APP_ENV가 없으면 import 시점에 실패함
+os.environ.setdefault("APP_ENV", "local")
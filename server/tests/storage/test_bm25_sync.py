@@ -0,0 +1,58 @@
+import asyncio
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from engine.retrieval.bm25 import BM25Index
+from server.storage.bm25_sync import build_from_qdrant
+from server.storage.vector_ingest import upsert_points
+
+DOCS = [
+    {"content": "서대문구 래미안 아파트 전세"},
+    {"content": "마포구 원룸 월세"},
+    {"content": "서대문구 빌라 매매"},
+]
+
+
+class _BatchTokenizer:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def __call__(self, text: str) -> list[str]:
+        return text.split()
+
+    def tokenize_batch(self, texts) -> list[list[str]]:
+        texts = list(texts)
+        self.batches.append(len(texts))
+        return [text.split() for text in texts]
+
+
+def test_build_from_qdrant_indexes_every_payload(tmp_path):
+    """Qdrant의 모든 payload가 배치 토크나이즈를 거쳐 색인되고 저장 후 다시 불러와도 검색되어야 함"""
+    tokenizer = _BatchTokenizer()
+    index = BM25Index(tokenizer=tokenizer)
+
+    async def scenario():
+        client = AsyncQdrantClient(":memory:")
+        try:
+            await client.create_collection(
+                "documents",
+                vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+            )
+            await upsert_points(
+                client, "documents", [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]], DOCS
+            )
+            return await build_from_qdrant(index, client, "documents", batch_size=2)
+        finally:
+            await client.close()
+
+    assert asyncio.run(scenario()) == 3
+    assert len(index) == 3
+    assert tokenizer.batches == [2, 1]
+
+    path = str(tmp_path / "bm25")
+    index.save(path)
+    loaded = BM25Index.load(path, tokenizer=str.split)
+    assert [p["content"] for p, _ in loaded.search("서대문구 래미안", limit=1)] == [
+        "서대문구 래미안 아파트 전세"
+    ]
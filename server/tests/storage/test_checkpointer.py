@@ -0,0 +1,113 @@
+import asyncio
+
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+from sqlalchemy import func, select
+
+from server.storage.checkpointer import blobs_table, open_checkpointer
+
+
+async def _put(saver, config, checkpoint, values: dict, changed: list[str]):
+    checkpoint = create_checkpoint(checkpoint, None, len(changed))
+    checkpoint["channel_values"] = values
+    new_versions = {
+        key: saver.get_next_version(checkpoint["channel_versions"].get(key), None)
+        for key in changed
+    }
+    checkpoint["channel_versions"].update(new_versions)
+    config = await saver.aput(config, checkpoint, {"step": len(changed)}, new_versions)
+    return config, checkpoint
+
+
+def test_sqlite_stores_unchanged_channels_by_reference(tmp_path):
+    """변경되지 않은 채널은 다시 쓰지 않고 이전 버전의 blob을 참조해 복원해야 함"""
+
+    async def run():
+        async with open_checkpointer(
+            "sqlite", sqlite_path=str(tmp_path / "checkpoints.db")
+        ) as saver:
+            config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+            history = ["질문"] * 200
+            config, checkpoint = await _put(
+                saver,
+                config,
+                empty_checkpoint(),
+                {"messages": history, "answer": "a1"},
+                ["messages", "answer"],
+            )
+            first_bytes = saver.last_put_bytes
+            config, checkpoint = await _put(
+                saver,
+                config,
+                checkpoint,
+                {"messages": history, "answer": "a2"},
+                ["answer"],
+            )
+            second_bytes = saver.last_put_bytes
+
+            latest = await saver.aget_tuple(
+                {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+            )
+            listed = [t async for t in saver.alist(None, filter={"step": 1}, limit=5)]
+            async with saver.engine.connect() as conn:
+                blobs = (
+                    await conn.execute(select(func.count()).select_from(blobs_table))
+                ).scalar_one()
+            return first_bytes, second_bytes, latest, listed, blobs
+
+    first_bytes, second_bytes, latest, listed, blobs = asyncio.run(run())
+
+    assert blobs == 3
+    assert second_bytes < first_bytes
+    assert latest.checkpoint["channel_values"] == {
+        "messages": ["질문"] * 200,
+        "answer": "a2",
+    }
+    assert [t.metadata["step"] for t in listed] == [1]
+
+
+def test_sqlite_migrates_legacy_async_sqlite_saver_threads(tmp_path):
+    """기존 AsyncSqliteSaver 테이블의 스레드는 업그레이드 후에도 그대로 조회되어야 함"""
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    path = str(tmp_path / "checkpoints.db")
+
+    async def run():
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        async with aiosqlite.connect(path) as conn:
+            legacy = AsyncSqliteSaver(conn)
+            await legacy.setup()
+            config, checkpoint = await _put(
+                legacy, config, empty_checkpoint(), {"answer": "a1"}, ["answer"]
+            )
+            config, checkpoint = await _put(
+                legacy,
+                config,
+                checkpoint,
+                {"answer": "a2", "messages": ["질문"]},
+                ["answer", "messages"],
+            )
+            await legacy.aput_writes(config, [("answer", "a3")], "task-1")
+
+        for _ in range(2):
+            async with open_checkpointer("sqlite", sqlite_path=path) as saver:
+                latest = await saver.aget_tuple(
+                    {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+                )
+                history = [
+                    t async for t in saver.alist({"configurable": {"thread_id": "t1"}})
+                ]
+        return config, latest, history
+
+    config, latest, history = asyncio.run(run())
+
+    assert latest.config["configurable"]["checkpoint_id"] == (
+        config["configurable"]["checkpoint_id"]
+    )
+    assert latest.checkpoint["channel_values"] == {
+        "answer": "a2",
+        "messages": ["질문"],
+    }
+    assert latest.pending_writes == [("task-1", "answer", "a3")]
+    assert len(history) == 2
+    assert history[0].parent_config == history[1].config
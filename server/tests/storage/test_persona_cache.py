@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+
+from server.storage.persona_cache import INVALIDATION_CHANNEL, PersonaCache
+
+
+def test_get_reads_through_once_and_caches_empty_persona():
+    """없는 사용자도 빈 dict로 캐시해 두 번째 조회는 DB를 읽지 않아야 함"""
+    cache = PersonaCache()
+    loader = AsyncMock(return_value=None)
+
+    async def run():
+        return await cache.get("u1", loader), await cache.get("u1", loader)
+
+    assert asyncio.run(run()) == ({}, {})
+    loader.assert_awaited_once_with("u1")
+
+
+def test_get_does_not_overwrite_newer_value_written_by_update():
+    """DB 조회 중 워커가 update()로 넣은 값이 있으면 조회한 이전 값으로 덮어쓰지 않아야 함"""
+    fresh = {"location": "서초구"}
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(side_effect=[None, orjson.dumps(fresh)])
+    redis_client.set = AsyncMock(return_value=None)
+    cache = PersonaCache(redis_client=redis_client)
+    loader = AsyncMock(return_value={"location": "강남구"})
+
+    persona = asyncio.run(cache.get("u1", loader))
+
+    assert persona == fresh
+    assert redis_client.set.await_args.kwargs["nx"] is True
+    assert cache.cache.local.get(cache.cache.key("u1")) == fresh
+
+
+def test_update_sets_value_and_publishes_invalidation():
+    redis_client = MagicMock()
+    redis_client.set = AsyncMock(return_value=True)
+    redis_client.publish = AsyncMock()
+    cache = PersonaCache(redis_client=redis_client)
+
+    asyncio.run(cache.update({"u1": {"budget": "10억"}}))
+
+    redis_client.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, '["u1"]')
+    assert cache.cache.local.get(cache.cache.key("u1")) == {"budget": "10억"}
+
+
+class _PubSub:
+    def __init__(self, messages: list[dict], error: Exception | None = None):
+        self.messages = messages
+        self.error = error
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+
+def _listening_cache(pubsub: _PubSub) -> PersonaCache:
+    redis_client = MagicMock()
+    redis_client.pubsub.return_value = pubsub
+    cache = PersonaCache(redis_client=redis_client)
+    cache.cache.local.set(cache.cache.key("u1"), {"location": "마포구"})
+    cache.cache.local.set(cache.cache.key("u2"), {"location": "용산구"})
+    return cache
+
+
+def _listen_briefly(cache: PersonaCache) -> None:
+    async def run():
+        task = asyncio.create_task(cache.listen(retry_delay=10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+
+def test_invalidation_message_clears_only_local_entries():
+    cache = _listening_cache(
+        _PubSub([{"type": "subscribe"}, {"type": "message", "data": '["u1"]'}])
+    )
+
+    _listen_briefly(cache)
+
+    assert cache.cache.local.get(cache.cache.key("u1")) is None
+    assert cache.cache.local.get(cache.cache.key("u2")) == {"location": "용산구"}
+
+
+def test_subscription_loss_clears_local_cache():
+    """구독이 끊긴 동안의 무효화를 놓칠 수 있으므로 로컬 캐시 전체를 비워야 함"""
+    cache = _listening_cache(_PubSub([], error=ConnectionError("lost")))
+
+    _listen_briefly(cache)
+
+    assert cache.cache.local.get(cache.cache.key("u1")) is None
+    assert cache.cache.local.get(cache.cache.key("u2")) is None
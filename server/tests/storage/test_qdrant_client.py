@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from server.storage import qdrant_client as qdrant
+from server.storage.qdrant_client import VectorQuery, search_similar_docs_batch
+from server.storage.vector_ingest import upsert_points
+
+
+async def _memory_client() -> AsyncQdrantClient:
+    client = AsyncQdrantClient(":memory:")
+    for name in ("documents", "listings"):
+        await client.create_collection(
+            name, vectors_config=VectorParams(size=2, distance=Distance.COSINE)
+        )
+        await upsert_points(
+            client,
+            name,
+            [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+            [
+                {"collection": name, "i": 0, "user_id": "u1"},
+                {"collection": name, "i": 1, "user_id": "u2"},
+                {"collection": name, "i": 2, "user_id": "u1"},
+            ],
+        )
+    return client
+
+
+def test_batch_search_groups_by_collection_and_keeps_input_order():
+    """컬렉션별로 query_batch_points를 한 번씩만 호출하고 결과는 입력 순서를 유지해야 함"""
+
+    async def run():
+        client = await _memory_client()
+        client.query_batch_points = AsyncMock(wraps=client.query_batch_points)
+        with patch.object(qdrant, "qdrant_client", client):
+            results = await search_similar_docs_batch(
+                [
+                    VectorQuery("documents", [1.0, 0.0], limit=1),
+                    VectorQuery(
+                        "listings", [0.0, 1.0], limit=2, filters={"user_id": "u1"}
+                    ),
+                    VectorQuery("documents", [0.0, 1.0], limit=1),
+                ]
+            )
+        await client.close()
+        return results, client.query_batch_points.await_args_list
+
+    results, calls = asyncio.run(run())
+
+    assert sorted(c.kwargs["collection_name"] for c in calls) == [
+        "documents",
+        "listings",
+    ]
+    assert [
+        len(c.kwargs["requests"])
+        for c in calls
+        if c.kwargs["collection_name"] == "documents"
+    ] == [2]
+    assert results[0] == [{"collection": "documents", "i": 0, "user_id": "u1"}]
+    assert [p["i"] for p in results[1]] == [2, 0]
+    assert all(p["collection"] == "listings" for p in results[1])
+    assert results[2] == [{"collection": "documents", "i": 1, "user_id": "u2"}]
+
+
+def test_batch_search_keeps_overlap_and_returns_distinct_objects():
+    """쿼리 간에 겹치는 포인트는 각 쿼리 결과에 남기고(RRF가 합침), 결과는 서로 독립된 객체여야 함"""
+    client = MagicMock()
+    client.query_batch_points = AsyncMock(
+        side_effect=lambda collection_name, requests: [
+            MagicMock(points=[MagicMock(id="p1", payload={"content": "a"})])
+            for _ in requests
+        ]
+    )
+
+    with patch.object(qdrant, "qdrant_client", client):
+        results = asyncio.run(
+            search_similar_docs_batch(
+                [VectorQuery("documents", [1.0]), VectorQuery("documents", [0.5])]
+            )
+        )
+
+    assert results == [[{"content": "a"}], [{"content": "a"}]]
+    results[0][0]["content"] = "changed"
+    assert results[1][0] == {"content": "a"}
+    client.query_batch_points.assert_awaited_once()
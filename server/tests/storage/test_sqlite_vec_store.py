@@ -0,0 +1,120 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+pytest.importorskip("sqlite_vec")
+pytestmark = pytest.mark.skipif(
+    not hasattr(sqlite3.Connection, "enable_load_extension"),
+    reason="sqlite3 is built without loadable extension support",
+)
+
+from server.storage.sqlite_vec_store import SqliteVecStore
+
+VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]]
+PAYLOADS = [{"content": "a"}, {"content": "b"}, {"content": "c"}]
+
+
+def _run(tmp_path, scenario):
+    async def main():
+        store = SqliteVecStore(db_path=str(tmp_path / "vectors.db"), dim=3)
+        await store.open()
+        try:
+            return await scenario(store)
+        finally:
+            await store.close()
+
+    return asyncio.run(main())
+
+
+def test_upsert_with_same_ids_is_idempotent(tmp_path):
+    async def scenario(store):
+        await store.upsert("documents", VECTORS, PAYLOADS)
+        await store.upsert("documents", VECTORS, PAYLOADS)
+        await store.upsert(
+            "documents", [[0.0, 0.0, 1.0]], [{"content": "a2"}], ids=["fixed"]
+        )
+        await store.upsert(
+            "documents", [[0.0, 0.0, 1.0]], [{"content": "a3"}], ids=["fixed"]
+        )
+        async with store.conn.execute("SELECT COUNT(*) FROM documents_points") as cur:
+            (points,) = await cur.fetchone()
+        async with store.conn.execute("SELECT COUNT(*) FROM documents_vec") as cur:
+            (vectors,) = await cur.fetchone()
+        return points, vectors, await store.search("documents", [0.0, 0.0, 1.0], 1)
+
+    points, vectors, top = _run(tmp_path, scenario)
+
+    assert points == vectors == 4
+    assert top == [{"content": "a3"}]
+
+
+def test_search_returns_nearest_first(tmp_path):
+    async def scenario(store):
+        await store.upsert("documents", VECTORS, PAYLOADS)
+        return await store.search("documents", [1.0, 0.1, 0.0], limit=3)
+
+    results = _run(tmp_path, scenario)
+
+    assert [r["content"] for r in results] == ["a", "c", "b"]
+
+
+@pytest.mark.parametrize("name", ["documents; DROP TABLE x", "1docs", "docs-v2", ""])
+def test_invalid_collection_name_is_rejected(tmp_path, name):
+    async def scenario(store):
+        with pytest.raises(ValueError):
+            await store.ensure_collection(name)
+
+    _run(tmp_path, scenario)
+
+
+def test_existing_table_with_other_dim_is_rejected(tmp_path):
+    """다른 차원으로 만든 vec0 테이블을 열면 조용히 쓰지 않고 실패해야 함"""
+    _run(tmp_path, lambda store: store.upsert("documents", VECTORS, PAYLOADS))
+
+    async def main():
+        store = SqliteVecStore(db_path=str(tmp_path / "vectors.db"), dim=4)
+        await store.open()
+        try:
+            with pytest.raises(ValueError, match="dimension mismatch"):
+                await store.ensure_collection("documents")
+        finally:
+            await store.close()
+
+    asyncio.run(main())
+
+
+def test_sync_uses_source_collection_dim(tmp_path):
+    """동기화는 원본 Qdrant 컬렉션의 차원으로 테이블을 만들고 모든 포인트를 옮겨야 함"""
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.models import Distance, VectorParams
+
+    from server.storage.vector_ingest import upsert_points
+    from server.storage.vector_sync import collection_dim, sync_from_qdrant
+
+    async def main():
+        client = AsyncQdrantClient(":memory:")
+        await client.create_collection(
+            "documents", vectors_config=VectorParams(size=3, distance=Distance.COSINE)
+        )
+        await upsert_points(client, "documents", VECTORS, PAYLOADS)
+        store = SqliteVecStore(
+            db_path=str(tmp_path / "vectors.db"),
+            dim=await collection_dim(client, "documents"),
+        )
+        await store.open()
+        try:
+            synced = await sync_from_qdrant(store, client, "documents", batch_size=2)
+            return (
+                store.dim,
+                synced,
+                await store.search("documents", [1.0, 0.1, 0.0], 1),
+            )
+        finally:
+            await store.close()
+            await client.close()
+
+    dim, synced, top = asyncio.run(main())
+
+    assert (dim, synced) == (3, 3)
+    assert top == [{"content": "a"}]
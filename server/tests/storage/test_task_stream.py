@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from server.storage.task_stream import TaskStream
+from worker.writer import PersonaBatchWriter
+
+
+def _stream(redis_client, consumer: str, **kwargs) -> TaskStream:
+    return TaskStream(
+        redis_client,
+        stream="tasks",
+        group="extractors",
+        consumer=consumer,
+        **kwargs,
+    )
+
+
+def _run(scenario):
+    async def main():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        try:
+            return await scenario(redis_client)
+        finally:
+            await redis_client.aclose()
+
+    return asyncio.run(main())
+
+
+def test_malformed_entry_decodes_to_empty_task():
+    """디코딩할 수 없는 항목 하나 때문에 배치 전체가 실패하지 않아야 함"""
+
+    async def scenario(redis_client):
+        stream = _stream(redis_client, "c1")
+        await stream.ensure_group()
+        await redis_client.xadd("tasks", {"data": "{broken"})
+        await stream.push({"user_id": "u1", "text": "마포구 전세"})
+        return await stream.read(count=10, max_wait=0.01, block_ms=10)
+
+    entries = _run(scenario)
+
+    assert [task for _, task in entries] == [
+        {},
+        {"user_id": "u1", "text": "마포구 전세"},
+    ]
+
+
+def test_read_reclaims_stuck_entries_from_other_consumers():
+    async def scenario(redis_client):
+        crashed = _stream(redis_client, "crashed", claim_idle_ms=0)
+        alive = _stream(redis_client, "alive", claim_idle_ms=0)
+        await crashed.ensure_group()
+        await crashed.push({"user_id": "u1", "text": "a"})
+        first = await crashed.read(count=10, max_wait=0.01, block_ms=10)
+        await asyncio.sleep(0.01)
+        reclaimed = await alive.read(count=10, max_wait=0.01, block_ms=10)
+        return first, reclaimed
+
+    first, reclaimed = _run(scenario)
+
+    assert [entry_id for entry_id, _ in reclaimed] == [first[0][0]]
+
+
+def test_entries_over_max_deliveries_are_dead_lettered():
+    async def scenario(redis_client):
+        stream = _stream(redis_client, "c1", claim_idle_ms=0, max_deliveries=2)
+        await stream.ensure_group()
+        await stream.push({"user_id": "u1", "text": "a"})
+        for _ in range(3):
+            await stream.read(count=10, max_wait=0.01, block_ms=10)
+            await asyncio.sleep(0.01)
+        dead = await redis_client.xrange(stream.dead_stream)
+        return dead, await stream.metrics()
+
+    dead, metrics = _run(scenario)
+
+    assert len(dead) == 1
+    assert dead[0][1]["source_id"]
+    assert metrics["pending"] == 0
+
+
+def test_entries_are_acked_only_after_commit():
+    """쓰기 버퍼가 커밋한 뒤에만 항목이 ack되어야 함"""
+
+    async def scenario(redis_client):
+        stream = _stream(redis_client, "c1")
+        await stream.ensure_group()
+        await stream.push({"user_id": "u1", "text": "a"})
+        entries = await stream.read(count=10, max_wait=0.01, block_ms=10)
+
+        flush_fn_calls: list[dict] = []
+
+        async def flush_fn(personas):
+            flush_fn_calls.append(personas)
+
+        writer = PersonaBatchWriter(
+            flush_fn=flush_fn, flush_interval=60, on_commit=stream.ack
+        )
+        await writer.add({"u1": {"location": "마포구"}}, [e for e, _ in entries])
+        before = await stream.metrics()
+        await writer.flush()
+        after = await stream.metrics()
+        return flush_fn_calls, before, after
+
+    calls, before, after = _run(scenario)
+
+    assert calls == [{"u1": {"location": "마포구"}}]
+    assert before["pending"] == 1
+    assert after["pending"] == 0
+
+
+def test_metrics_reports_lag_and_handles_missing_stream():
+    async def scenario(redis_client):
+        stream = _stream(redis_client, "c1")
+        missing = await stream.metrics()
+        await stream.ensure_group()
+        await stream.push({"user_id": "u1", "text": "a"})
+        await stream.push({"user_id": "u2", "text": "b"})
+        return missing, await stream.metrics()
+
+    missing, metrics = _run(scenario)
+
+    assert missing["length"] == 0 and missing["consumers"] == 0
+    assert metrics["length"] == 2
+    assert metrics["lag"] == 2
+    assert metrics["pending"] == 0
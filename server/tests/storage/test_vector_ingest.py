@@ -0,0 +1,45 @@
+import asyncio
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from server.storage.vector_ingest import point_id, upsert_points
+
+
+def test_reingest_overwrites_same_points():
+    """같은 청크를 두 번 적재해도 포인트 수는 그대로이고 id는 내용 해시로 고정되어야 함"""
+    payloads = [{"chunk": f"doc-{i}", "text": f"본문 {i}"} for i in range(5)]
+    vectors = [[float(i), 1.0] for i in range(5)]
+
+    async def scenario():
+        client = AsyncQdrantClient(":memory:")
+        try:
+            await client.create_collection(
+                "documents",
+                vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+            )
+            counts = []
+            ids = []
+            for _ in range(2):
+                await upsert_points(
+                    client,
+                    "documents",
+                    vectors,
+                    payloads,
+                    id_field="chunk",
+                    batch_size=2,
+                )
+                counts.append((await client.count("documents")).count)
+                points, _ = await client.scroll("documents", limit=10)
+                ids.append(sorted(str(point.id) for point in points))
+            return counts, ids
+        finally:
+            await client.close()
+
+    counts, ids = asyncio.run(scenario())
+
+    assert counts == [5, 5]
+    assert ids[0] == ids[1]
+    assert ids[0] == sorted(point_id(p["chunk"]) for p in payloads)
+    assert point_id("doc-0") == point_id("doc-0")
+    assert point_id({"a": 1, "b": 2}) == point_id({"b": 2, "a": 1})
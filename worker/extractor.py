@@ -1,11 +1,63 @@
+from pathlib import Path
+from typing import Literal, Optional
+
 from gliner import GLiNER
+import onnxruntime as ort
 import torch
 
+ONNX_MODEL_FILE: str = "model.onnx"
+ONNX_QUANTIZED_MODEL_FILE: str = "model_quantized.onnx"
+
+
+def export_onnx(model_name: str, export_dir: str, quantize: bool = True) -> Path:
+    """GLiNER를 ONNX로 내보내고(quantize=True면 int8 동적 양자화본도 생성) 로드할 모델 파일 경로를 반환"""
+    model = GLiNER.from_pretrained(model_name)
+    # ONNX 로더도 gliner_config.json, 토크나이저, 가중치 파일의 존재를 요구함
+    model.save_pretrained(export_dir, safe_serialization=True)
+    paths = model.export_to_onnx(
+        export_dir,
+        onnx_filename=ONNX_MODEL_FILE,
+        quantized_filename=ONNX_QUANTIZED_MODEL_FILE,
+        quantize=quantize,
+    )
+    return Path(paths["quantized_path"] or paths["onnx_path"])
+
+
+def session_options(
+    intra_op_threads: Optional[int] = None, inter_op_threads: int = 1
+) -> ort.SessionOptions:
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # 단일 모델 순차 실행이므로 inter-op 병렬화보다 intra-op 스레드에 코어를 몰아주는 편이 빠름
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.inter_op_num_threads = inter_op_threads
+    if intra_op_threads:
+        options.intra_op_num_threads = intra_op_threads
+    return options
+
 
 class PersonaExtractor:
-    def __init__(self, model_name: str = "urchade/gliner_multi-v2.1"):
+    def __init__(
+        self,
+        model_name: str = "urchade/gliner_multi-v2.1",
+        backend: Literal["torch", "onnx"] = "torch",
+        onnx_dir: Optional[str] = None,
+        quantize: bool = True,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+    ):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.model = GLiNER.from_pretrained(model_name).to(self.device)
+        self.backend = backend
+
+        if backend == "onnx":
+            self.model = self._load_onnx(
+                model_name,
+                Path(onnx_dir or f"models/{model_name.replace('/', '--')}-onnx"),
+                quantize,
+                session_options(intra_op_threads, inter_op_threads),
+            )
+        else:
+            self.model = GLiNER.from_pretrained(model_name).to(self.device)
 
         self.labels = [
             "location",
@@ -15,9 +67,34 @@ class PersonaExtractor:
             "building_age",
         ]
 
+    @staticmethod
+    def _load_onnx(
+        model_name: str, onnx_dir: Path, quantize: bool, options: ort.SessionOptions
+    ) -> GLiNER:
+        model_file: str = ONNX_QUANTIZED_MODEL_FILE if quantize else ONNX_MODEL_FILE
+        if not (onnx_dir / model_file).exists():
+            # 최초 1회만 내보내고 이후에는 PyTorch 가중치 로드 없이 ONNX 세션만 생성
+            export_onnx(model_name, str(onnx_dir), quantize=quantize)
+
+        return GLiNER.from_pretrained(
+            str(onnx_dir),
+            load_onnx_model=True,
+            load_tokenizer=True,
+            onnx_model_file=model_file,
+            session_options=options,
+            local_files_only=True,
+        )
+
     def extract(self, text: str) -> dict:
-        entities = self.model.predict_entities(text, self.labels)
+        return self.extract_batch([text])[0]
+
+    def extract_batch(self, texts: list[str]) -> list[dict]:
+        # 텍스트별 predict_entities 대신 한 번의 배치 forward로 처리
+        batch_entities = self.model.batch_predict_entities(texts, self.labels)
+        return [self._to_persona(entities) for entities in batch_entities]
 
+    @staticmethod
+    def _to_persona(entities: list[dict]) -> dict:
         result = {}
         for entity in entities:
             label = entity["label"]
@@ -1,2 +1,65 @@
-if __name__ == "__main__":  # todo
-    pass
+import asyncio
+
+from server.config import settings
+from server.logger import logger
+from server.storage.redis_client import redis_client, task_stream
+from server.storage.postgresql_client import upsert_personas
+from server.storage.persona_cache import PersonaCache
+from worker.extractor import PersonaExtractor
+from worker.runtime import BatchWorker
+from worker.writer import PersonaBatchWriter
+
+METRICS_INTERVAL_SEC: float = 30.0
+
+
+async def report_metrics() -> None:
+    while True:
+        await asyncio.sleep(METRICS_INTERVAL_SEC)
+        try:
+            logger.info(f"[Worker] task stream metrics: {await task_stream.metrics()}")
+        except Exception as e:
+            logger.warning(f"[Worker] metrics failed. error: {str(e)}")
+
+
+async def main() -> None:
+    await task_stream.ensure_group()
+
+    persona_cache = PersonaCache(
+        redis_client=redis_client,
+        maxsize=settings.PERSONA_CACHE_MAXSIZE,
+        ttl=settings.PERSONA_CACHE_TTL_SEC,
+    )
+
+    async def flush(personas: dict[str, dict]) -> None:
+        # 커밋된 병합 결과로 캐시를 갱신해 API가 DB를 다시 조회하지 않도록 함
+        await persona_cache.update(await upsert_personas(personas))
+
+    async with PersonaBatchWriter(
+        flush_fn=flush,
+        max_rows=settings.PERSONA_FLUSH_ROWS,
+        flush_interval=settings.PERSONA_FLUSH_INTERVAL_MS / 1000,
+        max_pending=settings.PERSONA_MAX_PENDING,
+        on_commit=task_stream.ack,
+    ) as writer:
+        worker = BatchWorker(
+            extractor=PersonaExtractor(
+                backend=settings.PERSONA_BACKEND,
+                onnx_dir=settings.PERSONA_ONNX_DIR,
+                quantize=settings.PERSONA_ONNX_QUANTIZE,
+                intra_op_threads=settings.PERSONA_INTRA_OP_THREADS,
+                inter_op_threads=settings.PERSONA_INTER_OP_THREADS,
+            ),
+            pop_fn=task_stream.read,
+            write_fn=writer.add,
+            batch_size=settings.WORKER_BATCH_SIZE,
+            max_wait=settings.WORKER_BATCH_WAIT_MS / 1000,
+        )
+        metrics_task = asyncio.create_task(report_metrics())
+        try:
+            await worker.run()
+        finally:
+            metrics_task.cancel()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
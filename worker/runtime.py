@@ -0,0 +1,87 @@
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import time
+
+from server.logger import logger
+
+TaskEntry = tuple[str, dict]
+PopFn = Callable[[int, float], Awaitable[list[TaskEntry]]]
+WriteFn = Callable[[dict[str, dict], list[str]], Awaitable[None]]
+
+
+class BatchWorker:
+    """
+    작업 스트림을 마이크로 배치 단위로 소비하는 워커 런타임.
+
+    batch_size개가 모이거나 max_wait초가 지나면 배치를 닫고, PersonaExtractor.extract_batch로 한 번에 추론한 뒤
+    사용자별로 병합한 페르소나를 배치의 항목 id와 함께 write_fn에 넘긴다. ack는 저장이 커밋된 뒤 write_fn 쪽에서 한다.
+    """
+
+    def __init__(
+        self,
+        extractor: Any,
+        pop_fn: PopFn,
+        write_fn: WriteFn,
+        batch_size: int = 32,
+        max_wait: float = 0.05,
+    ) -> None:
+        self.extractor = extractor
+        self.pop_fn = pop_fn
+        self.write_fn = write_fn
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+    async def run(self) -> None:
+        logger.info(
+            f"[Worker] started. batch_size: {self.batch_size}, max_wait: {self.max_wait}s"
+        )
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Worker] batch failed. error: {str(e)}")
+
+    async def run_once(self) -> int:
+        entries: list[TaskEntry] = await self.pop_fn(self.batch_size, self.max_wait)
+        if not entries:
+            return 0
+
+        # 잘못된 항목도 재전달되지 않도록 id는 함께 넘겨 ack 대상에 포함
+        entry_ids: list[str] = [entry_id for entry_id, _ in entries]
+        tasks: list[dict] = [task for _, task in entries if self._is_valid(task)]
+        if not tasks:
+            await self.write_fn({}, entry_ids)
+            return 0
+
+        started: float = time.perf_counter()
+        # GLiNER 추론은 CPU 바운드이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        results: list[dict] = await asyncio.to_thread(
+            self.extractor.extract_batch, [task["text"] for task in tasks]
+        )
+
+        personas: dict[str, dict] = self._merge(tasks, results)
+        await self.write_fn(personas, entry_ids)
+
+        logger.info(
+            f"[Worker] processed {len(tasks)} tasks for {len(personas)} users "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return len(tasks)
+
+    @staticmethod
+    def _merge(tasks: list[dict], results: list[dict]) -> dict[str, dict]:
+        # 같은 배치 안의 동일 사용자 결과는 큐 순서대로 덮어써 JSONB `||` 병합과 같은 의미를 유지
+        personas: dict[str, dict] = {}
+        for task, result in zip(tasks, results):
+            if result:
+                personas.setdefault(task["user_id"], {}).update(result)
+        return personas
+
+    @staticmethod
+    def _is_valid(task: Optional[dict]) -> bool:
+        if isinstance(task, dict) and task.get("user_id") and task.get("text"):
+            return True
+        logger.warning(f"[Worker] invalid task skipped. task: {task}")
+        return False
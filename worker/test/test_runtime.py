@@ -0,0 +1,67 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from worker.runtime import BatchWorker
+
+
+def _worker(tasks: list[dict], results: list[dict]) -> BatchWorker:
+    extractor = MagicMock()
+    extractor.extract_batch.return_value = results
+    entries = [(f"{i}-0", task) for i, task in enumerate(tasks)]
+    return BatchWorker(
+        extractor=extractor,
+        pop_fn=AsyncMock(return_value=entries),
+        write_fn=AsyncMock(),
+        batch_size=8,
+        max_wait=0.01,
+    )
+
+
+def test_run_once_batches_extraction_and_write():
+    """배치 전체를 한 번의 extract_batch와 한 번의 write로 처리해야 함"""
+    tasks = [
+        {"user_id": "u1", "text": "서대문구 아파트"},
+        {"user_id": "u2", "text": "10억 정도"},
+    ]
+    worker = _worker(tasks, [{"location": "서대문구"}, {"budget": "10억"}])
+
+    processed = asyncio.run(worker.run_once())
+
+    assert processed == 2
+    worker.pop_fn.assert_awaited_once_with(8, 0.01)
+    worker.extractor.extract_batch.assert_called_once_with(
+        ["서대문구 아파트", "10억 정도"]
+    )
+    worker.write_fn.assert_awaited_once_with(
+        {"u1": {"location": "서대문구"}, "u2": {"budget": "10억"}}, ["0-0", "1-0"]
+    )
+
+
+def test_run_once_merges_same_user_in_queue_order():
+    """같은 사용자의 결과는 큐 순서대로 병합되고 빈 결과는 저장하지 않아야 함"""
+    tasks = [
+        {"user_id": "u1", "text": "a"},
+        {"user_id": "u1", "text": "b"},
+        {"user_id": "u2", "text": "c"},
+    ]
+    worker = _worker(
+        tasks,
+        [{"location": "마포구", "budget": "5억"}, {"location": "서대문구"}, {}],
+    )
+
+    asyncio.run(worker.run_once())
+
+    worker.write_fn.assert_awaited_once_with(
+        {"u1": {"location": "서대문구", "budget": "5억"}}, ["0-0", "1-0", "2-0"]
+    )
+
+
+def test_run_once_skips_invalid_tasks():
+    """user_id나 text가 없는 태스크는 추론하지 않고 ack 대상으로만 넘겨야 함"""
+    worker = _worker([{"user_id": "u1"}, {"text": "a"}], [])
+
+    processed = asyncio.run(worker.run_once())
+
+    assert processed == 0
+    worker.extractor.extract_batch.assert_not_called()
+    worker.write_fn.assert_awaited_once_with({}, ["0-0", "1-0"])
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from worker.writer import PersonaBatchWriter
+
+
+def test_flush_merges_updates_per_user():
+    """같은 사용자의 업데이트는 하나의 행으로 병합되어 한 번에 저장되어야 함"""
+    flush_fn = AsyncMock()
+    writer = PersonaBatchWriter(flush_fn=flush_fn)
+
+    async def scenario():
+        await writer.add({"u1": {"location": "마포구", "budget": "5억"}})
+        await writer.add({"u1": {"location": "서대문구"}, "u2": {"budget": "10억"}})
+        return await writer.flush()
+
+    rows = asyncio.run(scenario())
+
+    assert rows == 2
+    flush_fn.assert_awaited_once_with(
+        {"u1": {"location": "서대문구", "budget": "5억"}, "u2": {"budget": "10억"}}
+    )
+    assert writer.pending == 0
+    assert writer.stats.as_dict()["rows_per_commit"] == 2.0
+    assert writer.stats.updates == 3
+
+
+def test_flush_failure_keeps_pending_updates():
+    """flush가 실패하면 배치를 버리지 않고 이후 업데이트와 병합해 보관해야 함"""
+    flush_fn = AsyncMock(side_effect=[RuntimeError("db down"), None])
+    writer = PersonaBatchWriter(flush_fn=flush_fn)
+
+    async def scenario():
+        await writer.add({"u1": {"location": "마포구", "budget": "5억"}})
+        assert await writer.flush() == 0
+        await writer.add({"u1": {"location": "서대문구"}})
+        return await writer.flush()
+
+    rows = asyncio.run(scenario())
+
+    assert rows == 1
+    assert flush_fn.await_args.args[0] == {
+        "u1": {"location": "서대문구", "budget": "5억"}
+    }
+    assert writer.stats.failures == 1
+    assert writer.stats.flushes == 1
+
+
+def test_background_flush_on_size_threshold_and_exit():
+    """max_rows에 도달하면 주기 전에 flush하고, 종료 시 남은 업데이트도 저장해야 함"""
+    flush_fn = AsyncMock()
+
+    async def scenario():
+        async with PersonaBatchWriter(
+            flush_fn=flush_fn, max_rows=2, flush_interval=60
+        ) as writer:
+            await writer.add({"u1": {"a": 1}, "u2": {"b": 2}})
+            await asyncio.sleep(0.01)
+            assert flush_fn.await_count == 1
+            await writer.add({"u3": {"c": 3}})
+
+    asyncio.run(scenario())
+
+    assert flush_fn.await_count == 2
+    assert flush_fn.await_args.args[0] == {"u3": {"c": 3}}
+
+
+def test_ack_only_after_commit():
+    """ack_ids는 flush가 커밋된 뒤에만, 실패 시에는 재시도가 성공한 뒤에 전달되어야 함"""
+    flush_fn = AsyncMock(side_effect=[RuntimeError("db down"), None])
+    on_commit = AsyncMock()
+    writer = PersonaBatchWriter(flush_fn=flush_fn, on_commit=on_commit)
+
+    async def scenario():
+        await writer.add({"u1": {"a": 1}}, ["1-0", "2-0"])
+        await writer.flush()
+        on_commit.assert_not_awaited()
+        await writer.add({}, ["3-0"])
+        await writer.flush()
+
+    asyncio.run(scenario())
+
+    on_commit.assert_awaited_once_with(["1-0", "2-0", "3-0"])
+
+
+def test_ack_without_rows_skips_flush_fn():
+    """저장할 페르소나가 없어도 ack는 전달하되 upsert는 호출하지 않아야 함"""
+    flush_fn = AsyncMock()
+    on_commit = AsyncMock()
+    writer = PersonaBatchWriter(flush_fn=flush_fn, on_commit=on_commit)
+
+    async def scenario():
+        await writer.add({}, ["1-0"])
+        return await writer.flush()
+
+    assert asyncio.run(scenario()) == 0
+    flush_fn.assert_not_awaited()
+    on_commit.assert_awaited_once_with(["1-0"])
+    assert writer.stats.flushes == 0
+
+
+def test_add_blocks_at_max_pending_until_flush_succeeds():
+    """flush가 계속 실패해 max_pending에 도달하면 add()는 flush가 성공할 때까지 대기해야 함"""
+    db_up = asyncio.Event()
+
+    async def flush_fn(batch: dict[str, dict]) -> None:
+        if not db_up.is_set():
+            raise RuntimeError("db down")
+
+    async def scenario():
+        async with PersonaBatchWriter(
+            flush_fn=flush_fn, max_rows=2, flush_interval=0.01, max_pending=2
+        ) as writer:
+            await writer.add({"u1": {"a": 1}, "u2": {"b": 2}})
+            blocked = asyncio.create_task(writer.add({"u3": {"c": 3}}))
+            await asyncio.sleep(0.05)
+            assert not blocked.done()
+            assert writer.pending == 2
+            assert writer.stats.failures > 0
+
+            db_up.set()
+            await asyncio.wait_for(blocked, timeout=1)
+        return writer
+
+    writer = asyncio.run(scenario())
+
+    assert writer.pending == 0
+    assert writer.stats.rows == 3
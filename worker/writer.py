@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Sequence
+import asyncio
+import time
+
+from server.logger import logger
+
+FlushFn = Callable[[dict[str, dict]], Awaitable[None]]
+CommitFn = Callable[[list[str]], Awaitable[Any]]
+
+
+@dataclass
+class WriterStats:
+    flushes: int = 0
+    rows: int = 0
+    updates: int = 0
+    failures: int = 0
+    total_flush_sec: float = 0.0
+    last_flush_sec: float = 0.0
+
+    @property
+    def rows_per_commit(self) -> float:
+        return self.rows / self.flushes if self.flushes else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "flushes": self.flushes,
+            "rows": self.rows,
+            "updates": self.updates,
+            "failures": self.failures,
+            "rows_per_commit": round(self.rows_per_commit, 2),
+            "avg_flush_ms": round(
+                self.total_flush_sec / self.flushes * 1000 if self.flushes else 0.0, 2
+            ),
+            "last_flush_ms": round(self.last_flush_sec * 1000, 2),
+        }
+
+
+class PersonaBatchWriter:
+    """
+    페르소나 업데이트를 user_id별로 메모리에서 병합한 뒤 주기적으로 한 번에 upsert하는 쓰기 버퍼.
+
+    대기 중인 사용자 수가 max_rows에 도달하거나 flush_interval초가 지나면 flush_fn(다중 행 upsert)을 한 번 호출한다.
+    flush가 실패하면 배치를 버퍼에 되돌려 다음 주기에 다시 시도한다.
+    add()에 넘긴 ack_ids는 해당 업데이트가 커밋된 뒤에만 on_commit으로 전달된다.
+    DB 장애로 flush가 계속 실패해 대기 사용자 수가 max_pending(기본 max_rows의 4배)에 도달하면
+    flush가 성공할 때까지 add()가 대기해 상류(스트림 소비)에 backpressure를 건다.
+    """
+
+    def __init__(
+        self,
+        flush_fn: FlushFn,
+        max_rows: int = 256,
+        flush_interval: float = 0.5,
+        on_commit: Optional[CommitFn] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        self.flush_fn = flush_fn
+        self.on_commit = on_commit
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending or max_rows * 4
+        self.stats = WriterStats()
+
+        self._pending: dict[str, dict] = {}
+        self._pending_acks: list[str] = []
+        self._lock = asyncio.Lock()
+        self._full = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "PersonaBatchWriter":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 종료 시 남은 업데이트 저장
+        await self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def add(self, personas: dict[str, dict], ack_ids: Sequence[str] = ()) -> None:
+        while len(self._pending) >= self.max_pending:
+            self._space.clear()
+            self._full.set()
+            await self._space.wait()
+
+        self._pending_acks.extend(ack_ids)
+        for user_id, data in personas.items():
+            # JSONB `||`와 같은 의미로 나중 값이 같은 키를 덮어씀
+            self._pending.setdefault(user_id, {}).update(data)
+            self.stats.updates += 1
+
+        if len(self._pending) >= self.max_rows:
+            self._full.set()
+
+    async def flush(self) -> int:
+        async with self._lock:
+            if not self._pending and not self._pending_acks:
+                return 0
+            batch, self._pending = self._pending, {}
+            acks, self._pending_acks = self._pending_acks, []
+            self._full.clear()
+
+            started: float = time.perf_counter()
+            try:
+                if batch:
+                    await self.flush_fn(batch)
+            except Exception as e:
+                self.stats.failures += 1
+                logger.error(f"[PersonaBatchWriter] flush failed. error: {str(e)}")
+                # 실패한 배치 이후 들어온 업데이트가 우선하도록 병합해서 되돌림
+                for user_id, data in self._pending.items():
+                    batch.setdefault(user_id, {}).update(data)
+                self._pending = batch
+                self._pending_acks = acks + self._pending_acks
+                return 0
+
+            if batch:
+                elapsed: float = time.perf_counter() - started
+                self.stats.flushes += 1
+                self.stats.rows += len(batch)
+                self.stats.total_flush_sec += elapsed
+                self.stats.last_flush_sec = elapsed
+                logger.info(
+                    f"[PersonaBatchWriter] flushed. stats: {self.stats.as_dict()}"
+                )
+            self._space.set()
+
+            if acks and self.on_commit is not None:
+                try:
+                    await self.on_commit(acks)
+                except Exception as e:
+                    # ack에 실패한 항목은 claim_idle 이후 재전달되어 한 번 더 병합될 수 있음
+                    logger.warning(f"[PersonaBatchWriter] ack failed. error: {str(e)}")
+            return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()